@@ -2,17 +2,23 @@
 
 echo -e "Uvicorn server initialization...\n"
 
+# uvloop and httptools replace the pure-Python event loop and HTTP parser with their C implementations.
+# A single worker process is used, as provisioning tasks are tracked in memory and status requests must reach
+# the same process that started them.
+UVICORN_OPTIONS="--host 0.0.0.0 --port 5002 --loop uvloop --http httptools \
+--backlog ${UVICORN_BACKLOG:-2048} --limit-concurrency ${UVICORN_LIMIT_CONCURRENCY:-512}"
+
 if [[ $1 = open_telemetry_activation ]];
 then
     # The following configuration is set for the Dockerfile
     # If you want to test the service locally, change the IP address to 'localhost'
     echo -e "OpenTelemetry activation...\n"
 
-    exec opentelemetry-instrument uvicorn src.main:app --host 0.0.0.0 --port 5002
+    exec opentelemetry-instrument uvicorn src.main:app $UVICORN_OPTIONS
 
 else
     # The following configuration is set for the Dockerfile
     # If you want to test the service locally, change the IP address to 'localhost'
-    exec uvicorn src.main:app --host 0.0.0.0 --port 5002
+    exec uvicorn src.main:app $UVICORN_OPTIONS
 
 fi
@@ -1,7 +1,107 @@
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
+from azure.core.pipeline.transport import AioHttpTransport, RequestsTransport
+from azure.identity import DefaultAzureCredential
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+from azure.mgmt.authorization import AuthorizationManagementClient
+from azure.mgmt.authorization.aio import AuthorizationManagementClient as AsyncAuthorizationManagementClient
+from azure.mgmt.databricks import AzureDatabricksManagementClient
+from azure.mgmt.databricks.aio import AzureDatabricksManagementClient as AsyncAzureDatabricksManagementClient
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from src import settings
+from src.service.clients.azure.azure_graph_client import AzureGraphClient
+from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager
+from src.service.clients.azure.azure_workspace_handler import WorkspaceClientCache, WorkspaceInfoCache
+from src.service.clients.azure.azure_workspace_manager import AzureWorkspaceManager
+from src.service.clients.databricks.account_client import get_account_client
+from src.service.principals_mapping.azure_mapper import AzureMapper
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the Azure clients and the Databricks account client once for the whole lifetime of the application
+    and stores them on `app.state`, together with the caches of the Databricks workspace clients
+    and of the workspace lookups.
+
+    Credential discovery and TLS session setup are expensive, so they're shared among all requests
+    instead of being performed for each of them. For the same reason, the sync Azure Resource Manager clients
+    share their HTTP session, and so do the async ones. The size of the worker thread pool is configured here as well.
+    """
+    # Imported here rather than at module level as it's slow to load, see `AzureGraphClient`
+    from msgraph import GraphServiceClient
+
+    # Blocking work (sync endpoints and dependencies, Databricks SDK calls) runs on the anyio worker threads
+    to_thread.current_default_thread_limiter().total_tokens = settings.misc.thread_pool_size
+
+    # One credential is shared by all the sync clients and one by all the async ones, so that the credential
+    # chain is resolved once and tokens are cached and refreshed in a single place. Async clients get an async
+    # credential, so that acquiring a token doesn't block the event loop.
+    credential = DefaultAzureCredential()
+    async_credential = AsyncDefaultAzureCredential()
+    # The sync Azure Resource Manager clients all call the same host, so they share a single HTTP transport and
+    # its connection pool. It's closed only once the application shuts down
+    arm_transport = RequestsTransport()
+    # Likewise, the async clients share a single aiohttp session, so that they reuse each other's connections
+    async_arm_transport = AioHttpTransport()
+    async_azure_databricks_manager = AsyncAzureDatabricksManagementClient(
+        credential=async_credential,
+        subscription_id=settings.azure.auth.subscription_id,
+        transport=async_arm_transport,
+    )
+    app.state.azure_workspace_manager = AzureWorkspaceManager(
+        sync_azure_databricks_manager=AzureDatabricksManagementClient(
+            credential=credential,  # type:ignore[arg-type]
+            subscription_id=settings.azure.auth.subscription_id,
+            transport=arm_transport,
+        ),
+        async_azure_databricks_manager=async_azure_databricks_manager,
+    )
+    async_auth_client = AsyncAuthorizationManagementClient(
+        credential=async_credential,
+        subscription_id=settings.azure.auth.subscription_id,
+        transport=async_arm_transport,
+    )
+    app.state.azure_permissions_manager = AzurePermissionsManager(
+        AuthorizationManagementClient(
+            credential=credential,  # type:ignore[arg-type]
+            subscription_id=settings.azure.auth.subscription_id,
+            transport=arm_transport,
+        ),
+        async_auth_client=async_auth_client,
+    )
+    app.state.azure_mapper = AzureMapper(
+        AzureGraphClient(
+            GraphServiceClient(
+                credentials=async_credential,
+                scopes=["https://graph.microsoft.com/.default"],
+            )
+        )
+    )
+    app.state.account_client = get_account_client(settings)
+    app.state.workspace_client_cache = WorkspaceClientCache()
+    app.state.workspace_info_cache = WorkspaceInfoCache()
+    try:
+        yield
+    finally:
+        app.state.workspace_client_cache.clear()
+        app.state.workspace_info_cache.clear()
+        # The aio session and the credentials are closed only once the application shuts down
+        await async_azure_databricks_manager.close()
+        await async_auth_client.close()
+        await async_arm_transport.close()
+        await async_credential.close()
+        credential.close()
+        arm_transport.close()
+
 
 app = FastAPI(
     title="Databricks Tech Adapter",
     description="Microservice responsible to handle provisioning and access control requests for one or more data product components.",  # noqa: E501
     version="2.2.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
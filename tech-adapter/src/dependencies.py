@@ -1,27 +1,25 @@
-from typing import Annotated, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Annotated, Any, Dict, Literal, Tuple, Type, Union
 
-import yaml
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.authorization import AuthorizationManagementClient
-from azure.mgmt.databricks import AzureDatabricksManagementClient
-from azure.mgmt.databricks.aio import AzureDatabricksManagementClient as AsyncAzureDatabricksManagementClient
-from fastapi import BackgroundTasks, Depends
-from msgraph import GraphServiceClient
+import msgspec
+from databricks.sdk import AccountClient
+from fastapi import BackgroundTasks, Depends, Request
+from fastapi.exceptions import RequestValidationError as BodyValidationError
+from pydantic import BaseModel
 
-from src import settings
 from src.models.api_models import (
     DescriptorKind,
+    ProvisionInfo,
     ProvisioningRequest,
     RequestValidationError,
+    ReverseProvisioningRequest,
     UpdateAclRequest,
 )
+from src.models.api_structs import ProvisioningRequestBody, ReverseProvisioningRequestBody, UpdateAclRequestBody
 from src.models.data_product_descriptor import DataProduct
-from src.service.clients.azure.azure_graph_client import AzureGraphClient
-from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager
 from src.service.clients.azure.azure_workspace_handler import AzureWorkspaceHandler
-from src.service.clients.azure.azure_workspace_manager import AzureWorkspaceManager
-from src.service.clients.databricks.account_client import get_account_client
-from src.service.principals_mapping.azure_mapper import AzureMapper
 from src.service.provision.handler.dlt_workload_handler import DLTWorkloadHandler
 from src.service.provision.handler.job_workload_handler import JobWorkloadHandler
 from src.service.provision.handler.output_port_handler import OutputPortHandler
@@ -34,10 +32,199 @@ from src.service.reverse_provision.reverse_provision_service import ReverseProvi
 from src.service.reverse_provision.workflow_reverse_provision_handler import WorkflowReverseProvisionHandler
 from src.utility.error_builder import build_request_validation_error
 from src.utility.parsing_pydantic_models import parse_yaml_with_model
+from src.utility.yaml_loader import load_top_level_keys
+
+# The same descriptor is usually received by validate, provision and unprovision in a row. We keep the
+# outcome of the parsing keyed by a digest of the descriptor text, so that the YAML parsing and the Pydantic
+# validation are paid only once per descriptor. Digests are used as keys to avoid retaining large strings.
+_DESCRIPTOR_CACHE_MAX_SIZE = 256
+# Parsed descriptor document tagged with the outcome of the data product validation
+_ParsedDescriptor = Union[
+    Tuple[Any, Literal[True], DataProduct],
+    Tuple[Any, Literal[False], RequestValidationError],
+]
+_descriptor_cache: OrderedDict[bytes, _ParsedDescriptor] = OrderedDict()
+_descriptor_cache_lock = threading.Lock()
+# Digests of descriptors whose data product already passed validation. It outlives the entries of the cache
+# above, so that evicted descriptors can be rebuilt without running the whole validation again.
+_VALIDATED_DESCRIPTORS_MAX_SIZE = 1024
+_validated_descriptors: OrderedDict[bytes, None] = OrderedDict()
+# Only these fields of the descriptor are read, the others aren't loaded at all
+_DESCRIPTOR_KEYS = ("dataProduct", "componentIdToProvision")
+
+
+# Decoders are built once, as building them is far more expensive than reusing them on every request
+_provisioning_request_decoder = msgspec.json.Decoder(ProvisioningRequestBody)
+_update_acl_request_decoder = msgspec.json.Decoder(UpdateAclRequestBody)
+_reverse_provisioning_request_decoder = msgspec.json.Decoder(ReverseProvisioningRequestBody)
+
+
+def json_request_body_openapi(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Builds the OpenAPI `requestBody` of an endpoint whose body is decoded by one of the dependencies below.
+    They read the raw request, so FastAPI can't document the body by itself.
+
+    The schema is generated from the Pydantic `model`, with its nested definitions inlined, as references
+    to them wouldn't resolve inside the OpenAPI document.
+
+    Args:
+        model: The Pydantic model describing the body.
+
+    Returns:
+        The value to pass as `openapi_extra` to the route decorator.
+    """
+    schema = model.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and ref.startswith("#/$defs/"):
+                return inline(definitions[ref.removeprefix("#/$defs/")])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {"requestBody": {"content": {"application/json": {"schema": inline(schema)}}, "required": True}}
+
+
+async def _decode_body(request: Request, decoder: msgspec.json.Decoder):
+    body = await request.body()
+    try:
+        return decoder.decode(body)
+    except msgspec.DecodeError as ex:
+        # Surfaced as FastAPI body validation errors, so that invalid payloads keep being answered with a 422
+        error_type = "value_error" if isinstance(ex, msgspec.ValidationError) else "json_invalid"
+        raise BodyValidationError([{"type": error_type, "loc": ("body",), "msg": str(ex), "input": None}])
+
+
+async def decode_provisioning_request(request: Request) -> ProvisioningRequest:
+    """
+    Decodes the body of the request as a `ProvisioningRequest` through msgspec, which is much faster than the
+    Pydantic validation FastAPI performs on body parameters.
+
+    Raises:
+        fastapi.exceptions.RequestValidationError: If the body is not a valid JSON `ProvisioningRequest`.
+    """
+    body = await _decode_body(request, _provisioning_request_decoder)
+    return ProvisioningRequest.model_construct(
+        descriptorKind=body.descriptorKind, descriptor=body.descriptor, removeData=body.removeData
+    )
+
+
+async def decode_update_acl_request(request: Request) -> UpdateAclRequest:
+    """
+    Decodes the body of the request as an `UpdateAclRequest` through msgspec, which is much faster than the
+    Pydantic validation FastAPI performs on body parameters.
+
+    Raises:
+        fastapi.exceptions.RequestValidationError: If the body is not a valid JSON `UpdateAclRequest`.
+    """
+    body = await _decode_body(request, _update_acl_request_decoder)
+    provision_info = ProvisionInfo.model_construct(request=body.provisionInfo.request, result=body.provisionInfo.result)
+    return UpdateAclRequest.model_construct(refs=body.refs, provisionInfo=provision_info)
+
+
+async def decode_reverse_provisioning_request(request: Request) -> ReverseProvisioningRequest:
+    """
+    Decodes the body of the request as a `ReverseProvisioningRequest` through msgspec, which is much faster than
+    the Pydantic validation FastAPI performs on body parameters.
+
+    Raises:
+        fastapi.exceptions.RequestValidationError: If the body is not a valid JSON `ReverseProvisioningRequest`.
+    """
+    body = await _decode_body(request, _reverse_provisioning_request_decoder)
+    return ReverseProvisioningRequest.model_construct(
+        useCaseTemplateId=body.useCaseTemplateId,
+        environment=body.environment,
+        params=body.params,
+        catalogInfo=body.catalogInfo,
+    )
+
+
+ReverseProvisioningRequestDep = Annotated[ReverseProvisioningRequest, Depends(decode_reverse_provisioning_request)]
+
+
+def _descriptor_digest(descriptor: str) -> bytes:
+    return hashlib.blake2b(descriptor.encode("utf-8"), digest_size=16).digest()
+
+
+def _parse_descriptor(descriptor: str) -> _ParsedDescriptor:
+    """
+    Parses a component descriptor, returning both the raw descriptor dictionary and the parsed data product.
+
+    Results are cached by content digest, as descriptors are immutable once their content is fixed.
+    Parsing errors are raised and never cached.
+
+    Args:
+        descriptor: YAML descriptor containing the `dataProduct` and `componentIdToProvision` fields.
+
+    Returns:
+        A tuple with the descriptor dictionary, a flag telling whether the data product is valid, and either
+        the parsed DataProduct if it is or a RequestValidationError if the data product doesn't satisfy the model.
+    """
+    digest = _descriptor_digest(descriptor)
+    with _descriptor_cache_lock:
+        cached = _descriptor_cache.get(digest)
+        if cached is not None:
+            _descriptor_cache.move_to_end(digest)
+            return cached
+        already_validated = digest in _validated_descriptors
+
+    descriptor_dict: Any = load_top_level_keys(descriptor, _DESCRIPTOR_KEYS)
+    data_product: DataProduct | RequestValidationError
+    if already_validated:
+        data_product = DataProduct.construct_trusted(descriptor_dict["dataProduct"])
+    else:
+        data_product = parse_yaml_with_model(descriptor_dict.get("dataProduct"), DataProduct)
+
+    # The outcome is checked once here and stored with the result, so callers just branch on the flag
+    parsed: _ParsedDescriptor
+    if isinstance(data_product, DataProduct):
+        parsed = (descriptor_dict, True, data_product)
+    else:
+        parsed = (descriptor_dict, False, data_product)
+
+    with _descriptor_cache_lock:
+        _descriptor_cache[digest] = parsed
+        if len(_descriptor_cache) > _DESCRIPTOR_CACHE_MAX_SIZE:
+            _descriptor_cache.popitem(last=False)
+        if parsed[1] and digest not in _validated_descriptors:
+            _validated_descriptors[digest] = None
+            if len(_validated_descriptors) > _VALIDATED_DESCRIPTORS_MAX_SIZE:
+                _validated_descriptors.popitem(last=False)
+    return parsed
+
+
+def clear_descriptor_cache() -> None:
+    """Removes every parsed descriptor stored in the cache, along with the record of validated descriptors."""
+    with _descriptor_cache_lock:
+        _descriptor_cache.clear()
+        _validated_descriptors.clear()
+
+
+_UNABLE_TO_PARSE_DESCRIPTOR = "Unable to parse the descriptor."
+
+
+def _build_descriptor_kind_error(descriptor_kind: DescriptorKind) -> RequestValidationError:
+    error = (
+        "Expecting a COMPONENT_DESCRIPTOR but got a "
+        f"{descriptor_kind} instead; please check with the "
+        f"platform team."
+    )
+    return build_request_validation_error(problems=[error])
+
+
+# The errors returned for unsupported descriptor kinds never change, so they're built only once.
+# They're shared among requests and must not be modified.
+_DESCRIPTOR_KIND_ERRORS: dict[DescriptorKind, RequestValidationError] = {
+    kind: _build_descriptor_kind_error(kind) for kind in DescriptorKind if kind != DescriptorKind.COMPONENT_DESCRIPTOR
+}
 
 
 def unpack_provisioning_request(
-    provisioning_request: ProvisioningRequest,
+    provisioning_request: Annotated[ProvisioningRequest, Depends(decode_provisioning_request)],
 ) -> Tuple[DataProduct, str, bool] | RequestValidationError:
     """
     Unpacks a Provisioning Request.
@@ -63,32 +250,20 @@ def unpack_provisioning_request(
     """  # noqa: E501
 
     if not provisioning_request.descriptorKind == DescriptorKind.COMPONENT_DESCRIPTOR:
-        error = (
-            "Expecting a COMPONENT_DESCRIPTOR but got a "
-            f"{provisioning_request.descriptorKind} instead; please check with the "
-            f"platform team."
-        )
-        return build_request_validation_error(problems=[error])
+        descriptor_kind = provisioning_request.descriptorKind
+        return _DESCRIPTOR_KIND_ERRORS.get(descriptor_kind) or _build_descriptor_kind_error(descriptor_kind)
     try:
-        descriptor_dict = yaml.safe_load(provisioning_request.descriptor)
-        data_product = parse_yaml_with_model(descriptor_dict.get("dataProduct"), DataProduct)
+        parsed = _parse_descriptor(provisioning_request.descriptor)
+        if not parsed[1]:
+            return parsed[2]
+
+        descriptor_dict, _, data_product = parsed
         component_to_provision = descriptor_dict.get("componentIdToProvision")
         remove_data = provisioning_request.removeData if provisioning_request.removeData is not None else False
-
-        if isinstance(data_product, DataProduct):
-            return data_product, component_to_provision, remove_data
-        elif isinstance(data_product, RequestValidationError):
-            return data_product
-
-        else:
-            return build_request_validation_error(
-                problems=[
-                    "An unexpected error occurred while parsing the provisioning request."  # noqa: E501
-                ]
-            )
+        return data_product, component_to_provision, remove_data
 
     except Exception as ex:
-        return build_request_validation_error(problems=["Unable to parse the descriptor.", str(ex)])
+        return build_request_validation_error(problems=[_UNABLE_TO_PARSE_DESCRIPTOR, str(ex)])
 
 
 UnpackedProvisioningRequestDep = Annotated[
@@ -98,7 +273,7 @@ UnpackedProvisioningRequestDep = Annotated[
 
 
 def unpack_update_acl_request(
-    update_acl_request: UpdateAclRequest,
+    update_acl_request: Annotated[UpdateAclRequest, Depends(decode_update_acl_request)],
 ) -> Tuple[DataProduct, str, list[str]] | RequestValidationError:
     """
     Unpacks an Update ACL Request.
@@ -122,27 +297,25 @@ def unpack_update_acl_request(
         in the 'provisionInfo.request' field. It will attempt to parse the YAML and
         return the relevant information. If parsing fails, a `RequestValidationError` will
         be returned.
+        The descriptor is parsed even when `refs` is empty, as an empty list of identities means
+        that the access granted to any previous identity must be revoked.
 
     """  # noqa: E501
 
     try:
-        request = yaml.safe_load(update_acl_request.provisionInfo.request)
-        data_product = parse_yaml_with_model(request.get("dataProduct"), DataProduct)
+        parsed = _parse_descriptor(update_acl_request.provisionInfo.request)
+        if not parsed[1]:
+            return parsed[2]
+
+        request, _, data_product = parsed
         component_to_provision = request.get("componentIdToProvision")
-        if isinstance(data_product, DataProduct):
-            return (
-                data_product,
-                component_to_provision,
-                update_acl_request.refs,
-            )
-        elif isinstance(data_product, RequestValidationError):
-            return data_product
-        else:
-            return build_request_validation_error(
-                problems=["An unexpected error occurred while parsing the update acl request."]
-            )
+        return (
+            data_product,
+            component_to_provision,
+            update_acl_request.refs,
+        )
     except Exception as ex:
-        return build_request_validation_error(problems=["Unable to parse the descriptor.", str(ex)])
+        return build_request_validation_error(problems=[_UNABLE_TO_PARSE_DESCRIPTOR, str(ex)])
 
 
 UnpackedUpdateAclRequestDep = Annotated[
@@ -151,49 +324,35 @@ UnpackedUpdateAclRequestDep = Annotated[
 ]
 
 
-async def get_workspace_handler():
-    azure_workspace_manager = AzureWorkspaceManager(
-        sync_azure_databricks_manager=AzureDatabricksManagementClient(
-            credential=DefaultAzureCredential(),  # type:ignore[arg-type]
-            subscription_id=settings.azure.auth.subscription_id,
-        ),
-        async_azure_databricks_manager=AsyncAzureDatabricksManagementClient(
-            credential=DefaultAzureCredential(),  # type:ignore[arg-type]
-            subscription_id=settings.azure.auth.subscription_id,
-        ),
+def get_workspace_handler(request: Request) -> AzureWorkspaceHandler:
+    # Azure clients are built once on application startup, see `src.app_config.lifespan`
+    state = request.app.state
+    return AzureWorkspaceHandler(
+        state.azure_workspace_manager,
+        state.azure_permissions_manager,
+        state.azure_mapper,
+        state.workspace_client_cache,
+        state.workspace_info_cache,
     )
-    azure_permissions_manager = AzurePermissionsManager(
-        AuthorizationManagementClient(
-            credential=DefaultAzureCredential(),  # type:ignore[arg-type]
-            subscription_id=settings.azure.auth.subscription_id,
-        )
-    )
-    azure_mapper = AzureMapper(
-        AzureGraphClient(
-            GraphServiceClient(
-                credentials=DefaultAzureCredential(),  # type:ignore[arg-type]
-                scopes=["https://graph.microsoft.com/.default"],
-            )
-        )
-    )
-    workspace_handler = AzureWorkspaceHandler(azure_workspace_manager, azure_permissions_manager, azure_mapper)
-    # We yield so that after the execution of the provision task, we can close the aio session
-    try:
-        yield workspace_handler
-    finally:
-        await azure_workspace_manager.async_azure_databricks_manager.close()
 
 
 WorkspaceHandlerDep = Annotated[AzureWorkspaceHandler, Depends(get_workspace_handler)]
 
 
+def get_shared_account_client(request: Request) -> AccountClient:
+    # The account client is built once on application startup, see `src.app_config.lifespan`
+    return request.app.state.account_client
+
+
+AccountClientDep = Annotated[AccountClient, Depends(get_shared_account_client)]
+
+
 def create_provision_service(
     background_tasks: BackgroundTasks,
     task_repository: Annotated[MemoryTaskRepository, Depends(get_task_repository)],
     workspace_handler: WorkspaceHandlerDep,
+    account_client: AccountClientDep,
 ) -> ProvisionService:
-    account_client = get_account_client(settings)
-
     return ProvisionService(
         workspace_handler,
         JobWorkloadHandler(account_client),
@@ -208,8 +367,9 @@ def create_provision_service(
 ProvisionServiceDep = Annotated[ProvisionService, Depends(create_provision_service)]
 
 
-def create_reverse_provision_service(workspace_handler: WorkspaceHandlerDep) -> ReverseProvisionService:
-    account_client = get_account_client(settings)
+def create_reverse_provision_service(
+    workspace_handler: WorkspaceHandlerDep, account_client: AccountClientDep
+) -> ReverseProvisionService:
     return ReverseProvisionService(
         WorkflowReverseProvisionHandler(account_client, workspace_handler),
         OutputPortReverseProvisionHandler(workspace_handler),
@@ -219,8 +379,9 @@ def create_reverse_provision_service(workspace_handler: WorkspaceHandlerDep) ->
 ReverseProvisionServiceDep = Annotated[ReverseProvisionService, Depends(create_reverse_provision_service)]
 
 
-def create_update_acl_service(workspace_handler: WorkspaceHandlerDep) -> UpdateAclService:
-    account_client = get_account_client(settings)
+def create_update_acl_service(
+    workspace_handler: WorkspaceHandlerDep, account_client: AccountClientDep
+) -> UpdateAclService:
     return UpdateAclService(workspace_handler, OutputPortHandler(account_client))
 
 
@@ -1,25 +1,32 @@
 from __future__ import annotations
 
-import uuid
+import itertools
+import secrets
 
 from fastapi import Request
 from loguru import logger
 from starlette.background import BackgroundTask
-from starlette.responses import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response, StreamingResponse
 
+from src import settings
 from src.app_config import app
 from src.check_return_type import check_response
 from src.dependencies import (
     ProvisionServiceDep,
+    ReverseProvisioningRequestDep,
     ReverseProvisionServiceDep,
     UpdateAclServiceDep,
+    json_request_body_openapi,
 )
 from src.models.api_models import (
+    ProvisioningRequest,
     ProvisioningStatus,
     RequestValidationError,
     ReverseProvisioningRequest,
     ReverseProvisioningStatus,
     SystemErr,
+    UpdateAclRequest,
     ValidationError,
     ValidationRequest,
     ValidationResult,
@@ -30,24 +37,55 @@ from src.service.validation.validation_service import (
     ValidatedUpdateACLDatabricksComponentDep,
 )
 
+MAX_LOGGED_BODY_SIZE = 64 * 1024
+TRUNCATED_BODY_MARKER = b"...[truncated]"
 
-def log_info(req_body, res_code, res_body):
-    id = str(uuid.uuid4())
-    logger.info("[{}] REQUEST: {}", id, req_body.decode("utf-8"))
-    logger.info("[{}] RESPONSE({}): {}", id, res_code, res_body.decode("utf-8"))
+# Request ids only correlate log lines, so a per-process random prefix followed by a counter is enough to tell
+# requests apart without generating a random UUID for each of them
+REQUEST_ID_PREFIX = secrets.token_hex(4)
+_request_id_counter = itertools.count()
+
+
+def next_request_id() -> str:
+    return f"{REQUEST_ID_PREFIX}-{next(_request_id_counter):x}"
+
+
+def log_info(id, req_body, res_code, res_body):
+    # Logged bodies may have been truncated in the middle of a multibyte character
+    logger.info("[{}] REQUEST: {}", id, req_body.decode("utf-8", errors="replace"))
+    logger.info("[{}] RESPONSE({}): {}", id, res_code, res_body.decode("utf-8", errors="replace"))
 
 
 @app.middleware("http")
 async def log_request_response_middleware(request: Request, call_next):
+    # Available to the endpoints as well, to tag their own log lines with the same id
+    request.state.request_id = next_request_id()
+    if not settings.misc.log_request_response_bodies:
+        return await call_next(request)
+
+    # The body is cached on the request, so the endpoint doesn't read it a second time
     req_body = await request.body()
+    if len(req_body) > MAX_LOGGED_BODY_SIZE:
+        # Slicing a memoryview doesn't copy, so the truncated body is copied only once into the new buffer
+        req_body = b"".join((memoryview(req_body)[:MAX_LOGGED_BODY_SIZE], TRUNCATED_BODY_MARKER))
     response = await call_next(request)
-    chunks = []
-    async for chunk in response.body_iterator:
-        chunks.append(chunk)
-    res_body = b"".join(chunks)
-    task = BackgroundTask(log_info, req_body, response.status_code, res_body)
-    return Response(
-        content=res_body,
+
+    # The response is streamed back to the client as it is produced, while a bounded copy is kept for logging.
+    # The background task runs after the whole body has been sent, so the copy is complete by then.
+    res_body = bytearray()
+
+    async def stream_response_body():
+        async for chunk in response.body_iterator:
+            remaining = MAX_LOGGED_BODY_SIZE - len(res_body)
+            if remaining > 0:
+                res_body.extend(memoryview(chunk)[:remaining])
+                if len(chunk) > remaining:
+                    res_body.extend(TRUNCATED_BODY_MARKER)
+            yield chunk
+
+    task = BackgroundTask(log_info, request.state.request_id, req_body, response.status_code, res_body)
+    return StreamingResponse(
+        stream_response_body(),
         status_code=response.status_code,
         headers=dict(response.headers),
         media_type=response.media_type,
@@ -64,6 +102,7 @@ async def log_request_response_middleware(request: Request, call_next):
         "400": {"model": RequestValidationError},
         "500": {"model": SystemErr},
     },
+    openapi_extra=json_request_body_openapi(ProvisioningRequest),
     tags=["TechAdapter"],
 )
 async def provision(request: ValidatedDatabricksComponentDep, provision_service: ProvisionServiceDep) -> Response:
@@ -94,7 +133,7 @@ async def provision(request: ValidatedDatabricksComponentDep, provision_service:
     },
     tags=["TechAdapter"],
 )
-def get_status(token: str, provision_service: ProvisionServiceDep) -> Response:
+async def get_status(token: str, provision_service: ProvisionServiceDep) -> Response:
     """
     Get the status for a provisioning request
     """
@@ -113,6 +152,7 @@ def get_status(token: str, provision_service: ProvisionServiceDep) -> Response:
         "400": {"model": RequestValidationError},
         "500": {"model": SystemErr},
     },
+    openapi_extra=json_request_body_openapi(ProvisioningRequest),
     tags=["TechAdapter"],
 )
 async def unprovision(request: ValidatedDatabricksComponentDep, provision_service: ProvisionServiceDep) -> Response:
@@ -143,9 +183,12 @@ async def unprovision(request: ValidatedDatabricksComponentDep, provision_servic
         "400": {"model": RequestValidationError},
         "500": {"model": SystemErr},
     },
+    openapi_extra=json_request_body_openapi(UpdateAclRequest),
     tags=["TechAdapter"],
 )
-def updateacl(request: ValidatedUpdateACLDatabricksComponentDep, update_acl_service: UpdateAclServiceDep) -> Response:
+async def updateacl(
+    request: ValidatedUpdateACLDatabricksComponentDep, update_acl_service: UpdateAclServiceDep
+) -> Response:
     """
     Request the access to a tech adapter component
     """
@@ -155,7 +198,8 @@ def updateacl(request: ValidatedUpdateACLDatabricksComponentDep, update_acl_serv
 
     data_product, component, witboost_users = request
 
-    resp = update_acl_service.update_acl(data_product, component, witboost_users)
+    # Updating the ACLs performs blocking calls through the Databricks SDK
+    resp = await run_in_threadpool(update_acl_service.update_acl, data_product, component, witboost_users)
 
     return check_response(out_response=resp)
 
@@ -164,9 +208,10 @@ def updateacl(request: ValidatedUpdateACLDatabricksComponentDep, update_acl_serv
     "/v1/validate",
     response_model=None,
     responses={"200": {"model": ValidationResult}, "500": {"model": SystemErr}},
+    openapi_extra=json_request_body_openapi(ProvisioningRequest),
     tags=["TechAdapter"],
 )
-def validate(request: ValidatedDatabricksComponentDep) -> Response:
+async def validate(request: ValidatedDatabricksComponentDep) -> Response:
     """
     Validate a provisioning request
     """
@@ -187,7 +232,7 @@ def validate(request: ValidatedDatabricksComponentDep) -> Response:
     },
     tags=["TechAdapter"],
 )
-def async_validate(
+async def async_validate(
     body: ValidationRequest,
 ) -> Response:
     """
@@ -214,7 +259,7 @@ def async_validate(
     },
     tags=["TechAdapter"],
 )
-def get_validation_status(
+async def get_validation_status(
     token: str,
 ) -> Response:
     """
@@ -236,15 +281,17 @@ def get_validation_status(
         "400": {"model": RequestValidationError},
         "500": {"model": SystemErr},
     },
+    openapi_extra=json_request_body_openapi(ReverseProvisioningRequest),
     tags=["SpecificProvisioner"],
 )
-def run_reverse_provisioning(
-    body: ReverseProvisioningRequest, reverse_provision_service: ReverseProvisionServiceDep
+async def run_reverse_provisioning(
+    body: ReverseProvisioningRequestDep, reverse_provision_service: ReverseProvisionServiceDep
 ) -> Response:
     """
     Execute a reverse provisioning operation
     """
-    resp = reverse_provision_service.run_reverse_provisioning(body)
+    # Reverse provisioning performs blocking calls through the Databricks SDK
+    resp = await run_in_threadpool(reverse_provision_service.run_reverse_provisioning, body)
 
     return check_response(out_response=resp)
 
@@ -259,7 +306,7 @@ def run_reverse_provisioning(
     },
     tags=["SpecificProvisioner"],
 )
-def get_reverse_provisioning_status(
+async def get_reverse_provisioning_status(
     token: str,
 ) -> Response:
     """
@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional
+
+import msgspec
+
+from src.models.api_models import DescriptorKind
+
+# msgspec counterparts of the request bodies defined in `src.models.api_models`. They are only used to decode and
+# validate the incoming JSON payloads, which are then handed over to the rest of the application as the
+# corresponding Pydantic models. Keep them aligned with the models in `api_models` and the interface specification.
+
+
+class ProvisioningRequestBody(msgspec.Struct):
+    descriptorKind: DescriptorKind
+    descriptor: str
+    removeData: Optional[bool] = None
+
+
+class ProvisionInfoBody(msgspec.Struct):
+    request: str
+    result: str
+
+
+class UpdateAclRequestBody(msgspec.Struct):
+    refs: List[str]
+    provisionInfo: ProvisionInfoBody
+
+
+class ReverseProvisioningRequestBody(msgspec.Struct):
+    useCaseTemplateId: str
+    environment: str
+    params: Dict
+    catalogInfo: Dict
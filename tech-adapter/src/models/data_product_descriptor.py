@@ -1,5 +1,6 @@
 from datetime import datetime
 from enum import StrEnum
+from functools import cache
 from typing import Annotated, Any, List, Literal, Optional, Type
 
 from loguru import logger
@@ -22,14 +23,19 @@ class ComponentKind(StrEnum):
     OBSERVABILITY = "observability"
 
 
+@cache
+def _members_by_lowercase_value(enum_cls: Type[StrEnum]) -> dict[str, StrEnum]:
+    return {member.lower(): member for member in enum_cls}
+
+
 class CaseInsensitiveEnum(StrEnum):
+    # Values matching a member exactly are resolved by the Enum lookup itself, and `_missing_` is only called
+    # for the remaining ones. Those are then matched through a lowercase index built once per enum class.
     @classmethod
     def _missing_(cls, value):
-        value = value.lower()
-        for member in cls:
-            if member.lower() == value:
-                return member
-        return None
+        if not isinstance(value, str):
+            return None
+        return _members_by_lowercase_value(cls).get(value.lower())
 
 
 class TagSourceTagLabel(CaseInsensitiveEnum):
@@ -256,6 +262,26 @@ class DataProduct(BaseModel):
     specific: dict
     components: List[Annotated[Component, BeforeValidator(parse_component)]]
 
+    @classmethod
+    def construct_trusted(cls, data: dict) -> "DataProduct":
+        """
+        Builds a DataProduct from data that is known to have already passed validation, skipping
+        the validation of the data product fields.
+
+        `model_construct` doesn't recurse into nested models, so components are still built through
+        `parse_component` to obtain their concrete type, and tags are still validated.
+
+        Args:
+            data (dict): The `dataProduct` section of a descriptor that previously validated successfully.
+
+        Returns:
+            DataProduct: The constructed data product.
+        """
+        fields = dict(data)
+        fields["tags"] = [OpenMetadataTagLabel.model_validate(tag) for tag in data.get("tags", [])]
+        fields["components"] = [parse_component(component) for component in data.get("components", [])]
+        return cls.model_construct(**fields)
+
     def get_components_by_kind(self, kind: str) -> List[Component]:
         """
         Filters the components associated with the data product and returns
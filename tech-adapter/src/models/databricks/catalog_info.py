@@ -5,12 +5,18 @@ from pydantic import BaseModel, BeforeValidator, Field, ValidationError
 from src.models.databricks.databricks_component_specific import DatabricksComponentSpecific
 from src.models.databricks.workload.databricks_workload_specific import DatabricksWorkloadSpecific
 
+_WORKLOAD_SPECIFIC_FIELDS = ("git", "repoPath")
+
 
 def try_parse_as_workload(data: Any) -> DatabricksComponentSpecific:
-    try:
-        return DatabricksWorkloadSpecific.model_validate(data)
-    except ValidationError:
-        return DatabricksComponentSpecific.model_validate(data)
+    # Only workloads define the repository fields, so any other specific is parsed directly as a component one
+    # instead of raising and catching a ValidationError on every call
+    if isinstance(data, dict) and all(field in data for field in _WORKLOAD_SPECIFIC_FIELDS):
+        try:
+            return DatabricksWorkloadSpecific.model_validate(data)
+        except ValidationError:
+            pass
+    return DatabricksComponentSpecific.model_validate(data)
 
 
 class Mesh(BaseModel):
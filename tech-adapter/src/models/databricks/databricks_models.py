@@ -1,5 +1,8 @@
+from enum import StrEnum
 from typing import Union
 
+from pydantic import ConfigDict
+
 from src.models.data_product_descriptor import OutputPort, Workload
 from src.models.databricks.outputport.databricks_outputport_specific import DatabricksOutputPortSpecific
 from src.models.databricks.workload.databricks_dlt_workload_specific import DatabricksDLTWorkloadSpecific
@@ -8,22 +11,42 @@ from src.models.databricks.workload.databricks_workload_specific import Databric
 
 # --- Base and Common Models ---
 
+# Unlike the generic components they're parsed from, fields not declared by the Databricks components are never
+# read, so they're dropped instead of being kept on every instance
+
 
 class JobWorkload(Workload):
+    model_config = ConfigDict(extra="ignore")
+
     specific: DatabricksJobWorkloadSpecific
 
 
 class WorkflowWorkload(Workload):
+    model_config = ConfigDict(extra="ignore")
+
     specific: DatabricksWorkflowWorkloadSpecific
 
 
 class DLTWorkload(Workload):
+    model_config = ConfigDict(extra="ignore")
+
     specific: DatabricksDLTWorkloadSpecific
 
 
 class DatabricksOutputPort(OutputPort):
+    model_config = ConfigDict(extra="ignore")
+
     specific: DatabricksOutputPortSpecific
 
 
+class DatabricksComponentType(StrEnum):
+    """Tags identifying each of the supported Databricks components on the discriminated union."""
+
+    JOB = "job"
+    WORKFLOW = "workflow"
+    DLT = "dlt"
+    OUTPUTPORT = "outputport"
+
+
 DatabricksWorkload = Union[JobWorkload, WorkflowWorkload, DLTWorkload]
 DatabricksComponent = Union[DatabricksWorkload, DatabricksOutputPort]
@@ -1,3 +1,4 @@
+import sys
 from typing import Optional
 
 from azure.mgmt.databricks.models import ProvisioningState
@@ -36,11 +37,14 @@ class DatabricksWorkspaceInfo(BaseModel):
 
         In a managed workspace, the name is distinct from the host, and the
         provisioner is expected to manage users, groups, and permissions.
+
+        Validation is skipped, as the values come from the workspaces returned by the Azure Databricks SDK.
+        The name and host are interned, as the same ones are rebuilt for every request on the workspace.
         """
-        return cls(
-            name=name,
+        return cls.model_construct(
+            name=sys.intern(name),
             id=id,
-            databricks_host=databricks_host,
+            databricks_host=sys.intern(databricks_host),
             azure_resource_id=azure_resource_id,
             azure_resource_url=azure_resource_url,
             provisioning_state=provisioning_state,
@@ -60,8 +64,13 @@ class DatabricksWorkspaceInfo(BaseModel):
 
         In an unmanaged workspace, the name defaults to the host URL, and the
         provisioner does not manage users, groups, or permissions.
+
+        Validation is skipped, as the values are extracted from a URL already matched against the
+        Databricks workspace URL pattern. The host is interned, as the same one is rebuilt for every
+        request on the workspace.
         """
-        return cls(
+        databricks_host = sys.intern(databricks_host)
+        return cls.model_construct(
             name=databricks_host,  # Name is set to the host for unmanaged workspaces
             id=id,
             databricks_host=databricks_host,
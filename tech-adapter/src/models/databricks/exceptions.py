@@ -12,21 +12,21 @@ class DatabricksError(Exception):
     from the Databricks logic.
     """
 
-    pass
+    __slots__ = ()
 
 
 class MapperError(DatabricksError):
     """Base exception for all errors raised by a Principals Mapper."""
 
-    pass
+    __slots__ = ()
 
 
 class DatabricksMapperError(MapperError):
-    pass
+    __slots__ = ()
 
 
 class AzureMapperError(MapperError):
-    pass
+    __slots__ = ()
 
 
 class DatabricksWorkspaceManagerError(DatabricksError):
@@ -38,25 +38,25 @@ class DatabricksWorkspaceManagerError(DatabricksError):
     operational issues.
     """
 
-    pass
+    __slots__ = ()
 
 
 class RepoManagerError(DatabricksError):
     """Raised for any failure during repository management operations."""
 
-    pass
+    __slots__ = ()
 
 
 class JobManagerError(DatabricksError):
     """Raised for any failure during Databricks Job management operations."""
 
-    pass
+    __slots__ = ()
 
 
 class AzureWorkspaceManagerError(DatabricksError):
     """Base exception for failures on operations regarding management of Databricks workspaces on Azure."""
 
-    pass
+    __slots__ = ()
 
 
 class AzurePermissionsError(DatabricksError):
@@ -64,25 +64,25 @@ class AzurePermissionsError(DatabricksError):
     Raised for any failure during Azure permission management operations.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AzureGraphClientError(DatabricksError):
     """Base exception for errors raised by the Azure Graph Client."""
 
-    pass
+    __slots__ = ()
 
 
 class WorkflowManagerError(DatabricksError):
     """Base exception for any failure during Databricks Workflow management operations."""
 
-    pass
+    __slots__ = ()
 
 
 class DLTManagerError(DatabricksError):
     """Base exception for any failure during Databricks DLT management operations."""
 
-    pass
+    __slots__ = ()
 
 
 class UnityCatalogError(DatabricksError):
@@ -90,7 +90,7 @@ class UnityCatalogError(DatabricksError):
     Base exception for any failure during operations related to the Unity Catalog
     """
 
-    pass
+    __slots__ = ()
 
 
 class StatementExecutionError(DatabricksError):
@@ -98,7 +98,7 @@ class StatementExecutionError(DatabricksError):
     Base exception for any failures during the execution of SQL statements
     """
 
-    pass
+    __slots__ = ()
 
 
 class IdentityManagerError(Exception):
@@ -107,4 +107,4 @@ class IdentityManagerError(Exception):
     assigning users or groups to a workspace.
     """
 
-    pass
+    __slots__ = ()
@@ -1,4 +1,6 @@
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 
 from databricks.sdk.service.catalog import SecurableType
 
@@ -6,6 +8,8 @@ from databricks.sdk.service.catalog import SecurableType
 class DBObject(ABC):
     """Abstract base class for a Databricks securable object."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def fully_qualified_name(self) -> str:
@@ -17,42 +21,69 @@ class DBObject(ABC):
         pass
 
 
+# The fully qualified names are computed once on creation, as they're read repeatedly
+# while building Unity Catalog requests and log messages. Names are interned, since many
+# objects share the same catalog and schema.
+
+
+@dataclass(frozen=True, slots=True)
 class Catalog(DBObject):
-    def __init__(self, name: str):
-        self.name = name
+    name: str
+    _fully_qualified_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "_fully_qualified_name", self.name)
 
     @property
     def fully_qualified_name(self) -> str:
-        return self.name
+        return self._fully_qualified_name
 
     @property
     def securable_type(self) -> SecurableType:
         return SecurableType.CATALOG
 
 
+@dataclass(frozen=True, slots=True)
 class Schema(DBObject):
-    def __init__(self, catalog_name: str, schema_name: str):
-        self.catalog_name = catalog_name
-        self.schema_name = schema_name
+    catalog_name: str
+    schema_name: str
+    _fully_qualified_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "catalog_name", sys.intern(self.catalog_name))
+        object.__setattr__(self, "schema_name", sys.intern(self.schema_name))
+        object.__setattr__(self, "_fully_qualified_name", sys.intern(".".join((self.catalog_name, self.schema_name))))
 
     @property
     def fully_qualified_name(self) -> str:
-        return f"{self.catalog_name}.{self.schema_name}"
+        return self._fully_qualified_name
 
     @property
     def securable_type(self) -> SecurableType:
         return SecurableType.SCHEMA
 
 
+@dataclass(frozen=True, slots=True)
 class View(DBObject):
-    def __init__(self, catalog_name: str, schema_name: str, view_name: str):
-        self.catalog_name = catalog_name
-        self.schema_name = schema_name
-        self.view_name = view_name
+    catalog_name: str
+    schema_name: str
+    view_name: str
+    _fully_qualified_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "catalog_name", sys.intern(self.catalog_name))
+        object.__setattr__(self, "schema_name", sys.intern(self.schema_name))
+        object.__setattr__(self, "view_name", sys.intern(self.view_name))
+        object.__setattr__(
+            self,
+            "_fully_qualified_name",
+            sys.intern(".".join((self.catalog_name, self.schema_name, self.view_name))),
+        )
 
     @property
     def fully_qualified_name(self) -> str:
-        return f"{self.catalog_name}.{self.schema_name}.{self.view_name}"
+        return self._fully_qualified_name
 
     @property
     def securable_type(self) -> SecurableType:
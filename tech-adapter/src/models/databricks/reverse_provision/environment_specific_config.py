@@ -0,0 +1,28 @@
+from typing import Any
+
+ENVIRONMENT_SPECIFIC_CONFIG_ALIAS = "environmentSpecificConfig"
+
+
+def flatten_environment_specific_config(data: Any) -> Any:
+    """
+    Moves the fields of `environmentSpecificConfig.specific` to the top level of the reverse provisioning params,
+    so that they can be validated by a single flat model instead of a chain of single-field wrapper models.
+
+    Args:
+        data: The raw reverse provisioning params.
+
+    Returns:
+        The params with the environment specific fields at the top level, or the data unchanged if it doesn't
+        have the expected shape, leaving the error reporting to the model validation.
+    """
+    if not isinstance(data, dict):
+        return data
+    environment_specific_config = data.get(ENVIRONMENT_SPECIFIC_CONFIG_ALIAS)
+    if not isinstance(environment_specific_config, dict):
+        return data
+    specific = environment_specific_config.get("specific")
+    if not isinstance(specific, dict):
+        return data
+    flattened = {key: value for key, value in data.items() if key != ENVIRONMENT_SPECIFIC_CONFIG_ALIAS}
+    flattened.update(specific)
+    return flattened
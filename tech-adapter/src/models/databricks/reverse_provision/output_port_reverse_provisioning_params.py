@@ -1,24 +1,26 @@
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
 
+from pydantic import BaseModel, Field, model_validator
 
-class OutputPortReverseProvisioningSpecific(BaseModel):
-    workspace: str
-
-
-class EnvironmentSpecificConfig(BaseModel):
-    specific: OutputPortReverseProvisioningSpecific
+from src.models.databricks.reverse_provision.environment_specific_config import flatten_environment_specific_config
 
 
 class OutputPortReverseProvisioningParams(BaseModel):
     """
     Represents the parameters for a reverse provisioning request for a
     Databricks Output Port.
-    """
 
-    model_config = ConfigDict(populate_by_name=True)
+    The workspace is received as `environmentSpecificConfig.specific.workspace` and is exposed as a top level field.
+    The params are only read from the request, so they're accepted by alias only.
+    """
 
-    environment_specific_config: EnvironmentSpecificConfig = Field(alias="environmentSpecificConfig")
+    workspace: str
     catalog_name: str = Field(alias="catalogName")
     schema_name: str = Field(alias="schemaName")
     table_name: str = Field(alias="tableName")
     reverse_provisioning_option: str = Field(alias="reverseProvisioningOption")
+
+    @model_validator(mode="before")
+    @classmethod
+    def flatten_specific(cls, data: Any) -> Any:
+        return flatten_environment_specific_config(data)
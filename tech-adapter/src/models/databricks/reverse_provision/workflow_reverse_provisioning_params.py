@@ -1,43 +1,35 @@
 from typing import Any, Optional
 
 from databricks.sdk.service.jobs import Job
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from src.models.databricks.reverse_provision.environment_specific_config import flatten_environment_specific_config
+from src.models.databricks.workload.databricks_workflow_specific import parse_job
 
-class WorkflowReverseProvisioningSpecific(BaseModel):
+
+class WorkflowReverseProvisioningParams(BaseModel):
     """
-    Holds the specific details for a workflow to be reverse provisioned,
-    including the workspace and the job definition itself.
+    Represents the parameters for a reverse provisioning request for a
+    Databricks workflow, including the workspace and the job definition itself.
+
+    These are received inside `environmentSpecificConfig.specific` and are exposed as top level fields.
     """
 
     # This configuration allows the model to hold a non-Pydantic object
-    # like the `Job` class from the Databricks SDK.
-    model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
+    # like the `Job` class from the Databricks SDK. The params are only read
+    # from the request, so they're accepted by alias only.
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     workspace: str
     workflow: Job
     run_as_principal_name: Optional[str] = Field(default=None, alias="runAsPrincipalName")
 
+    @model_validator(mode="before")
+    @classmethod
+    def flatten_specific(cls, data: Any) -> Any:
+        return flatten_environment_specific_config(data)
+
     @field_validator("workflow", mode="before")
     @classmethod
     def parse_job(cls, data: Any) -> Any:
-        if data is not None:
-            if isinstance(data, dict):
-                return Job.from_dict(data)
-            raise ValueError("specific.workflow field is not an object")
-        return None
-
-
-class EnvironmentSpecificConfig(BaseModel):
-    specific: WorkflowReverseProvisioningSpecific
-
-
-class WorkflowReverseProvisioningParams(BaseModel):
-    """
-    Represents the parameters for a reverse provisioning request for a
-    Databricks workflow.
-    """
-
-    model_config = ConfigDict(populate_by_name=True)
-
-    environment_specific_config: EnvironmentSpecificConfig = Field(alias="environmentSpecificConfig")
+        return parse_job(data)
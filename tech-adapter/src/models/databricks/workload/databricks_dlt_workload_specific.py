@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+from itertools import product
+from typing import Dict, List, Optional, Tuple
 
 from databricks.sdk.service.pipelines import PipelineClusterAutoscaleMode
 from pydantic import BaseModel, ConfigDict, Field, model_validator
@@ -29,6 +30,31 @@ class PipelineNotification(BaseModel):
     alert: List[str]
 
 
+_AUTOSCALE_MODES = frozenset((PipelineClusterAutoscaleMode.ENHANCED, PipelineClusterAutoscaleMode.LEGACY))
+
+
+def _cluster_sizing_error(is_autoscale: bool, min_set: bool, max_set: bool, num_set: bool) -> Optional[str]:
+    if is_autoscale:
+        if not (min_set and max_set):
+            return "For autoscale modes, 'min_workers' and 'max_workers' must be set."
+        if num_set:
+            return "For autoscale modes, 'num_workers' must not be set."
+    else:  # Fixed-size cluster
+        if not num_set:
+            return "For fixed-size clusters, 'num_workers' must be set."
+        if min_set or max_set:
+            return "For fixed-size clusters, 'min_workers' and 'max_workers' must not be set."
+    return None
+
+
+# Sizing error for each combination of (is_autoscale, min_workers set, max_workers set, num_workers set),
+# computed once so that validating a cluster is a single lookup
+_CLUSTER_SIZING_ERRORS: Dict[Tuple[bool, bool, bool, bool], Optional[str]] = {
+    (is_autoscale, min_set, max_set, num_set): _cluster_sizing_error(is_autoscale, min_set, max_set, num_set)
+    for is_autoscale, min_set, max_set, num_set in product((False, True), repeat=4)
+}
+
+
 class DLTClusterSpecific(BaseModel):
     """
     Represents the cluster-specific configuration for a DLT pipeline.
@@ -43,22 +69,16 @@ class DLTClusterSpecific(BaseModel):
         Validates that sizing parameters (min/max_workers vs num_workers)
         are consistent with the selected autoscaling mode.
         """
-        is_autoscale = self.mode in (
-            PipelineClusterAutoscaleMode.ENHANCED,
-            PipelineClusterAutoscaleMode.LEGACY,
-        )
-
-        if is_autoscale:
-            if self.min_workers is None or self.max_workers is None:
-                raise ValueError("For autoscale modes, 'min_workers' and 'max_workers' must be set.")
-            if self.num_workers is not None:
-                raise ValueError("For autoscale modes, 'num_workers' must not be set.")
-        else:  # Fixed-size cluster
-            if self.num_workers is None:
-                raise ValueError("For fixed-size clusters, 'num_workers' must be set.")
-            if self.min_workers is not None or self.max_workers is not None:
-                raise ValueError("For fixed-size clusters, 'min_workers' and 'max_workers' must not be set.")
-
+        error = _CLUSTER_SIZING_ERRORS[
+            (
+                self.mode in _AUTOSCALE_MODES,
+                self.min_workers is not None,
+                self.max_workers is not None,
+                self.num_workers is not None,
+            )
+        ]
+        if error:
+            raise ValueError(error)
         return self
 
     policy_id: Optional[str] = None
@@ -6,6 +6,23 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 from src.models.databricks.workload.databricks_workload_specific import DatabricksWorkloadSpecific
 
 
+def parse_job(data: Any) -> Optional[Job]:
+    """
+    Parses the `workflow` field of a specific into a Databricks SDK `Job`.
+
+    An already parsed `Job` is returned as is, so validating again a model built from another one
+    doesn't walk the whole job definition a second time.
+    The parsed jobs are not cached across requests, since provisioning updates them in place.
+    """
+    if data is None:
+        return None
+    if isinstance(data, Job):
+        return data
+    if isinstance(data, dict):
+        return Job.from_dict(data)
+    raise ValueError("specific.workflow field is not an object")
+
+
 class WorkflowTasksInfo(BaseModel):
     """
     Holds workspace-dependent information for a specific task within a workflow.
@@ -35,11 +52,7 @@ class DatabricksWorkflowWorkloadSpecific(DatabricksWorkloadSpecific):
     @field_validator("workflow", mode="before")
     @classmethod
     def parse_job(cls, data: Any) -> Any:
-        if data is not None:
-            if isinstance(data, dict):
-                return Job.from_dict(data)
-            raise ValueError("specific.workflow field is not an object")
-        return None
+        return parse_job(data)
 
     workflow: Job
 
@@ -2,6 +2,8 @@
 Custom exceptions for handling Provisioning level errors.
 """
 
+from typing import Iterator
+
 
 class ProvisioningError(Exception):
     """
@@ -11,15 +13,21 @@ class ProvisioningError(Exception):
     in this module.
     """
 
+    __slots__ = ("errors",)
+
     def __init__(self, errors: list[str]):
         if not errors:
             raise ValueError("Error while creating exception. You must provide at least one error message")
         self.errors = errors
-        super().__init__(",".join(self.errors))
+        # The message is only built when the exception is formatted
+        super().__init__(errors)
+
+    def __str__(self) -> str:
+        return ",".join(self.errors)
 
 
 class AsyncHandlingError(ProvisioningError):
-    pass
+    __slots__ = ()
 
 
 class ReverseProvisioningError(ProvisioningError):
@@ -27,31 +35,47 @@ class ReverseProvisioningError(ProvisioningError):
     Raised for any failure during the reverse provisioning process for a workflow.
     """
 
-    pass
+    __slots__ = ()
 
 
 class WorkspaceHandlerError(ProvisioningError):
     """Base exception for failures on the WorkspaceHandler class."""
 
-    pass
+    __slots__ = ()
 
 
-def get_error_list_from_chained_exception(e: BaseException) -> list[str]:
-    ex = e
-    result = [str(e)]
-    while ex.__context__:
-        if isinstance(ex.__context__, ProvisioningError):
-            result.extend(ex.__context__.errors)
+def _iter_exception_context(e: BaseException) -> Iterator[BaseException]:
+    """
+    Yields the exceptions that caused `e`, excluding `e` itself. Each step follows the explicit cause
+    (`raise ... from ...`) if set, and the implicit `__context__` otherwise.
+    Stops if an exception appears twice, so that cyclic chains don't loop forever.
+    """
+    seen = {id(e)}
+    ex = e.__cause__ or e.__context__
+    while ex is not None and id(ex) not in seen:
+        seen.add(id(ex))
+        yield ex
+        ex = ex.__cause__ or ex.__context__
+
+
+def iter_error_strings(e: BaseException) -> Iterator[str]:
+    """
+    Lazily yields the error messages of `e` and of the exceptions that caused it, formatting each exception once.
+    The errors of a chained ProvisioningError are yielded one by one.
+    """
+    yield str(e)
+    for ex in _iter_exception_context(e):
+        if isinstance(ex, ProvisioningError):
+            yield from ex.errors
         else:
-            result.append(str(ex.__context__))
-        ex = ex.__context__
-    return result
+            yield str(ex)
+
+
+def get_error_list_from_chained_exception(e: BaseException) -> list[str]:
+    return list(iter_error_strings(e))
 
 
 def build_error_message_from_chained_exception(e: BaseException) -> str:
-    ex = e
-    result = f"{e}"
-    while ex.__context__:
-        result += f'\n caused by: "{ex.__context__}"'
-        ex = ex.__context__
-    return result
+    parts = [f"{e}"]
+    parts.extend(f'"{ex}"' for ex in _iter_exception_context(e))
+    return "\n caused by: ".join(parts)
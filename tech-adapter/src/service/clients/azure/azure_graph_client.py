@@ -1,17 +1,77 @@
+import functools
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
 from loguru import logger
-from msgraph.generated.groups.groups_request_builder import GroupsRequestBuilder
-from msgraph.generated.users.users_request_builder import UsersRequestBuilder
-from msgraph.graph_service_client import GraphServiceClient
 
 from src.models.databricks.exceptions import AzureGraphClientError
 
+# The Microsoft Graph SDK takes a long time to import, as it loads its generated request builders and models.
+# It's imported only when it's first needed, so that importing the application (e.g. on test collection)
+# doesn't pay for it.
+if TYPE_CHECKING:
+    from kiota_abstractions.request_information import RequestInformation
+    from msgraph.graph_service_client import GraphServiceClient
+
+# Maximum number of requests accepted by the Microsoft Graph JSON batching endpoint
+GRAPH_BATCH_MAX_REQUESTS = 20
+# Maximum number of values accepted by Microsoft Graph in the `in` operator of a filter
+GRAPH_FILTER_MAX_VALUES = 15
+
+
+# A method looking up the ID of a single principal
+_PrincipalLookup = Callable[["AzureGraphClient", str], Awaitable[str]]
+
+
+def _wrap_graph_errors(principal_type: str) -> Callable[[_PrincipalLookup], _PrincipalLookup]:
+    """
+    Decorates a single principal lookup so that any error other than an AzureGraphClientError
+    is logged and raised as an AzureGraphClientError.
+
+    Args:
+        principal_type: The kind of principal looked up by the decorated method, used in error messages.
+    """
+
+    def decorator(lookup: _PrincipalLookup) -> _PrincipalLookup:
+        @functools.wraps(lookup)
+        async def wrapper(self: "AzureGraphClient", identifier: str) -> str:
+            try:
+                return await lookup(self, identifier)
+            except AzureGraphClientError:
+                raise
+            except Exception as e:
+                error_msg = f"An unexpected error occurred while getting {principal_type} ID for {identifier}."
+                logger.error(
+                    "An unexpected error occurred while getting {} ID for {}. Details: {}",
+                    principal_type,
+                    identifier,
+                    e,
+                )
+                raise AzureGraphClientError(error_msg) from e
+
+        return wrapper
+
+    return decorator
+
 
 class AzureGraphClient:
     """
     A client to interact with the Microsoft Graph API to find users and groups.
     """
 
-    def __init__(self, graph_service_client: GraphServiceClient):
+    def __init__(self, graph_service_client: "GraphServiceClient"):
         """
         Initializes the AzureGraphClient.
 
@@ -19,7 +79,11 @@ class AzureGraphClient:
             graph_service_client: An authenticated Microsoft GraphServiceClient instance.
         """
         self.graph_service_client = graph_service_client
+        # Bound once, as they're called for every single lookup
+        self._get_users = graph_service_client.users.get
+        self._get_groups = graph_service_client.groups.get
 
+    @_wrap_graph_errors("user")
     async def get_user_id(self, mail: str) -> str:
         """
         Retrieves the unique object ID for a user based on their email address.
@@ -34,30 +98,26 @@ class AzureGraphClient:
             AzureGraphClientError: If no user is found with the specified email address
             or any other API errors or unexpected issues.
         """
+        from msgraph.generated.users.users_request_builder import UsersRequestBuilder
+
         logger.info("Searching for user with mail: {}", mail)
-        try:
-            query_params = UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
-                filter=f"mail eq '{mail}'",
-                select=["id"],  # Select only the ID field to be efficient
-            )
-            request_configuration = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
-                query_parameters=query_params,
-            )
-            response = await self.graph_service_client.users.get(request_configuration=request_configuration)
+        query_params = UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
+            filter=f"mail eq '{_escape_odata(mail)}'",
+            select=["id"],  # Select only the ID field to be efficient
+        )
+        request_configuration = UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
+            query_parameters=query_params,
+        )
+        response = await self._get_users(request_configuration=request_configuration)
 
-            if not response or not response.value or len(response.value) == 0 or not response.value[0].id:
-                error_msg = f"User {mail} not found on the configured Azure tenant"
-                logger.error(error_msg)
-                raise AzureGraphClientError(error_msg)
+        if not response or not response.value or len(response.value) == 0 or not response.value[0].id:
+            error_msg = f"User {mail} not found on the configured Azure tenant"
+            logger.error(error_msg)
+            raise AzureGraphClientError(error_msg)
 
-            return response.value[0].id
-        except AzureGraphClientError:
-            raise
-        except Exception as e:
-            error_msg = f"An unexpected error occurred while getting user ID for {mail}."
-            logger.error("An unexpected error occurred while getting user ID for {}. Details: {}", mail, e)
-            raise AzureGraphClientError(error_msg) from e
+        return response.value[0].id
 
+    @_wrap_graph_errors("group")
     async def get_group_id(self, group_name: str) -> str:
         """
         Retrieves the unique object ID for a group based on its display name.
@@ -72,26 +132,179 @@ class AzureGraphClient:
             AzureGraphClientError: If no group is found with the specified display name
             or any other API errors or unexpected issues.
         """
+        from msgraph.generated.groups.groups_request_builder import GroupsRequestBuilder
+
         logger.info("Searching for group with name: {}", group_name)
-        try:
-            query_params = GroupsRequestBuilder.GroupsRequestBuilderGetQueryParameters(
-                filter=f"displayName eq '{group_name}'",
-                select=["id"],  # Select only the ID field
+        query_params = GroupsRequestBuilder.GroupsRequestBuilderGetQueryParameters(
+            filter=f"displayName eq '{_escape_odata(group_name)}'",
+            select=["id"],  # Select only the ID field
+        )
+        request_configuration = GroupsRequestBuilder.GroupsRequestBuilderGetRequestConfiguration(
+            query_parameters=query_params,
+        )
+        response = await self._get_groups(request_configuration=request_configuration)
+
+        if not response or not response.value or len(response.value) == 0 or not response.value[0].id:
+            error_msg = f"Group {group_name} not found on the configured Azure tenant"
+            logger.error(error_msg)
+            raise AzureGraphClientError(error_msg)
+
+        return response.value[0].id
+
+    async def get_user_ids(self, mails: Collection[str]) -> Dict[str, Union[str, AzureGraphClientError]]:
+        """
+        Retrieves the unique object IDs for a set of users based on their email addresses.
+
+        Each lookup request filters up to `GRAPH_FILTER_MAX_VALUES` mails at once, and the lookups are sent through
+        the Microsoft Graph batching endpoint, up to `GRAPH_BATCH_MAX_REQUESTS` per HTTP request.
+
+        Args:
+            mails: The email addresses of the users to find.
+
+        Returns:
+            A dictionary mapping each email address to the unique object ID of the user, or to an
+            AzureGraphClientError if the user wasn't found or the lookup failed.
+        """
+        from msgraph.generated.models.user_collection_response import UserCollectionResponse
+        from msgraph.generated.users.users_request_builder import UsersRequestBuilder
+
+        logger.info("Searching for {} users by mail", len(mails))
+        requests = {
+            chunk: self.graph_service_client.users.to_get_request_information(
+                request_configuration=UsersRequestBuilder.UsersRequestBuilderGetRequestConfiguration(
+                    query_parameters=UsersRequestBuilder.UsersRequestBuilderGetQueryParameters(
+                        filter=_odata_in_filter("mail", chunk),
+                        select=["id", "mail"],
+                    ),
+                )
             )
-            request_configuration = GroupsRequestBuilder.GroupsRequestBuilderGetRequestConfiguration(
-                query_parameters=query_params,
+            for chunk in _chunks(mails, GRAPH_FILTER_MAX_VALUES)
+        }
+        return await self._get_ids_in_batches(requests, UserCollectionResponse, "User", lambda user: user.mail)
+
+    async def get_group_ids(self, group_names: Collection[str]) -> Dict[str, Union[str, AzureGraphClientError]]:
+        """
+        Retrieves the unique object IDs for a set of groups based on their display names.
+
+        Each lookup request filters up to `GRAPH_FILTER_MAX_VALUES` names at once, and the lookups are sent through
+        the Microsoft Graph batching endpoint, up to `GRAPH_BATCH_MAX_REQUESTS` per HTTP request.
+
+        Args:
+            group_names: The display names of the groups to find.
+
+        Returns:
+            A dictionary mapping each display name to the unique object ID of the group, or to an
+            AzureGraphClientError if the group wasn't found or the lookup failed.
+        """
+        from msgraph.generated.groups.groups_request_builder import GroupsRequestBuilder
+        from msgraph.generated.models.group_collection_response import GroupCollectionResponse
+
+        logger.info("Searching for {} groups by name", len(group_names))
+        requests = {
+            chunk: self.graph_service_client.groups.to_get_request_information(
+                request_configuration=GroupsRequestBuilder.GroupsRequestBuilderGetRequestConfiguration(
+                    query_parameters=GroupsRequestBuilder.GroupsRequestBuilderGetQueryParameters(
+                        filter=_odata_in_filter("displayName", chunk),
+                        select=["id", "displayName"],
+                    ),
+                )
+            )
+            for chunk in _chunks(group_names, GRAPH_FILTER_MAX_VALUES)
+        }
+        return await self._get_ids_in_batches(
+            requests, GroupCollectionResponse, "Group", lambda group: group.display_name
+        )
+
+    async def _get_ids_in_batches(
+        self,
+        requests: Dict[Tuple[str, ...], "RequestInformation"],
+        response_type: Type[Any],
+        principal_type: str,
+        get_identifier: Callable[[Any], Optional[str]],
+    ) -> Dict[str, Union[str, AzureGraphClientError]]:
+        """
+        Sends the lookup requests in batches of at most `GRAPH_BATCH_MAX_REQUESTS` and matches the principals
+        returned by each of them to the identifiers it looked for.
+
+        Args:
+            requests: The lookup requests, keyed by the identifiers of the principals they look for.
+            response_type: The collection response type returned by the lookups.
+            principal_type: The kind of principal being looked up, used in error messages.
+            get_identifier: Returns the identifier of a returned principal, i.e. the field the lookup filters on.
+
+        Returns:
+            A dictionary mapping each identifier to the ID found or to an AzureGraphClientError.
+        """
+        from msgraph_core.requests.batch_request_content import BatchRequestContent
+        from msgraph_core.requests.batch_request_item import BatchRequestItem
+
+        def lookup_error(identifier: str) -> AzureGraphClientError:
+            return AzureGraphClientError(
+                f"An unexpected error occurred while getting {principal_type.lower()} ID for {identifier}."
             )
-            response = await self.graph_service_client.groups.get(request_configuration=request_configuration)
-
-            if not response or not response.value or len(response.value) == 0 or not response.value[0].id:
-                error_msg = f"Group {group_name} not found on the configured Azure tenant"
-                logger.error(error_msg)
-                raise AzureGraphClientError(error_msg)
-
-            return response.value[0].id
-        except AzureGraphClientError:
-            raise
-        except Exception as e:
-            error_msg = f"An unexpected error occurred while getting group ID for {group_name}."
-            logger.error("An unexpected error occurred while getting group ID for {}. Details: {}", group_name, e)
-            raise AzureGraphClientError(error_msg) from e
+
+        results: Dict[str, Union[str, AzureGraphClientError]] = {}
+        chunks = list(requests)
+        for start in range(0, len(chunks), GRAPH_BATCH_MAX_REQUESTS):
+            batch_items = {
+                chunk: BatchRequestItem(request_information=requests[chunk])
+                for chunk in chunks[start : start + GRAPH_BATCH_MAX_REQUESTS]
+            }
+            batch_content = BatchRequestContent()
+            for item in batch_items.values():
+                batch_content.add_request(item.id, item)
+
+            try:
+                batch_response = await self.graph_service_client.batch.post(batch_content)
+            except Exception as e:
+                logger.error("An unexpected error occurred while sending a batch of lookups. Details: {}", e)
+                for chunk in batch_items:
+                    for identifier in chunk:
+                        error = lookup_error(identifier)
+                        error.__cause__ = e
+                        results[identifier] = error
+                continue
+
+            for chunk, item in batch_items.items():
+                item_response = (batch_response.responses or {}).get(item.id)
+                if item_response is None or item_response.status is None or item_response.status >= 400:
+                    status = item_response.status if item_response is not None else None
+                    logger.error("Lookup of {}s {} failed with status {}", principal_type.lower(), chunk, status)
+                    for identifier in chunk:
+                        results[identifier] = lookup_error(identifier)
+                    continue
+
+                # Graph compares these fields case-insensitively. If several principals match, the first one is kept
+                found: Dict[str, str] = {}
+                response = batch_response.get_response_by_id(item.id, response_type)
+                for principal in (response.value if response else None) or []:
+                    principal_identifier = get_identifier(principal)
+                    if principal_identifier and principal.id:
+                        found.setdefault(principal_identifier.lower(), principal.id)
+
+                for identifier in chunk:
+                    principal_id = found.get(identifier.lower())
+                    if principal_id is None:
+                        error_msg = f"{principal_type} {identifier} not found on the configured Azure tenant"
+                        logger.error(error_msg)
+                        results[identifier] = AzureGraphClientError(error_msg)
+                    else:
+                        results[identifier] = principal_id
+        return results
+
+
+def _escape_odata(value: str) -> str:
+    """Escapes a value to be used as a string literal in an OData filter."""
+    return value.replace("'", "''")
+
+
+def _odata_in_filter(field: str, values: Iterable[str]) -> str:
+    """Builds an OData filter matching the principals whose `field` is any of `values`."""
+    return f"{field} in (" + ",".join(f"'{_escape_odata(value)}'" for value in values) + ")"
+
+
+def _chunks(values: Iterable[str], size: int) -> Iterator[Tuple[str, ...]]:
+    """Splits the distinct `values` in tuples of at most `size` elements."""
+    distinct = list(dict.fromkeys(values))
+    for start in range(0, len(distinct), size):
+        yield tuple(distinct[start : start + size])
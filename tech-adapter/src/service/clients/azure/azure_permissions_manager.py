@@ -1,26 +1,111 @@
-from typing import List
+import asyncio
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional, Sequence, Tuple
 
+from anyio import to_thread
 from azure.core.exceptions import ResourceExistsError
 from azure.mgmt.authorization import AuthorizationManagementClient
+from azure.mgmt.authorization.aio import AuthorizationManagementClient as AsyncAuthorizationManagementClient
 from azure.mgmt.authorization.models import PrincipalType, RoleAssignment, RoleAssignmentCreateParameters
 from loguru import logger
 
 from src.models.databricks.exceptions import AzurePermissionsError
 
+# How long the role assignments retrieved for a principal on a resource are reused, in seconds
+ROLE_ASSIGNMENTS_CACHE_TTL_SECONDS = 30.0
+ROLE_ASSIGNMENTS_CACHE_MAX_SIZE = 512
+# Maximum number of role assignments created concurrently by a bulk assignment
+ROLE_ASSIGNMENTS_MAX_CONCURRENCY = 16
+
+_RoleAssignmentsKey = Tuple[str, str, str, str, str]
+
+# A resource scope, e.g. /subscriptions/<id>/resourceGroups/<rg>/providers/Microsoft.Databricks/workspaces/<name>
+_RESOURCE_SCOPE_PATTERN = re.compile(
+    r"/subscriptions/[^/]+/resourceGroups/([^/]+)/providers/([^/]+)/([^/]+)/([^/]+)/?", re.IGNORECASE
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RoleAssignmentRequest:
+    """
+    A role to assign to a principal on a resource, with the same arguments as
+    `AzurePermissionsManager.assign_permissions`.
+    """
+
+    resource_id: str
+    permission_id: str
+    role_definition_id: str
+    principal_id: str
+    principal_type: PrincipalType
+
 
 class AzurePermissionsManager:
     """
     Manages Azure Role-Based Access Control (RBAC) assignments for resources.
+
+    The role assignments of a principal on a resource are cached for a short time, as the same ones are
+    requested several times while provisioning and ARM reads are rate limited. The cache is emptied whenever
+    a role assignment is created or deleted through this manager.
+
+    Role assignments can also be created from the event loop, through the `_async` methods. They use the async
+    client if one is provided, and otherwise run the sync methods on a worker thread.
     """
 
-    def __init__(self, auth_client: AuthorizationManagementClient):
+    def __init__(
+        self,
+        auth_client: AuthorizationManagementClient,
+        role_assignments_cache_ttl: float = ROLE_ASSIGNMENTS_CACHE_TTL_SECONDS,
+        async_auth_client: Optional[AsyncAuthorizationManagementClient] = None,
+    ):
         """
         Initializes the AzurePermissionsManager.
 
         Args:
             auth_client: An authenticated client for Azure authorization operations.
+            role_assignments_cache_ttl: How long retrieved role assignments are reused, in seconds.
+                Set to 0 to disable the cache.
+            async_auth_client: An authenticated async client for Azure authorization operations, used by
+                the `_async` methods.
         """
         self.auth_client = auth_client
+        self.async_auth_client = async_auth_client
+        self._role_assignments_cache_ttl = role_assignments_cache_ttl
+        self._role_assignments_cache: Dict[_RoleAssignmentsKey, Tuple[float, List[RoleAssignment]]] = {}
+        self._role_assignments_cache_lock = threading.Lock()
+
+    def _get_cached_role_assignments(self, key: _RoleAssignmentsKey) -> Optional[List[RoleAssignment]]:
+        with self._role_assignments_cache_lock:
+            entry = self._role_assignments_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, role_assignments = entry
+            if expires_at <= time.monotonic():
+                del self._role_assignments_cache[key]
+                return None
+            return list(role_assignments)
+
+    def _cache_role_assignments(self, key: _RoleAssignmentsKey, role_assignments: List[RoleAssignment]) -> None:
+        if self._role_assignments_cache_ttl <= 0:
+            return
+        with self._role_assignments_cache_lock:
+            now = time.monotonic()
+            if len(self._role_assignments_cache) >= ROLE_ASSIGNMENTS_CACHE_MAX_SIZE:
+                # Drop the expired entries first, and the oldest one if the cache is still full
+                for cached_key, (expires_at, _) in list(self._role_assignments_cache.items()):
+                    if expires_at <= now:
+                        del self._role_assignments_cache[cached_key]
+                if len(self._role_assignments_cache) >= ROLE_ASSIGNMENTS_CACHE_MAX_SIZE:
+                    del self._role_assignments_cache[next(iter(self._role_assignments_cache))]
+            self._role_assignments_cache[key] = (now + self._role_assignments_cache_ttl, list(role_assignments))
+
+    def _invalidate_role_assignments_cache(self) -> None:
+        with self._role_assignments_cache_lock:
+            self._role_assignments_cache.clear()
 
     def assign_permissions(
         self,
@@ -29,6 +114,7 @@ class AzurePermissionsManager:
         role_definition_id: str,
         principal_id: str,
         principal_type: PrincipalType,
+        check_first: bool = True,
     ) -> None:
         """
         Assigns a role to a principal for a specific resource scope.
@@ -41,51 +127,268 @@ class AzurePermissionsManager:
             role_definition_id: The full resource ID of the role definition to assign.
             principal_id: The object ID of the principal (user, group, or service principal).
             principal_type: The type of the principal (e.g., PrincipalType.USER).
+            check_first: Whether to look for the role assignment among the (cached) role assignments of the
+                principal on the resource first, skipping the creation if it's found.
 
         Raises:
-            AzurePermissionsError: If the role assignment fails for any reason other than
-                                   it already existing.
+            AzurePermissionsError: If the principal ID isn't an object ID, or if the role assignment fails
+                                   for any reason other than it already existing.
         """
+        self._validate_principal_id(principal_id)
+        if check_first and self._is_already_assigned(resource_id, role_definition_id, principal_id):
+            self._log_already_assigned(resource_id, principal_id)
+            return
         try:
-            logger.info(
-                "Assigning permissions for principal [ID: {}, Type: {}] on resource [ID: {}]",
-                principal_id,
-                principal_type,
-                resource_id,
-            )
-            parameters = RoleAssignmentCreateParameters(  # type:ignore[call-arg]
-                role_definition_id=role_definition_id,
-                principal_id=principal_id,
-                principal_type=principal_type,
-            )
+            self._log_assigning(resource_id, principal_id, principal_type)
             self.auth_client.role_assignments.create(
                 scope=resource_id,
                 role_assignment_name=permission_id,
-                parameters=parameters,
+                parameters=self._role_assignment_parameters(role_definition_id, principal_id, principal_type),
             )
-            logger.success(
-                "Successfully assigned role '{}' to principal '{}' on resource '{}'.",
+            self._on_assigned(resource_id, role_definition_id, principal_id)
+        except ResourceExistsError:
+            self._log_already_assigned(resource_id, principal_id)
+        except Exception as e:
+            raise self._assignment_error(resource_id, principal_id, e) from e
+
+    async def assign_permissions_async(
+        self,
+        resource_id: str,
+        permission_id: str,
+        role_definition_id: str,
+        principal_id: str,
+        principal_type: PrincipalType,
+        check_first: bool = True,
+    ) -> None:
+        """
+        Assigns a role to a principal for a specific resource scope without blocking the event loop.
+        It behaves like `assign_permissions`, which is run on a worker thread if there's no async client.
+
+        Args:
+            resource_id: The scope of the resource (e.g., a subscription, resource group, or specific resource).
+            permission_id: A unique GUID for the role assignment name.
+            role_definition_id: The full resource ID of the role definition to assign.
+            principal_id: The object ID of the principal (user, group, or service principal).
+            principal_type: The type of the principal (e.g., PrincipalType.USER).
+            check_first: Whether to look for the role assignment among the (cached) role assignments of the
+                principal on the resource first, skipping the creation if it's found.
+
+        Raises:
+            AzurePermissionsError: If the principal ID isn't an object ID, or if the role assignment fails
+                                   for any reason other than it already existing.
+        """
+        self._validate_principal_id(principal_id)
+        if self.async_auth_client is None:
+            await to_thread.run_sync(
+                self.assign_permissions,
+                resource_id,
+                permission_id,
                 role_definition_id,
                 principal_id,
-                resource_id,
+                principal_type,
+                check_first,
             )
-        except ResourceExistsError:
-            logger.info(
-                "Role assignment already exists for principal [ID: {}] on resource [ID: {}]. Skipping creation.",
-                principal_id,
-                resource_id,
+            return
+
+        if check_first and await to_thread.run_sync(
+            self._is_already_assigned, resource_id, role_definition_id, principal_id
+        ):
+            self._log_already_assigned(resource_id, principal_id)
+            return
+        try:
+            self._log_assigning(resource_id, principal_id, principal_type)
+            await self.async_auth_client.role_assignments.create(
+                scope=resource_id,
+                role_assignment_name=permission_id,
+                parameters=self._role_assignment_parameters(role_definition_id, principal_id, principal_type),
             )
+            self._on_assigned(resource_id, role_definition_id, principal_id)
+        except ResourceExistsError:
+            self._log_already_assigned(resource_id, principal_id)
         except Exception as e:
-            error_msg = (
-                f"Error assigning permissions for principal " f"[ID: {principal_id}] on resource [ID: {resource_id}]"
+            raise self._assignment_error(resource_id, principal_id, e) from e
+
+    @staticmethod
+    def _validate_principal_id(principal_id: str) -> None:
+        """
+        Checks that the principal is identified by its object ID. ARM would otherwise have to resolve it
+        through Microsoft Graph, which is slower and fails while a new principal is still being replicated.
+        """
+        try:
+            uuid.UUID(principal_id)
+        except ValueError as e:
+            error_msg = f"Principal ID '{principal_id}' is not a valid object ID"
+            logger.error(error_msg)
+            raise AzurePermissionsError(error_msg) from e
+
+    def _is_already_assigned(self, resource_id: str, role_definition_id: str, principal_id: str) -> bool:
+        """
+        Checks whether the principal already has the role assigned directly on the resource. Any failure
+        while checking is logged and ignored, letting the caller try to create the role assignment.
+        """
+        scope = _RESOURCE_SCOPE_PATTERN.fullmatch(resource_id)
+        if not scope:
+            return False
+        try:
+            resource_group_name, resource_provider_namespace, resource_type, resource_name = scope.groups()
+            role_assignments = self.get_principal_role_assignments_on_resource(
+                resource_group_name, resource_provider_namespace, resource_type, resource_name, principal_id
             )
-            logger.error(
-                "Error assigning permissions for principal [ID: {}] on resource [ID: {}]. Details: {}",
+        except AzurePermissionsError as e:
+            logger.warning(
+                "Couldn't check the existing role assignments of principal [ID: {}] on resource [ID: {}]. Details: {}",
                 principal_id,
                 resource_id,
                 e,
             )
-            raise AzurePermissionsError(error_msg) from e
+            return False
+
+        # The role definition is compared by its GUID, as it may be given either as a full ID or as the GUID alone
+        role_definition_guid = role_definition_id.rstrip("/").rsplit("/", 1)[-1].lower()
+        normalized_resource_id = resource_id.rstrip("/").lower()
+        return any(
+            ra.role_definition_id
+            and ra.role_definition_id.rsplit("/", 1)[-1].lower() == role_definition_guid
+            # Role assignments inherited from a parent scope are listed too, but they're not on the resource itself
+            and ra.scope
+            and ra.scope.rstrip("/").lower() == normalized_resource_id
+            for ra in role_assignments
+        )
+
+    @staticmethod
+    def _role_assignment_parameters(
+        role_definition_id: str, principal_id: str, principal_type: PrincipalType
+    ) -> RoleAssignmentCreateParameters:
+        return RoleAssignmentCreateParameters(  # type:ignore[call-arg]
+            role_definition_id=role_definition_id,
+            principal_id=principal_id,
+            principal_type=principal_type,
+        )
+
+    @staticmethod
+    def _log_assigning(resource_id: str, principal_id: str, principal_type: PrincipalType) -> None:
+        logger.info(
+            "Assigning permissions for principal [ID: {}, Type: {}] on resource [ID: {}]",
+            principal_id,
+            principal_type,
+            resource_id,
+        )
+
+    def _on_assigned(self, resource_id: str, role_definition_id: str, principal_id: str) -> None:
+        self._invalidate_role_assignments_cache()
+        logger.success(
+            "Successfully assigned role '{}' to principal '{}' on resource '{}'.",
+            role_definition_id,
+            principal_id,
+            resource_id,
+        )
+
+    @staticmethod
+    def _log_already_assigned(resource_id: str, principal_id: str) -> None:
+        logger.info(
+            "Role assignment already exists for principal [ID: {}] on resource [ID: {}]. Skipping creation.",
+            principal_id,
+            resource_id,
+        )
+
+    @staticmethod
+    def _assignment_error(resource_id: str, principal_id: str, error: Exception) -> AzurePermissionsError:
+        logger.error(
+            "Error assigning permissions for principal [ID: {}] on resource [ID: {}]. Details: {}",
+            principal_id,
+            resource_id,
+            error,
+        )
+        return AzurePermissionsError(
+            f"Error assigning permissions for principal [ID: {principal_id}] on resource [ID: {resource_id}]"
+        )
+
+    def assign_permissions_bulk(self, assignments: Sequence[RoleAssignmentRequest]) -> None:
+        """
+        Assigns several roles at once. The role assignments are independent ARM requests, so they're
+        created concurrently on up to `ROLE_ASSIGNMENTS_MAX_CONCURRENCY` threads.
+
+        Args:
+            assignments: The role assignments to create.
+
+        Raises:
+            AzurePermissionsError: If any of the role assignments fails, listing every failure.
+                                   The other role assignments are created anyway.
+        """
+        if not assignments:
+            return
+        if len(assignments) == 1:
+            self._assign(assignments[0])
+            return
+
+        logger.info("Assigning {} roles", len(assignments))
+        errors: List[AzurePermissionsError] = []
+        with ThreadPoolExecutor(max_workers=min(ROLE_ASSIGNMENTS_MAX_CONCURRENCY, len(assignments))) as executor:
+            futures = [executor.submit(self._assign, assignment) for assignment in assignments]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except AzurePermissionsError as e:
+                    errors.append(e)
+        self._raise_bulk_errors(errors, len(assignments))
+
+    async def assign_permissions_bulk_async(self, assignments: Sequence[RoleAssignmentRequest]) -> None:
+        """
+        Assigns several roles at once without blocking the event loop. With an async client, up to
+        `ROLE_ASSIGNMENTS_MAX_CONCURRENCY` role assignments are created concurrently on the event loop.
+        Otherwise, `assign_permissions_bulk` is run on a worker thread.
+
+        Args:
+            assignments: The role assignments to create.
+
+        Raises:
+            AzurePermissionsError: If any of the role assignments fails, listing every failure.
+                                   The other role assignments are created anyway.
+        """
+        if not assignments:
+            return
+        if self.async_auth_client is None:
+            await to_thread.run_sync(self.assign_permissions_bulk, assignments)
+            return
+
+        logger.info("Assigning {} roles", len(assignments))
+        semaphore = asyncio.Semaphore(ROLE_ASSIGNMENTS_MAX_CONCURRENCY)
+
+        async def assign(assignment: RoleAssignmentRequest) -> None:
+            async with semaphore:
+                await self.assign_permissions_async(
+                    resource_id=assignment.resource_id,
+                    permission_id=assignment.permission_id,
+                    role_definition_id=assignment.role_definition_id,
+                    principal_id=assignment.principal_id,
+                    principal_type=assignment.principal_type,
+                )
+
+        results = await asyncio.gather(*(assign(assignment) for assignment in assignments), return_exceptions=True)
+        errors: List[AzurePermissionsError] = []
+        for result in results:
+            if isinstance(result, AzurePermissionsError):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+        self._raise_bulk_errors(errors, len(assignments))
+
+    @staticmethod
+    def _raise_bulk_errors(errors: List[AzurePermissionsError], total: int) -> None:
+        if not errors:
+            return
+        error_msg = f"{len(errors)} of {total} role assignments failed: " + "; ".join(str(error) for error in errors)
+        logger.error(error_msg)
+        raise AzurePermissionsError(error_msg) from errors[0]
+
+    def _assign(self, assignment: RoleAssignmentRequest) -> None:
+        self.assign_permissions(
+            resource_id=assignment.resource_id,
+            permission_id=assignment.permission_id,
+            role_definition_id=assignment.role_definition_id,
+            principal_id=assignment.principal_id,
+            principal_type=assignment.principal_type,
+        )
 
     def get_principal_role_assignments_on_resource(
         self,
@@ -111,6 +414,24 @@ class AzurePermissionsManager:
         Raises:
             AzurePermissionsError: If retrieving the role assignments fails.
         """
+        normalized_principal_id = principal_id.lower()
+        cache_key = (
+            resource_group_name,
+            resource_provider_namespace,
+            resource_type,
+            resource_name,
+            normalized_principal_id,
+        )
+        cached = self._get_cached_role_assignments(cache_key)
+        if cached is not None:
+            logger.info(
+                "Using cached role assignments for principal [ID: {}] on resource [Name: {}, Group: {}].",
+                principal_id,
+                resource_name,
+                resource_group_name,
+            )
+            return cached
+
         logger.info(
             "Retrieving role assignments for principal [ID: {}] on resource [Name: {}, Group: {}].",
             principal_id,
@@ -124,9 +445,13 @@ class AzurePermissionsManager:
                 parent_resource_path="",  # Should be empty
                 resource_type=resource_type,
                 resource_name=resource_name,
+                # Only the assignments of the principal are returned by ARM
+                filter=f"principalId eq '{principal_id}'",
             )
-            # Filter the assignments for the specified principal
-            return [ra for ra in all_assignments if ra.principal_id and ra.principal_id.lower() == principal_id.lower()]
+            # The principal is checked again, in case the filter isn't honoured
+            role_assignments = [
+                ra for ra in all_assignments if ra.principal_id and ra.principal_id.lower() == normalized_principal_id
+            ]
         except Exception as e:
             error_msg = (
                 f"Error retrieving role assignments for principal [ID: {principal_id}] "
@@ -139,6 +464,104 @@ class AzurePermissionsManager:
                 e,
             )
             raise AzurePermissionsError(error_msg) from e
+        self._cache_role_assignments(cache_key, role_assignments)
+        return role_assignments
+
+    def get_role_assignments_on_resource_by_principals(
+        self,
+        resource_group_name: str,
+        resource_provider_namespace: str,
+        resource_type: str,
+        resource_name: str,
+        principal_ids: Collection[str],
+    ) -> Dict[str, List[RoleAssignment]]:
+        """
+        Retrieves the role assignments of several principals on a given Azure resource.
+
+        ARM can only filter role assignments by a single principal, so when more than one principal isn't
+        cached, all the role assignments on the resource are retrieved with a single call and split by principal.
+
+        Args:
+            resource_group_name: The name of the resource group containing the resource.
+            resource_provider_namespace: The provider namespace (e.g., 'Microsoft.Databricks').
+            resource_type: The type of the resource (e.g., 'workspaces').
+            resource_name: The name of the resource.
+            principal_ids: The object IDs of the principals to filter by.
+
+        Returns:
+            A dictionary mapping each principal ID to the list of its RoleAssignment objects.
+
+        Raises:
+            AzurePermissionsError: If retrieving the role assignments fails.
+        """
+        results: Dict[str, List[RoleAssignment]] = {}
+        # Principal IDs are compared case-insensitively, and cached by their lowercase form
+        missing: Dict[str, List[str]] = {}
+        for principal_id in principal_ids:
+            cache_key = (
+                resource_group_name,
+                resource_provider_namespace,
+                resource_type,
+                resource_name,
+                principal_id.lower(),
+            )
+            cached = self._get_cached_role_assignments(cache_key)
+            if cached is not None:
+                results[principal_id] = cached
+            else:
+                missing.setdefault(principal_id.lower(), []).append(principal_id)
+
+        if not missing:
+            return results
+        if len(missing) == 1:
+            # A single principal is better served by the ARM side filter
+            for principal_id in next(iter(missing.values())):
+                results[principal_id] = self.get_principal_role_assignments_on_resource(
+                    resource_group_name, resource_provider_namespace, resource_type, resource_name, principal_id
+                )
+            return results
+
+        logger.info(
+            "Retrieving role assignments for {} principals on resource [Name: {}, Group: {}].",
+            len(missing),
+            resource_name,
+            resource_group_name,
+        )
+        by_principal: Dict[str, List[RoleAssignment]] = {principal_id: [] for principal_id in missing}
+        try:
+            for ra in self.auth_client.role_assignments.list_for_resource(
+                resource_group_name=resource_group_name,
+                resource_provider_namespace=resource_provider_namespace,
+                parent_resource_path="",  # Should be empty
+                resource_type=resource_type,
+                resource_name=resource_name,
+            ):
+                role_assignments = by_principal.get(ra.principal_id.lower()) if ra.principal_id else None
+                if role_assignments is not None:
+                    role_assignments.append(ra)
+        except Exception as e:
+            error_msg = f"Error retrieving role assignments on resource [Name: {resource_name}]."
+            logger.error(
+                "Error retrieving role assignments on resource [Name: {}]. Details: {}",
+                resource_name,
+                e,
+            )
+            raise AzurePermissionsError(error_msg) from e
+
+        for normalized_principal_id, role_assignments in by_principal.items():
+            self._cache_role_assignments(
+                (
+                    resource_group_name,
+                    resource_provider_namespace,
+                    resource_type,
+                    resource_name,
+                    normalized_principal_id,
+                ),
+                role_assignments,
+            )
+            for principal_id in missing[normalized_principal_id]:
+                results[principal_id] = list(role_assignments)
+        return results
 
     def delete_role_assignment(self, workspace_name: str, role_assignment_id: str) -> None:
         """
@@ -151,26 +574,60 @@ class AzurePermissionsManager:
         Raises:
             AzurePermissionsError: If the deletion fails.
         """
+        self._log_deleting(workspace_name, role_assignment_id)
+        try:
+            self.auth_client.role_assignments.delete_by_id(role_assignment_id)
+            self._on_deleted(workspace_name, role_assignment_id)
+        except Exception as e:
+            raise self._deletion_error(workspace_name, role_assignment_id, e) from e
+
+    async def delete_role_assignment_async(self, workspace_name: str, role_assignment_id: str) -> None:
+        """
+        Deletes a specific role assignment by its fully qualified ID without blocking the event loop.
+        It behaves like `delete_role_assignment`, which is run on a worker thread if there's no async client.
+
+        Args:
+            workspace_name: The name of the resource (used for logging).
+            role_assignment_id: The fully qualified ID of the role assignment to delete.
+
+        Raises:
+            AzurePermissionsError: If the deletion fails.
+        """
+        if self.async_auth_client is None:
+            await to_thread.run_sync(self.delete_role_assignment, workspace_name, role_assignment_id)
+            return
+
+        self._log_deleting(workspace_name, role_assignment_id)
+        try:
+            await self.async_auth_client.role_assignments.delete_by_id(role_assignment_id)
+            self._on_deleted(workspace_name, role_assignment_id)
+        except Exception as e:
+            raise self._deletion_error(workspace_name, role_assignment_id, e) from e
+
+    @staticmethod
+    def _log_deleting(workspace_name: str, role_assignment_id: str) -> None:
         logger.info(
             "Deleting role assignment [ID: {}] on resource [Name: {}].",
             role_assignment_id,
             workspace_name,
         )
-        try:
-            self.auth_client.role_assignments.delete_by_id(role_assignment_id)
-            logger.success(
-                "Successfully deleted role assignment [ID: {}] on resource [Name: {}].",
-                role_assignment_id,
-                workspace_name,
-            )
-        except Exception as e:
-            error_msg = (
-                f"Error deleting role assignment [ID: {role_assignment_id}] " f"on resource [Name: {workspace_name}]."
-            )
-            logger.error(
-                "Error deleting role assignment [ID: {}] on resource [Name: {}]. Details: {}",
-                role_assignment_id,
-                workspace_name,
-                e,
-            )
-            raise AzurePermissionsError(error_msg.format(role_assignment_id, workspace_name)) from e
+
+    def _on_deleted(self, workspace_name: str, role_assignment_id: str) -> None:
+        self._invalidate_role_assignments_cache()
+        logger.success(
+            "Successfully deleted role assignment [ID: {}] on resource [Name: {}].",
+            role_assignment_id,
+            workspace_name,
+        )
+
+    @staticmethod
+    def _deletion_error(workspace_name: str, role_assignment_id: str, error: Exception) -> AzurePermissionsError:
+        logger.error(
+            "Error deleting role assignment [ID: {}] on resource [Name: {}]. Details: {}",
+            role_assignment_id,
+            workspace_name,
+            error,
+        )
+        return AzurePermissionsError(
+            f"Error deleting role assignment [ID: {role_assignment_id}] on resource [Name: {workspace_name}]."
+        )
@@ -1,13 +1,20 @@
+import asyncio
+import functools
+import itertools
 import re
+import threading
+import time
 import uuid
+from dataclasses import dataclass
 from enum import StrEnum
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
+from anyio import to_thread
 from azure.mgmt.authorization.models import PrincipalType
 from azure.mgmt.databricks.models import ProvisioningState
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.config import Config
 from loguru import logger
-from pydantic import BaseModel
 
 from src import settings
 from src.models.data_product_descriptor import DataProduct
@@ -15,7 +22,7 @@ from src.models.databricks.databricks_models import DatabricksComponent
 from src.models.databricks.databricks_workspace_info import DatabricksWorkspaceInfo
 from src.models.databricks.exceptions import MapperError
 from src.models.exceptions import WorkspaceHandlerError, build_error_message_from_chained_exception
-from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager
+from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager, RoleAssignmentRequest
 from src.service.clients.azure.azure_workspace_manager import AzureWorkspaceManager
 from src.service.principals_mapping.azure_mapper import AzureMapper
 from src.settings.databricks_tech_adapter_settings import (
@@ -32,12 +39,12 @@ class AuthType(StrEnum):
     OAUTH = "OAUTH"
 
 
-class WorkspaceClientConfigParams(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class WorkspaceClientConfigParams:
     """
     Configuration parameters for creating a Databricks WorkspaceClient.
 
-    This class validates that the correct set of parameters is provided
-    for the chosen authentication type.
+    Each authentication type has its own subclass holding the parameters it requires.
     """
 
     auth_type: AuthType
@@ -45,6 +52,7 @@ class WorkspaceClientConfigParams(BaseModel):
     workspace_name: str  # Used for logging and error messages
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class AzureAuthWorkspaceClientConfigParams(WorkspaceClientConfigParams):
     # --- Azure Service Principal Authentication ---
     # These fields are required when auth_type is AZURE
@@ -53,6 +61,7 @@ class AzureAuthWorkspaceClientConfigParams(WorkspaceClientConfigParams):
     azure_auth_config: AzureAuthSettings
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
 class OAuthWorkspaceClientConfigParams(WorkspaceClientConfigParams):
     # --- Databricks OAuth M2M Authentication ---
     # These fields are required when auth_type is OAUTH
@@ -73,32 +82,41 @@ def create_workspace_client(params: WorkspaceClientConfigParams) -> WorkspaceCli
         An initialized WorkspaceClient.
 
     Raises:
-        WorkspaceClientCreationError: If client initialization fails for any reason.
-        ValueError: If the configuration parameters are invalid for the auth type.
+        WorkspaceHandlerError: If the WorkspaceClient fails to initialize.
+        ValueError: If the type of configuration parameters is not supported.
     """
-    try:
-        logger.info(
-            "Creating WorkspaceClient for workspace '{}' with auth type {}", params.workspace_name, params.auth_type
-        )
+    logger.info(
+        "Creating WorkspaceClient for workspace '{}' with auth type {}", params.workspace_name, params.auth_type
+    )
+
+    credentials: Dict[str, str]
+    match params:
+        case AzureAuthWorkspaceClientConfigParams():
+            credentials = {
+                "azure_client_id": params.azure_auth_config.client_id,
+                "azure_client_secret": params.azure_auth_config.client_secret,
+                "azure_tenant_id": params.azure_auth_config.tenant_id,
+            }
+        case OAuthWorkspaceClientConfigParams():
+            credentials = {
+                "client_id": params.databricks_client_id,
+                "client_secret": params.databricks_client_secret,
+            }
+        # This case should be unreachable, as only the subclasses above are instantiated. It's a programming
+        # error rather than a failure to create the client, so it's not wrapped
+        case _:
+            raise ValueError(f"Invalid auth type: {params.auth_type}")
 
-        if isinstance(params, AzureAuthWorkspaceClientConfigParams):
-            return WorkspaceClient(
-                host=params.workspace_host,
-                azure_client_id=params.azure_auth_config.client_id,
-                azure_client_secret=params.azure_auth_config.client_secret,
-                azure_tenant_id=params.azure_auth_config.tenant_id,
-            )
-        elif isinstance(params, OAuthWorkspaceClientConfigParams):
-            return WorkspaceClient(
+    try:
+        # Shared through WorkspaceClientCache, so the pool is sized after misc.thread_pool_size
+        return WorkspaceClient(
+            config=Config(
                 host=params.workspace_host,
-                client_id=params.databricks_client_id,
-                client_secret=params.databricks_client_secret,
+                max_connections_per_pool=settings.misc.thread_pool_size,
+                **credentials,
             )
-        # This case should be unreachable due to the Enum validation in Pydantic
-        else:
-            raise ValueError(f"Invalid auth type: {params.auth_type}")
-
-    except (ValueError, Exception) as e:
+        )
+    except Exception as e:
         error_msg = f"Error initializing the Workspace Client for {params.workspace_name}"
         logger.error(error_msg)
         raise WorkspaceHandlerError(
@@ -106,19 +124,134 @@ def create_workspace_client(params: WorkspaceClientConfigParams) -> WorkspaceCli
         ) from e
 
 
+def _workspace_client_cache_key(params: WorkspaceClientConfigParams) -> Tuple[str, ...]:
+    """Identifies the workspace and the principal a WorkspaceClient built from `params` authenticates as."""
+    if isinstance(params, AzureAuthWorkspaceClientConfigParams):
+        return (
+            params.auth_type,
+            params.workspace_host,
+            params.azure_auth_config.tenant_id,
+            params.azure_auth_config.client_id,
+        )
+    if isinstance(params, OAuthWorkspaceClientConfigParams):
+        return params.auth_type, params.workspace_host, params.databricks_client_id
+    return params.auth_type, params.workspace_host
+
+
+class WorkspaceClientCache:
+    """
+    Keeps a single WorkspaceClient for each workspace and principal.
+
+    Creating a WorkspaceClient means resolving its configuration, and its first call performs the TLS handshake
+    and the OAuth token exchange. Reusing the client lets the following requests on the same workspace share its
+    connection pool and its cached token. The cache is shared by all requests, so access to it is synchronized.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[str, ...], WorkspaceClient] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(self, params: WorkspaceClientConfigParams) -> WorkspaceClient:
+        """
+        Returns the cached WorkspaceClient for the workspace and principal of `params`, creating it on first use.
+
+        Args:
+            params: The configuration parameters of the WorkspaceClient.
+
+        Returns:
+            An initialized WorkspaceClient.
+
+        Raises:
+            WorkspaceHandlerError: If client initialization fails. Failed clients are not cached.
+        """
+        key = _workspace_client_cache_key(params)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = create_workspace_client(params)
+                self._clients[key] = client
+            return client
+
+    def clear(self) -> None:
+        """Drops all the cached clients, which release their connections once garbage collected."""
+        with self._lock:
+            self._clients.clear()
+
+
+class WorkspaceInfoCache:
+    """
+    Keeps the result of the lookup of each managed workspace for a short time.
+
+    Provisioning a data product looks up the same workspace for each of its components, and every lookup is a
+    round-trip to Azure Resource Manager. Workspaces that are not found or not yet provisioned are kept for a
+    shorter time, as they're expected to change soon. The cache is shared by all requests, so access to it is
+    synchronized.
+    """
+
+    MAX_SIZE = 256
+    TTL_SECONDS = 60.0
+    NEGATIVE_TTL_SECONDS = 5.0
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[float, Optional[DatabricksWorkspaceInfo]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Tuple[bool, Optional[DatabricksWorkspaceInfo]]:
+        """
+        Returns whether a valid entry is stored for `key`, along with the stored workspace information.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, workspace_info = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            return True, workspace_info
+
+    def put(self, key: Tuple[str, str], workspace_info: Optional[DatabricksWorkspaceInfo]) -> None:
+        """
+        Stores the result of a lookup. If the cache is full, the entry closest to expiring is evicted.
+        """
+        succeeded = workspace_info is not None and workspace_info.provisioning_state == ProvisioningState.SUCCEEDED
+        ttl = self.TTL_SECONDS if succeeded else self.NEGATIVE_TTL_SECONDS
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, workspace_info)
+            if len(self._entries) > self.MAX_SIZE:
+                del self._entries[min(self._entries, key=lambda k: self._entries[k][0])]
+
+    def invalidate(self, key: Tuple[str, str]) -> None:
+        """Removes the entry stored for `key`, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry stored in the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
 class AzureWorkspaceHandler:
     """
     Handles the provisioning and management of Azure Databricks workspaces,
     including creation, information retrieval, and permission assignments.
     """
 
-    _DATABRICKS_URL_PATTERN = re.compile(r"(?:https://)?adb-(\d+)\.\d+\.azuredatabricks\.net")
+    # Workspace IDs are ASCII digits. Only the start of the identifier is matched, as URLs may have a path
+    _DATABRICKS_URL_PATTERN = re.compile(r"(?:https://)?adb-(\d+)\.\d+\.azuredatabricks\.net", re.ASCII)
+    _DATABRICKS_URL_PREFIXES = ("adb-", "https://adb-")
 
     def __init__(
         self,
         azure_workspace_manager: AzureWorkspaceManager,
         azure_permissions_manager: AzurePermissionsManager,
         azure_mapper: AzureMapper,
+        workspace_client_cache: Optional[WorkspaceClientCache] = None,
+        workspace_info_cache: Optional[WorkspaceInfoCache] = None,
     ):
         """
         Initializes the WorkspaceHandler.
@@ -127,10 +260,20 @@ class AzureWorkspaceHandler:
             azure_workspace_manager: Client for Azure Databricks workspace operations.
             azure_permissions_manager: Client for managing Azure role assignments.
             azure_mapper: Client for mapping principals to Azure Object IDs.
+            workspace_client_cache: Cache of the WorkspaceClients to reuse. If not set, a new client is created
+                on every call to `get_workspace_client`.
+            workspace_info_cache: Cache of the lookups of managed workspaces. If not set, every call to
+                `get_workspace_info_by_name` on a workspace name queries Azure.
         """
         self.azure_workspace_manager = azure_workspace_manager
         self.azure_permissions_manager = azure_permissions_manager
         self.azure_mapper = azure_mapper
+        self.workspace_client_cache = workspace_client_cache
+        self.workspace_info_cache = workspace_info_cache
+        # Every resource group handled lives in the configured subscription
+        self._resource_groups_prefix = f"/subscriptions/{settings.azure.auth.subscription_id}/resourceGroups/"
+        # Only needed for managed workspaces, so it's checked when one is handled
+        self._permissions_settings = settings.azure.permissions
 
     async def provision_workspace(
         self, data_product: DataProduct, component: DatabricksComponent
@@ -155,46 +298,40 @@ class AzureWorkspaceHandler:
         logger.info("Provisioning and/or retrieving information for component '{}'", component.id)
 
         # Check if workspace info can be retrieved
-        workspace_info = self.get_workspace_info_by_name(component.specific.workspace)
+        workspace_info = await self.get_workspace_info_by_name_async(component.specific.workspace)
 
         # If workspace exists and is unmanaged, return immediately
         if workspace_info and not workspace_info.is_managed:
             logger.info("Component '{}' uses an existing unmanaged workspace. No provisioning needed.", component.id)
             return workspace_info
 
-        if not settings.azure.permissions:
-            error_msg = (
-                "Error, received request workspace is set to be managed, but azure.permissions is not "
-                "configured on Tech Adapter"
-            )
-            logger.error(error_msg)
-            raise WorkspaceHandlerError([error_msg])
-
-        # Create the workspace if it doesn't exist
-        new_workspace_info = await self._create_if_not_exists_databricks_workspace(
-            component, settings.azure.permissions
-        )
+        permissions_settings = self._require_permissions_settings()
 
-        # Assign Azure permissions
-        await self._manage_azure_permissions(
-            new_workspace_info,
-            data_product.dataProductOwner,
-            settings.azure.permissions,
-            settings.azure.permissions.dp_owner_role_definition_id,
-            PrincipalType.USER,
-        )
+        # Create the workspace if it doesn't exist. It was just looked up, so it isn't looked up again
+        if workspace_info:
+            new_workspace_info = workspace_info
+        else:
+            new_workspace_info = await self._create_if_not_exists_databricks_workspace(
+                component, permissions_settings, check_first=False
+            )
 
         # TODO: This is a temporary solution
         dev_group = data_product.devGroup
         if not dev_group.startswith("group:"):
             dev_group = f"group:{dev_group}"
 
-        await self._manage_azure_permissions(
+        # Assign Azure permissions
+        await self._manage_azure_permissions_of_principals(
             new_workspace_info,
-            dev_group,
-            settings.azure.permissions,
-            settings.azure.permissions.dev_group_role_definition_id,
-            PrincipalType.GROUP,
+            [
+                (
+                    data_product.dataProductOwner,
+                    permissions_settings.dp_owner_role_definition_id,
+                    PrincipalType.USER,
+                ),
+                (dev_group, permissions_settings.dev_group_role_definition_id, PrincipalType.GROUP),
+            ],
+            permissions_settings,
         )
 
         return new_workspace_info
@@ -209,32 +346,82 @@ class AzureWorkspaceHandler:
         Returns:
             A DatabricksWorkspaceInfo object if found, otherwise None.
         """
-        match = self._DATABRICKS_URL_PATTERN.match(workspace_identifier)
-        if match:
-            workspace_id = match.group(1)
-            logger.info("Workspace identifier '{}' is a URL. Treating as unmanaged", workspace_identifier)
-            return DatabricksWorkspaceInfo.build_unmanaged(
-                databricks_host=workspace_identifier,
-                id=workspace_id,
-                azure_resource_url=workspace_identifier,
-                provisioning_state=ProvisioningState.SUCCEEDED,
-            )
+        unmanaged_workspace_info = self._unmanaged_workspace_info(workspace_identifier)
+        if unmanaged_workspace_info:
+            return unmanaged_workspace_info
 
-        # If not a URL, assume it's a name and query Azure
-        logger.info(f"Looking up managed workspace with name: '{workspace_identifier}'")
-        if not settings.azure.permissions:
-            error_msg = (
-                "Error, received request workspace is set to be managed, but azure.permissions is not "
-                "configured on Tech Adapter"
-            )
-            logger.error(error_msg)
-            raise WorkspaceHandlerError([error_msg])
+        cache_key = self._workspace_info_cache_key(workspace_identifier)
+        found, workspace_info = self._cached_workspace_info(cache_key)
+        if found:
+            return workspace_info
 
-        managed_resource_group_id = (
-            f"/subscriptions/{settings.azure.auth.subscription_id}/resourceGroups/{workspace_identifier}-rg"
+        workspace_info = self.azure_workspace_manager.get_workspace(
+            workspace_identifier, self._managed_resource_group_id(workspace_identifier)
         )
+        if self.workspace_info_cache is not None:
+            self.workspace_info_cache.put(cache_key, workspace_info)
+        return workspace_info
 
-        return self.azure_workspace_manager.get_workspace(workspace_identifier, managed_resource_group_id)
+    async def get_workspace_info_by_name_async(self, workspace_identifier: str) -> Optional[DatabricksWorkspaceInfo]:
+        """
+        Returns information for a Databricks Workspace from its name or URL without blocking the event loop.
+        It behaves like `get_workspace_info_by_name`.
+
+        Args:
+            workspace_identifier: The workspace name or its full URL.
+
+        Returns:
+            A DatabricksWorkspaceInfo object if found, otherwise None.
+        """
+        unmanaged_workspace_info = self._unmanaged_workspace_info(workspace_identifier)
+        if unmanaged_workspace_info:
+            return unmanaged_workspace_info
+
+        cache_key = self._workspace_info_cache_key(workspace_identifier)
+        found, workspace_info = self._cached_workspace_info(cache_key)
+        if found:
+            return workspace_info
+
+        workspace_info = await self.azure_workspace_manager.get_workspace_async(
+            workspace_identifier, self._managed_resource_group_id(workspace_identifier)
+        )
+        if self.workspace_info_cache is not None:
+            self.workspace_info_cache.put(cache_key, workspace_info)
+        return workspace_info
+
+    def _unmanaged_workspace_info(self, workspace_identifier: str) -> Optional[DatabricksWorkspaceInfo]:
+        """Returns the information of an unmanaged workspace if the identifier is its URL, otherwise None."""
+        # Most identifiers are plain workspace names, which are told apart without running the regex
+        match = (
+            self._DATABRICKS_URL_PATTERN.match(workspace_identifier)
+            if workspace_identifier.startswith(self._DATABRICKS_URL_PREFIXES)
+            else None
+        )
+        if not match:
+            return None
+        logger.info("Workspace identifier '{}' is a URL. Treating as unmanaged", workspace_identifier)
+        return DatabricksWorkspaceInfo.build_unmanaged(
+            databricks_host=workspace_identifier,
+            id=match.group(1),
+            azure_resource_url=workspace_identifier,
+            provisioning_state=ProvisioningState.SUCCEEDED,
+        )
+
+    def _cached_workspace_info(self, cache_key: Tuple[str, str]) -> Tuple[bool, Optional[DatabricksWorkspaceInfo]]:
+        """
+        Looks up a managed workspace in the cache, failing if managed workspaces aren't configured.
+        Returns whether it was found, along with its cached information.
+        """
+        workspace_name = cache_key[0]
+        logger.info("Looking up managed workspace with name: '{}'", workspace_name)
+        self._require_permissions_settings()
+
+        if self.workspace_info_cache is None:
+            return False, None
+        found, workspace_info = self.workspace_info_cache.get(cache_key)
+        if found:
+            logger.debug("Using cached lookup of workspace '{}'", workspace_name)
+        return found, workspace_info
 
     def get_workspace_info(self, component: DatabricksComponent) -> Optional[DatabricksWorkspaceInfo]:
         """
@@ -262,7 +449,8 @@ class AzureWorkspaceHandler:
 
     def get_workspace_client(self, databricks_workspace_info: DatabricksWorkspaceInfo) -> WorkspaceClient:
         """
-        Creates a WorkspaceClient for interacting with a Databricks workspace.
+        Creates a WorkspaceClient for interacting with a Databricks workspace, or reuses the one
+        already created for it if a WorkspaceClientCache is configured.
 
         Args:
             databricks_workspace_info: The information object for the target workspace.
@@ -280,33 +468,56 @@ class AzureWorkspaceHandler:
                 databricks_auth_config=settings.databricks.auth,
                 azure_auth_config=settings.azure.auth,
             )
+            if self.workspace_client_cache is not None:
+                return self.workspace_client_cache.get_or_create(config_params)
             return create_workspace_client(config_params)
         except Exception as e:
             error_msg = f"Failed to create Databricks workspace client for '{databricks_workspace_info.name}'"
             logger.error(error_msg)
             raise WorkspaceHandlerError([error_msg]) from e
 
+    def _require_permissions_settings(self) -> AzurePermissionsSettings:
+        """Returns the azure.permissions settings, which managed workspaces require, failing if they're not set."""
+        if not self._permissions_settings:
+            error_msg = (
+                "Error, received request workspace is set to be managed, but azure.permissions is not "
+                "configured on Tech Adapter"
+            )
+            logger.error(error_msg)
+            raise WorkspaceHandlerError([error_msg])
+        return self._permissions_settings
+
+    def _workspace_info_cache_key(self, workspace_name: str) -> Tuple[str, str]:
+        """Identifies a managed workspace in the cache of workspace lookups."""
+        return workspace_name, settings.azure.auth.subscription_id
+
+    def _managed_resource_group_id(self, workspace_name: str) -> str:
+        """Returns the ID of the resource group managed by Azure Databricks for a workspace."""
+        return self._resource_groups_prefix + workspace_name + "-rg"
+
     async def _create_if_not_exists_databricks_workspace(
-        self, component: DatabricksComponent, permissions_settings: AzurePermissionsSettings
+        self, component: DatabricksComponent, permissions_settings: AzurePermissionsSettings, check_first: bool = True
     ) -> DatabricksWorkspaceInfo:
         """Creates a managed Azure Databricks workspace if it doesn't already exist.
 
         Args:
             permissions: Azure permission settings
+            check_first: Whether to look for the workspace before creating it
         """
         try:
             workspace_name = component.specific.workspace
-            managed_resource_group_id = (
-                f"/subscriptions/{settings.azure.auth.subscription_id}/resourceGroups/{workspace_name}-rg"
-            )
-
-            return await self.azure_workspace_manager.create_if_not_exists_workspace(
+            workspace_info = await self.azure_workspace_manager.create_if_not_exists_workspace(
                 workspace_name=workspace_name,
                 region="westeurope",
                 existing_resource_group_name=permissions_settings.resource_group,
-                managed_resource_group_id=managed_resource_group_id,
+                managed_resource_group_id=self._managed_resource_group_id(workspace_name),
                 sku_type=settings.azure.auth.sku_type,
+                check_first=check_first,
             )
+            # A previous lookup may have cached the workspace as not existing yet
+            if self.workspace_info_cache is not None:
+                self.workspace_info_cache.invalidate(self._workspace_info_cache_key(workspace_name))
+            return workspace_info
         except Exception as e:
             error_msg = f"An error occurred while creating workspace for component '{component.name}'"
             logger.error(
@@ -323,104 +534,163 @@ class AzureWorkspaceHandler:
         principal_type: PrincipalType,
     ) -> None:
         """Manages Azure role assignments for a given entity on the workspace resource."""
-        if not role_definition_id:
-            logger.info("No role definition ID provided for entity '{}'. Skipping permission management.", entity)
+        await self._manage_azure_permissions_of_principals(
+            databricks_workspace_info, [(entity, role_definition_id, principal_type)], permissions_settings
+        )
+
+    async def _manage_azure_permissions_of_principals(
+        self,
+        databricks_workspace_info: DatabricksWorkspaceInfo,
+        principals: Sequence[Tuple[str, str, PrincipalType]],
+        permissions_settings: AzurePermissionsSettings,
+    ) -> None:
+        """
+        Manages Azure role assignments for several entities on the workspace resource. Each principal is
+        a tuple of entity, role definition ID and principal type. The entities are mapped together, and
+        the roles to assign are created in bulk.
+        """
+        to_manage = []
+        for entity, role_definition_id, principal_type in principals:
+            if not role_definition_id:
+                logger.info("No role definition ID provided for entity '{}'. Skipping permission management.", entity)
+                continue
+            logger.info(
+                "Managing permissions for {} on workspace {}. Assigning role definition {}",
+                entity,
+                databricks_workspace_info.name,
+                role_definition_id,
+            )
+            to_manage.append((entity, role_definition_id, principal_type))
+        if not to_manage:
             return
 
-        logger.info(
-            "Managing permissions for {} on workspace {}. Assigning role definition {}",
-            entity,
-            databricks_workspace_info.name,
-            role_definition_id,
+        try:
+            # Map the user/group names to their Azure Object IDs
+            entity_map = await self.azure_mapper.map({entity for entity, _, _ in to_manage})
+        except Exception as e:
+            raise self._permissions_error(
+                databricks_workspace_info, ", ".join(entity for entity, _, _ in to_manage), e
+            ) from e
+
+        # Managed workspaces carry the resource ID returned by Azure
+        resource_id = databricks_workspace_info.azure_resource_id or (
+            f"{self._resource_groups_prefix}{permissions_settings.resource_group}/"
+            f"providers/Microsoft.Databricks/workspaces/{databricks_workspace_info.name}"
         )
+        assignments: List[RoleAssignmentRequest] = []
+        assigned_entities: List[str] = []
+        entity_ids_to_clean: Dict[str, str] = {}
+        for entity, role_definition_id, principal_type in to_manage:
+            try:
+                entity_id = entity_map.get(entity)
+                if not entity_id:
+                    error_msg = "Error while mapping principals. Failed to retrieve outcome of mapping"
+                    logger.error(error_msg)
+                    raise WorkspaceHandlerError([error_msg])
+
+                if isinstance(entity_id, MapperError):
+                    raise entity_id  # Propagate the mapping error
+
+                if role_definition_id.lower() == "no_permissions":
+                    entity_ids_to_clean[entity] = entity_id
+                    continue
+            except Exception as e:
+                raise self._permissions_error(databricks_workspace_info, entity, e) from e
+
+            assignments.append(
+                RoleAssignmentRequest(
+                    resource_id=resource_id,
+                    permission_id=self._role_assignment_name(resource_id, role_definition_id, entity_id),
+                    role_definition_id=role_definition_id,
+                    principal_id=entity_id,
+                    principal_type=principal_type,
+                )
+            )
+            assigned_entities.append(entity)
 
-        try:
-            # Map the user/group name to its Azure Object ID
-            entity_map = await self.azure_mapper.map({entity})
-            entity_id = entity_map.get(entity)
-            if not entity_id:
-                error_msg = "Error while mapping principals. Failed to retrieve outcome of mapping"
-                logger.error(error_msg)
-                raise WorkspaceHandlerError([error_msg])
-
-            if isinstance(entity_id, MapperError):
-                raise entity_id  # Propagate the mapping error
-
-            if role_definition_id.lower() == "no_permissions":
-                self._handle_no_permissions(databricks_workspace_info, entity_id, permissions_settings)
-            else:
-                self._assign_permissions_to_entity(
-                    databricks_workspace_info, entity_id, role_definition_id, principal_type, permissions_settings
+        if entity_ids_to_clean:
+            try:
+                await self._handle_no_permissions(
+                    databricks_workspace_info, list(entity_ids_to_clean.values()), permissions_settings
                 )
+            except Exception as e:
+                raise self._permissions_error(databricks_workspace_info, ", ".join(entity_ids_to_clean), e) from e
 
+        try:
+            # The role assignments are independent, so they're created concurrently
+            await self.azure_permissions_manager.assign_permissions_bulk_async(assignments)
         except Exception as e:
-            error_msg = (
-                f"An error occurred while handling permissions for {entity} "
-                f"on Azure resource '{databricks_workspace_info}'"
-            )
-            logger.error(
-                "An error occurred while handling permissions for {} on Azure resource '{}'. Details: {}",
-                entity,
-                databricks_workspace_info.name,
-                e,
-            )
-            raise WorkspaceHandlerError([error_msg]) from e
+            raise self._permissions_error(databricks_workspace_info, ", ".join(assigned_entities), e) from e
 
-    def _handle_no_permissions(
+    @staticmethod
+    def _role_assignment_name(resource_id: str, role_definition_id: str, principal_id: str) -> str:
+        """
+        Derives the name of a role assignment from its scope, role and principal. Retrying an assignment reuses
+        the same name, so that Azure sees it as the same role assignment. IDs are compared case-insensitively.
+        """
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, f"{resource_id}|{role_definition_id}|{principal_id}".lower()))
+
+    @staticmethod
+    def _permissions_error(
+        databricks_workspace_info: DatabricksWorkspaceInfo, entities: str, error: Exception
+    ) -> WorkspaceHandlerError:
+        """Logs a failure while handling the permissions of some entities and builds the error to raise."""
+        error_msg = (
+            f"An error occurred while handling permissions for {entities} "
+            f"on Azure resource '{databricks_workspace_info}'"
+        )
+        logger.error(
+            "An error occurred while handling permissions for {} on Azure resource '{}'. Details: {}",
+            entities,
+            databricks_workspace_info.name,
+            error,
+        )
+        return WorkspaceHandlerError([error_msg])
+
+    async def _handle_no_permissions(
         self,
         databricks_workspace_info: DatabricksWorkspaceInfo,
-        entity_id: str,
+        entity_ids: Sequence[str],
         permissions_settings: AzurePermissionsSettings,
     ) -> None:
-        """Removes all role assignments for a principal on the workspace resource."""
+        """Removes all role assignments for some principals on the workspace resource."""
         logger.info(
-            "Configuration is 'no_permissions'. Removing all roles for principal {} on workspace {}",
-            entity_id,
+            "Configuration is 'no_permissions'. Removing all roles for principals {} on workspace {}",
+            entity_ids,
             databricks_workspace_info.name,
         )
 
-        permissions = self.azure_permissions_manager.get_principal_role_assignments_on_resource(
-            resource_group_name=permissions_settings.resource_group,
-            resource_provider_namespace="Microsoft.Databricks",
-            resource_type="workspaces",
-            resource_name=databricks_workspace_info.name,
-            principal_id=entity_id,
+        # The role assignments of all the principals are retrieved at once
+        permissions_by_principal = await to_thread.run_sync(
+            functools.partial(
+                self.azure_permissions_manager.get_role_assignments_on_resource_by_principals,
+                resource_group_name=permissions_settings.resource_group,
+                resource_provider_namespace="Microsoft.Databricks",
+                resource_type="workspaces",
+                resource_name=databricks_workspace_info.name,
+                principal_ids=entity_ids,
+            )
         )
 
+        # The deletions are independent, so they're performed concurrently
+        results = await asyncio.gather(
+            *(
+                self.azure_permissions_manager.delete_role_assignment_async(
+                    workspace_name=databricks_workspace_info.name, role_assignment_id=role_assignment.id
+                )
+                for role_assignment in itertools.chain.from_iterable(permissions_by_principal.values())
+                if role_assignment.id and databricks_workspace_info.name in role_assignment.id  # type:ignore
+            ),
+            return_exceptions=True,
+        )
         errors: list[Exception] = []
-        for role_assignment in permissions:
-            if role_assignment.id and databricks_workspace_info.name in role_assignment.id:  # type:ignore
-                try:
-                    self.azure_permissions_manager.delete_role_assignment(
-                        workspace_name=databricks_workspace_info.name, role_assignment_id=role_assignment.id
-                    )
-                except Exception as e:
-                    errors.append(e)
+        for result in results:
+            if isinstance(result, Exception):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
         if errors:
             logger.error("{} errors found while deleting role assignments: {}", len(errors), errors)
             raise WorkspaceHandlerError([build_error_message_from_chained_exception(error) for error in errors])
 
-        logger.info("Removed role assignments for {} on Azure resource {}", entity_id, databricks_workspace_info.name)
-
-    def _assign_permissions_to_entity(
-        self,
-        databricks_workspace_info: DatabricksWorkspaceInfo,
-        entity_id: str,
-        role_definition_id: str,
-        principal_type: PrincipalType,
-        permissions_settings: AzurePermissionsSettings,
-    ) -> None:
-        """Assigns a specific role to a principal on the workspace resource."""
-        resource_id = (
-            f"/subscriptions/{settings.azure.auth.subscription_id}/"
-            f"resourceGroups/{permissions_settings.resource_group}/"
-            f"providers/Microsoft.Databricks/workspaces/{databricks_workspace_info.name}"
-        )
-
-        self.azure_permissions_manager.assign_permissions(
-            resource_id=resource_id,
-            permission_id=str(uuid.uuid4()),
-            role_definition_id=role_definition_id,
-            principal_id=entity_id,
-            principal_type=principal_type,
-        )
+        logger.info("Removed role assignments for {} on Azure resource {}", entity_ids, databricks_workspace_info.name)
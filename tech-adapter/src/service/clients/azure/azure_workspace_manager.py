@@ -1,6 +1,6 @@
 from typing import Optional
 
-from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.mgmt.databricks import AzureDatabricksManagementClient
 from azure.mgmt.databricks.aio import AzureDatabricksManagementClient as AsyncAzureDatabricksManagementClient
 from azure.mgmt.databricks.models import ProvisioningState, Sku, Workspace
@@ -34,6 +34,11 @@ class AzureWorkspaceManager:
         """
         self.sync_azure_databricks_manager = sync_azure_databricks_manager
         self.async_azure_databricks_manager = async_azure_databricks_manager
+        # Managed workspaces are provisioned in the resource group of azure.permissions, which is optional.
+        # Settings don't change while the application runs, so it's read once
+        self._workspaces_resource_group = (
+            settings.azure.permissions.resource_group if settings.azure.permissions else None
+        )
 
     async def create_if_not_exists_workspace(
         self,
@@ -42,6 +47,7 @@ class AzureWorkspaceManager:
         existing_resource_group_name: str,
         managed_resource_group_id: str,
         sku_type: SkuType,
+        check_first: bool = True,
     ) -> DatabricksWorkspaceInfo:
         """
         Creates a new Azure Databricks workspace if it does not already exist.
@@ -52,6 +58,8 @@ class AzureWorkspaceManager:
             existing_resource_group_name: The name of the resource group for the workspace.
             managed_resource_group_id: The resource ID for the managed resource group.
             sku_type: The SKU for the workspace (e.g., SkuType.PREMIUM).
+            check_first: Whether to look for the workspace first, returning it if it's found. Callers that have
+                just looked it up without finding it can skip the lookup.
 
         Returns:
             A DatabricksWorkspaceInfo object for the existing or newly created workspace.
@@ -60,20 +68,13 @@ class AzureWorkspaceManager:
             WorkspaceManagerError: If workspace creation fails or checking for existence fails.
         """
         try:
-            existing_workspace = self.get_workspace(workspace_name, managed_resource_group_id)
-            if existing_workspace:
-                logger.info("Workspace '{}' already exists. Skipping creation.", workspace_name)
-                return existing_workspace
+            if check_first:
+                existing_workspace = await self.get_workspace_async(workspace_name, managed_resource_group_id)
+                if existing_workspace:
+                    logger.info("Workspace '{}' already exists. Skipping creation.", workspace_name)
+                    return existing_workspace
 
             logger.info("Creating workspace '{}' in region '{}'.", workspace_name, region)
-            if not settings.azure.permissions:
-                error_msg = (
-                    "Error, received request workspace is set to be managed, but azure.permissions is not "
-                    "configured on Tech Adapter"
-                )
-                logger.error(error_msg)
-                raise AzureWorkspaceManagerError(error_msg)
-
             workspace_parameters = Workspace(
                 location=region,
                 managed_resource_group_id=managed_resource_group_id,
@@ -98,21 +99,7 @@ class AzureWorkspaceManager:
 
             logger.success("Workspace '{}' is now available at: {}", new_workspace.name, new_workspace.workspace_url)
 
-            resource_id = (
-                f"/subscriptions/{settings.azure.auth.subscription_id}/resourceGroups/"
-                f"{settings.azure.permissions.resource_group}/providers/Microsoft.Databricks/workspaces/"
-                f"{new_workspace.name}"
-            )
-            azure_url = f"https://portal.azure.com/#@{settings.azure.auth.tenant_id}/resource/{resource_id}"
-
-            return DatabricksWorkspaceInfo.build_managed(
-                name=new_workspace.name,  # type:ignore[arg-type]
-                id=new_workspace.workspace_id,  # type:ignore[arg-type]
-                databricks_host=new_workspace.workspace_url,  # type:ignore[arg-type]
-                azure_resource_id=new_workspace.id,  # type:ignore[arg-type]
-                azure_resource_url=azure_url,
-                provisioning_state=new_workspace.provisioning_state,  # type:ignore[arg-type]
-            )
+            return self._build_workspace_info(new_workspace, existing_resource_group_name)
         except AzureWorkspaceManagerError:
             raise
         except ResourceExistsError as e:
@@ -133,8 +120,8 @@ class AzureWorkspaceManager:
         """
         Retrieves information about an existing Azure Databricks workspace.
 
-        It searches for a workspace matching the given name and managed resource group ID
-        (both case-insensitively).
+        The workspace is read directly from the resource group where workspaces are provisioned, and it's
+        considered found only if its managed resource group ID matches the given one (case-insensitively).
 
         Args:
             workspace_name: The name of the workspace to retrieve.
@@ -146,53 +133,113 @@ class AzureWorkspaceManager:
         Raises:
             WorkspaceManagerError: If an unexpected error occurs during the API call.
         """
-        if not settings.azure.permissions:
-            error_msg = (
-                "azure.permissions is not configured on the Tech Adapter. Cannot retrieve information about workspaces"
-            )
-            logger.error(error_msg)
-            raise AzureWorkspaceManagerError(error_msg)
-
+        resource_group = self._get_workspaces_resource_group()
         logger.info(
             "Searching for workspace '{}' in managed resource group '{}'", workspace_name, managed_resource_group_id
         )
         try:
-            workspaces_iterator = self.sync_azure_databricks_manager.workspaces.list_by_subscription()
-
-            # Find the first workspace that matches the criteria (case-insensitive).
-            found_workspace: Optional[Workspace] = next(
-                (
-                    ws
-                    for ws in workspaces_iterator
-                    if ws.name.lower() == workspace_name.lower()  # type:ignore[attr-defined]
-                    and ws.managed_resource_group_id.lower() == managed_resource_group_id.lower()
-                ),
-                None,  # Default value if no item is found
+            try:
+                found_workspace: Workspace = self.sync_azure_databricks_manager.workspaces.get(
+                    resource_group_name=resource_group,
+                    workspace_name=workspace_name,
+                )
+            except ResourceNotFoundError:
+                logger.warning("Workspace '{}' not found.", workspace_name)
+                return None
+            return self._matching_workspace_info(
+                found_workspace, workspace_name, managed_resource_group_id, resource_group
             )
+        except Exception as e:
+            raise self._get_workspace_error(workspace_name) from e
+
+    async def get_workspace_async(
+        self, workspace_name: str, managed_resource_group_id: str
+    ) -> Optional[DatabricksWorkspaceInfo]:
+        """
+        Retrieves information about an existing Azure Databricks workspace without blocking the event loop.
+        It behaves like `get_workspace`, using the async client.
+
+        Args:
+            workspace_name: The name of the workspace to retrieve.
+            managed_resource_group_id: The managed resource group ID for the workspace.
+
+        Returns:
+            A DatabricksWorkspaceInfo object if the workspace exists, otherwise None.
 
-            if not found_workspace:
+        Raises:
+            WorkspaceManagerError: If an unexpected error occurs during the API call.
+        """
+        resource_group = self._get_workspaces_resource_group()
+        logger.info(
+            "Searching for workspace '{}' in managed resource group '{}'", workspace_name, managed_resource_group_id
+        )
+        try:
+            try:
+                found_workspace: Workspace = await self.async_azure_databricks_manager.workspaces.get(
+                    resource_group_name=resource_group,
+                    workspace_name=workspace_name,
+                )
+            except ResourceNotFoundError:
                 logger.warning("Workspace '{}' not found.", workspace_name)
                 return None
+            return self._matching_workspace_info(
+                found_workspace, workspace_name, managed_resource_group_id, resource_group
+            )
+        except Exception as e:
+            raise self._get_workspace_error(workspace_name) from e
 
-            logger.success("Found workspace '{}' with ID '{}'.", workspace_name, found_workspace.workspace_id)
-
-            resource_id = (
-                f"/subscriptions/{settings.azure.auth.subscription_id}"
-                f"/resourceGroups/{settings.azure.permissions.resource_group}"
-                f"/providers/Microsoft.Databricks/workspaces/{found_workspace.name}"
+    def _get_workspaces_resource_group(self) -> str:
+        """Returns the resource group where workspaces are provisioned, failing if it's not configured."""
+        if self._workspaces_resource_group is None:
+            error_msg = (
+                "azure.permissions is not configured on the Tech Adapter. Cannot retrieve information about workspaces"
             )
-            azure_url = f"https://portal.azure.com/#@{settings.azure.auth.tenant_id}" f"/resource/{resource_id}"
-
-            return DatabricksWorkspaceInfo.build_managed(
-                name=found_workspace.name,  # type:ignore[arg-type]
-                id=found_workspace.workspace_id,  # type:ignore[arg-type]
-                databricks_host=found_workspace.workspace_url,  # type:ignore[arg-type]
-                azure_resource_id=found_workspace.id,  # type:ignore[arg-type]
-                azure_resource_url=azure_url,
-                provisioning_state=found_workspace.provisioning_state,  # type:ignore[arg-type]
+            logger.error(error_msg)
+            raise AzureWorkspaceManagerError(error_msg)
+        return self._workspaces_resource_group
+
+    def _matching_workspace_info(
+        self, workspace: Workspace, workspace_name: str, managed_resource_group_id: str, resource_group: str
+    ) -> Optional[DatabricksWorkspaceInfo]:
+        """Builds the information of a found workspace, if its managed resource group is the expected one."""
+        found_managed_resource_group_id = workspace.managed_resource_group_id or ""
+        if found_managed_resource_group_id.lower() != managed_resource_group_id.lower():
+            logger.warning(
+                "Workspace '{}' was found, but its managed resource group '{}' is not the expected '{}'.",
+                workspace_name,
+                found_managed_resource_group_id,
+                managed_resource_group_id,
             )
+            return None
 
-        except Exception as e:
-            error_msg = f"An error occurred while getting info for workspace '{workspace_name}'"
-            logger.error(error_msg)
-            raise AzureWorkspaceManagerError(error_msg) from e
+        logger.success("Found workspace '{}' with ID '{}'.", workspace_name, workspace.workspace_id)
+        return self._build_workspace_info(workspace, resource_group)
+
+    @staticmethod
+    def _get_workspace_error(workspace_name: str) -> AzureWorkspaceManagerError:
+        error_msg = f"An error occurred while getting info for workspace '{workspace_name}'"
+        logger.error(error_msg)
+        return AzureWorkspaceManagerError(error_msg)
+
+    @staticmethod
+    def _build_workspace_info(workspace: Workspace, resource_group: str) -> DatabricksWorkspaceInfo:
+        """
+        Builds the information of a managed workspace returned by Azure.
+
+        The ARM resource ID of the workspace is stored on the returned object, so that callers reuse it
+        instead of formatting it again.
+        """
+        resource_id = workspace.id or (
+            f"/subscriptions/{settings.azure.auth.subscription_id}/resourceGroups/{resource_group}"
+            f"/providers/Microsoft.Databricks/workspaces/{workspace.name}"
+        )
+        azure_url = f"https://portal.azure.com/#@{settings.azure.auth.tenant_id}/resource/{resource_id}"
+
+        return DatabricksWorkspaceInfo.build_managed(
+            name=workspace.name,  # type:ignore[arg-type]
+            id=workspace.workspace_id,  # type:ignore[arg-type]
+            databricks_host=workspace.workspace_url,  # type:ignore[arg-type]
+            azure_resource_id=resource_id,
+            azure_resource_url=azure_url,
+            provisioning_state=workspace.provisioning_state,  # type:ignore[arg-type]
+        )
@@ -1,3 +1,5 @@
+import time
+
 from azure.core.pipeline.policies._utils import get_retry_after
 from azure.core.polling.base_polling import OperationFailed, _failed, _raise_if_bad_http_status_and_method
 from azure.mgmt.core.polling.async_arm_polling import (
@@ -11,16 +13,36 @@ class VerboseAsyncARMPolling(AsyncARMPolling):
     Custom implementation of AsyncARMPolling where we add a debug logging message during the polling.
     The rest of the _poll implementation is left as-is.
     https://github.com/Azure/azure-sdk-for-python/blob/main/doc/dev/customize_long_running_operation.md
+
+    The server's Retry-After is often much longer than the operation itself, so during the first
+    `aggressive_window` seconds the status is polled more often: starting every `initial_interval` seconds
+    and doubling the interval at each poll, but never waiting longer than the server asks to.
+    Afterwards, the server's Retry-After is honored.
     """
 
     def __init__(
         self,
         operation_description: str,
         timeout: float = 30,
+        initial_interval: float = 1.0,
+        aggressive_window: float = 60.0,
     ):
         self.operation_description = operation_description
+        self.initial_interval = initial_interval
+        self.aggressive_window = aggressive_window
+        self._poll_count = 0
+        self._started_at = time.monotonic()
         super().__init__(timeout)
 
+    def _extract_delay(self) -> float:
+        """Returns how long to wait before the next poll."""
+        server_delay = get_retry_after(self._pipeline_response) or self._timeout
+        if time.monotonic() - self._started_at >= self.aggressive_window:
+            return server_delay
+        delay = min(self.initial_interval * 2**self._poll_count, server_delay)
+        self._poll_count += 1
+        return delay
+
     async def _poll(self) -> None:
         """Poll status of operation so long as operation is incomplete and
         we have an endpoint to query.
@@ -31,15 +53,18 @@ class VerboseAsyncARMPolling(AsyncARMPolling):
         :raises: BadStatus if response status invalid.
         :raises: BadResponse if response invalid.
         """
+        self._poll_count = 0
+        self._started_at = time.monotonic()
         if not self.finished():
             await self.update_status()
         while not self.finished():
+            delay = self._extract_delay()
             logger.debug(
                 "Long Running Operation '{}' is not yet finished. Sleeping for {}s...",
                 self.operation_description,
-                get_retry_after(self._pipeline_response),
+                delay,
             )
-            await self._delay()
+            await self._sleep(delay)
             await self.update_status()
 
         if _failed(self.status()):
@@ -1,14 +1,22 @@
 from databricks.sdk import AccountClient
+from databricks.sdk.config import Config
 
 from src.settings.databricks_tech_adapter_settings import AppSettings
 
 
 def get_account_client(settings: AppSettings) -> AccountClient:
+    """
+    Builds the Databricks account client shared by all requests, with a connection pool sized after
+    `misc.thread_pool_size`.
+    """
     return AccountClient(
-        auth_type="azure-client-secret",
-        host="https://accounts.azuredatabricks.net/",
-        account_id=settings.databricks.auth.account_id,
-        azure_tenant_id=settings.azure.auth.tenant_id,
-        azure_client_id=settings.azure.auth.client_id,
-        azure_client_secret=settings.azure.auth.client_secret,
+        config=Config(
+            auth_type="azure-client-secret",
+            host="https://accounts.azuredatabricks.net/",
+            account_id=settings.databricks.auth.account_id,
+            azure_tenant_id=settings.azure.auth.tenant_id,
+            azure_client_id=settings.azure.auth.client_id,
+            azure_client_secret=settings.azure.auth.client_secret,
+            max_connections_per_pool=settings.misc.thread_pool_size,
+        )
     )
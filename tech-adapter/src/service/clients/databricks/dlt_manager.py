@@ -1,4 +1,5 @@
-from typing import Dict, Iterable, List
+import itertools
+from typing import Any, Dict, Iterable, List, Optional
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.errors import ResourceConflict, ResourceDoesNotExist
@@ -37,6 +38,9 @@ class DLTManager:
         """
         self.workspace_client = workspace_client
         self.workspace_name = workspace_name
+        # IDs of the pipelines found by name. A manager lives as long as the operation using it, so a
+        # workflow referencing the same pipeline in several tasks looks it up only once
+        self._pipeline_ids: Dict[str, str] = {}
 
     def create_or_update_dlt_pipeline(
         self,
@@ -77,22 +81,56 @@ class DLTManager:
         Raises:
             DLTManagerError: For creation or update failures.
         """
-        existing_pipelines = self.list_pipelines_with_given_name(pipeline_name)
+        self._pipeline_ids.pop(pipeline_name, None)
 
-        if not existing_pipelines:
-            return self._create_dlt_pipeline(
+        # The pipeline settings are the same whether it's created or updated, so they're built and validated
+        # once, before looking for an existing pipeline
+        try:
+            libraries = self._build_pipeline_libraries(notebooks, files)
+            if not libraries:
+                error_msg = (
+                    f"Pipeline {pipeline_name} doesn't contain neither notebooks or files to execute. "
+                    f"A DLT pipeline requires at least one notebook or file."
+                )
+                logger.error(error_msg)
+                raise DLTManagerError(error_msg)
+            pipeline_settings: Dict[str, Any] = dict(
+                name=pipeline_name,
+                edition=product_edition,
+                continuous=continuous,
+                libraries=libraries,
+                catalog=catalog,
+                target=target,
+                clusters=self._build_clusters(cluster_specific),
+                photon=photon,
+                channel=channel,
+                notifications=self._build_notifications(notifications),
+                configuration=(
+                    {var.name: var.value for var in cluster_specific.spark_env_vars}
+                    if cluster_specific.spark_env_vars
+                    else {}
+                ),
+            )
+        except DLTManagerError:
+            raise
+        except Exception as e:
+            error_msg = (
+                f"An error occurred while building the settings of DLT Pipeline {pipeline_name} "
+                f"in {self.workspace_name}."
+            )
+            logger.error(
+                "An error occurred while building the settings of DLT Pipeline {} in {}. Details: {}",
                 pipeline_name,
-                product_edition,
-                continuous,
-                notebooks,
-                files,
-                catalog,
-                target,
-                photon,
-                notifications,
-                channel,
-                cluster_specific,
+                self.workspace_name,
+                e,
             )
+            raise DLTManagerError(error_msg) from e
+
+        # Two results are enough to tell a unique pipeline from a name clash
+        existing_pipelines = self.list_pipelines_with_given_name(pipeline_name, limit=2)
+
+        if not existing_pipelines:
+            return self._upsert_dlt_pipeline(None, pipeline_settings)
 
         if len(existing_pipelines) > 1:
             error_msg = (
@@ -111,20 +149,7 @@ class DLTManager:
             raise DLTManagerError(error_msg)
 
         pipeline_id = existing_pipelines[0].pipeline_id
-        return self._update_dlt_pipeline(
-            pipeline_id,
-            pipeline_name,
-            product_edition,
-            continuous,
-            notebooks,
-            files,
-            catalog,
-            target,
-            photon,
-            notifications,
-            channel,
-            cluster_specific,
-        )
+        return self._upsert_dlt_pipeline(pipeline_id, pipeline_settings)
 
     def delete_pipeline(self, pipeline_id: str) -> None:
         """
@@ -138,6 +163,9 @@ class DLTManager:
         Raises:
             DLTManagerError: If the deletion fails for reasons other than not existing.
         """
+        self._pipeline_ids = {
+            name: cached_id for name, cached_id in self._pipeline_ids.items() if cached_id != pipeline_id
+        }
         try:
             logger.info("Deleting pipeline with ID: {} in {}", pipeline_id, self.workspace_name)
             self.workspace_client.pipelines.delete(pipeline_id=pipeline_id)
@@ -154,12 +182,16 @@ class DLTManager:
             )
             raise DLTManagerError(error_msg) from e
 
-    def list_pipelines_with_given_name(self, pipeline_name: str) -> List[PipelineStateInfo]:
+    def list_pipelines_with_given_name(
+        self, pipeline_name: str, limit: Optional[int] = None
+    ) -> List[PipelineStateInfo]:
         """
         Retrieves a list of DLT pipelines that match a specified name.
 
         Args:
             pipeline_name: The name of the pipeline(s) to search for
+            limit: If set, stop listing after this many pipelines, so that the remaining
+                result pages aren't fetched.
 
         Returns:
             A list of matching pipelines
@@ -172,7 +204,7 @@ class DLTManager:
             pipelines_iterator: Iterable[PipelineStateInfo] = self.workspace_client.pipelines.list_pipelines(
                 filter=filter_str
             )
-            return list(pipelines_iterator)
+            return list(itertools.islice(pipelines_iterator, limit))
         except Exception as e:
             error_msg = (
                 f"An error occurred while getting the list of DLT Pipelines "
@@ -188,6 +220,7 @@ class DLTManager:
 
         This method queries the Databricks workspace for pipelines matching the provided
         name. It ensures that exactly one pipeline is found to prevent ambiguity.
+        The ID is remembered, so looking up the same name again with this manager doesn't call Databricks.
 
         Args:
             pipeline_name: The name of the pipeline whose ID needs to be retrieved.
@@ -199,7 +232,12 @@ class DLTManager:
             DLTManagerError: If no DLT pipeline is found with the specified name,
             more than one DLT pipeline is found with the name or any other unexpected errors during the API call.
         """
-        pipeline_list = self.list_pipelines_with_given_name(pipeline_name)
+        cached_id = self._pipeline_ids.get(pipeline_name)
+        if cached_id is not None:
+            logger.debug("Pipeline '{}' already found with ID '{}'.", pipeline_name, cached_id)
+            return cached_id
+
+        pipeline_list = self.list_pipelines_with_given_name(pipeline_name, limit=2)
 
         if not pipeline_list:
             error_msg = (
@@ -227,45 +265,33 @@ class DLTManager:
             logger.debug("Response returned by Databricks for '{}': {}", pipeline_name, pipeline_list[0])
             raise DLTManagerError(error_msg)
         logger.info("Found unique pipeline '{}' with ID '{}'.", pipeline_name, pipeline_id)
+        self._pipeline_ids[pipeline_name] = pipeline_id
         return pipeline_id
 
-    def _create_dlt_pipeline(
-        self,
-        pipeline_name: str,
-        product_edition: ProductEdition,
-        continuous: bool,
-        notebooks: List[str],
-        files: List[str],
-        catalog: str,
-        target: str,
-        photon: bool,
-        notifications: Dict[str, list[str]],
-        channel: PipelineChannel,
-        cluster_specific: DLTClusterSpecific,
-    ) -> str:
-        logger.info("Creating pipeline {} in {}", pipeline_name, self.workspace_name)
+    def _upsert_dlt_pipeline(self, pipeline_id: Optional[str], pipeline_settings: Dict[str, Any]) -> str:
+        """
+        Creates a DLT pipeline, or updates an existing one, with the given settings.
+
+        Args:
+            pipeline_id: The ID of the pipeline to update, or None to create a new pipeline.
+            pipeline_settings: The settings of the pipeline, as accepted by the Databricks SDK.
+
+        Returns:
+            The ID of the created or updated pipeline.
+
+        Raises:
+            DLTManagerError: If the pipeline creation or update fails.
+        """
+        pipeline_name = pipeline_settings["name"]
+        action = "creating" if pipeline_id is None else "updating"
+        logger.info("{} pipeline {} in {}", action.capitalize(), pipeline_name, self.workspace_name)
         try:
-            libraries = self._build_pipeline_libraries(notebooks, files)
-            if not libraries:
-                error_msg = "A DLT pipeline requires at least one notebook or file."
-                logger.error(error_msg)
-                raise DLTManagerError(error_msg)
+            if pipeline_id is not None:
+                self.workspace_client.pipelines.update(pipeline_id=pipeline_id, **pipeline_settings)
+                self._pipeline_ids[pipeline_name] = pipeline_id
+                return pipeline_id
 
-            response = self.workspace_client.pipelines.create(
-                name=pipeline_name,
-                edition=product_edition,
-                continuous=continuous,
-                libraries=libraries,
-                catalog=catalog,
-                target=target,
-                clusters=self._build_clusters(cluster_specific),
-                photon=photon,
-                channel=channel,
-                notifications=self._build_notifications(notifications),
-                configuration={var.name: var.value for var in cluster_specific.spark_env_vars}
-                if cluster_specific.spark_env_vars
-                else {},
-            )
+            response = self.workspace_client.pipelines.create(**pipeline_settings)
             if not response.pipeline_id:
                 error_msg = (
                     f"Error retrieving pipeline '{pipeline_name}' in {self.workspace_name}. "
@@ -274,76 +300,23 @@ class DLTManager:
                 logger.error(error_msg)
                 logger.debug("Response returned by Databricks for '{}': {}", pipeline_name, response.pipeline_id)
                 raise DLTManagerError(error_msg)
+            self._pipeline_ids[pipeline_name] = response.pipeline_id
             return response.pipeline_id
         except DLTManagerError:
             raise
-        except ResourceConflict as e:
-            error_msg = f"Error creating pipeline '{pipeline_name}'. A pipeline with this name may already exist."
-            logger.error(
-                "Error creating pipeline '{}'. A pipeline with this name may already exist. Details: {}",
-                pipeline_name,
-                e,
-            )
-            raise DLTManagerError(error_msg) from e
         except Exception as e:
-            error_msg = f"An error occurred while creating DLT Pipeline {pipeline_name} in {self.workspace_name}."
-            logger.error(
-                "An error occurred while creating DLT Pipeline {} in {}. Details: {}",
-                pipeline_name,
-                self.workspace_name,
-                e,
-            )
-            raise DLTManagerError(error_msg) from e
-
-    def _update_dlt_pipeline(
-        self,
-        pipeline_id: str,
-        pipeline_name: str,
-        product_edition: ProductEdition,
-        continuous: bool,
-        notebooks: List[str],
-        files: List[str],
-        catalog: str,
-        target: str,
-        photon: bool,
-        notifications: Dict[str, list[str]],
-        channel: PipelineChannel,
-        cluster_specific: DLTClusterSpecific,
-    ) -> str:
-        logger.info("Updating pipeline {} in {}", pipeline_name, self.workspace_name)
-        try:
-            libraries = self._build_pipeline_libraries(notebooks, files)
-            if not libraries:
-                error_msg = (
-                    f"Pipeline {pipeline_name} doesn't contain neither notebooks or files to execute."
-                    f"A DLT pipeline requires at least one notebook or file."
+            if pipeline_id is None and isinstance(e, ResourceConflict):
+                error_msg = f"Error creating pipeline '{pipeline_name}'. A pipeline with this name may already exist."
+                logger.error(
+                    "Error creating pipeline '{}'. A pipeline with this name may already exist. Details: {}",
+                    pipeline_name,
+                    e,
                 )
-                logger.error(error_msg)
-                raise DLTManagerError(error_msg)
-
-            self.workspace_client.pipelines.update(
-                pipeline_id=pipeline_id,
-                name=pipeline_name,
-                edition=product_edition,
-                continuous=continuous,
-                libraries=libraries,
-                catalog=catalog,
-                target=target,
-                clusters=self._build_clusters(cluster_specific),
-                photon=photon,
-                channel=channel,
-                notifications=self._build_notifications(notifications),
-                configuration={var.name: var.value for var in cluster_specific.spark_env_vars}
-                if cluster_specific.spark_env_vars
-                else {},
-            )
-            return pipeline_id
-        except DLTManagerError:
-            raise
-        except Exception as e:
-            error_msg = f"An error occurred while updating DLT Pipeline {pipeline_name} in {self.workspace_name}."
+                raise DLTManagerError(error_msg) from e
+            error_msg = f"An error occurred while {action} DLT Pipeline {pipeline_name} in {self.workspace_name}."
             logger.error(
-                "An error occurred while updating DLT Pipeline {} in {}. Details: {}",
+                "An error occurred while {} DLT Pipeline {} in {}. Details: {}",
+                action,
                 pipeline_name,
                 self.workspace_name,
                 e,
@@ -380,9 +353,9 @@ class DLTManager:
         return [cluster]
 
     def _build_pipeline_libraries(self, notebooks: List[str], files: List[str]) -> List[PipelineLibrary]:
-        libraries = []
-        if notebooks:
-            libraries.extend([PipelineLibrary(notebook=NotebookLibrary(path=nb)) for nb in notebooks])
-        if files:
-            libraries.extend([PipelineLibrary(file=FileLibrary(path=f)) for f in files])
-        return libraries
+        return list(
+            itertools.chain(
+                (PipelineLibrary(notebook=NotebookLibrary(path=nb)) for nb in notebooks or ()),
+                (PipelineLibrary(file=FileLibrary(path=f)) for f in files or ()),
+            )
+        )
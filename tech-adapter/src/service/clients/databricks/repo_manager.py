@@ -62,7 +62,7 @@ class RepoManager:
             logger.error(error_msg)
             raise RepoManagerError(error_msg)
         except ResourceAlreadyExists:
-            logger.info(f"Repo {git_url} in {self.workspace_name} already exists, handling...")
+            logger.info("Repo {} in {} already exists, handling...", git_url, self.workspace_name)
             return self._handle_existing_repository(git_url, absolute_repo_path)
         except Exception as e:
             error_msg = f"An unexpected error occurred creating repo {git_url} in {self.workspace_name}: {e}"
@@ -42,7 +42,9 @@ class WorkflowManager:
             error_msg = "Error, received empty workflow name. Name is a field required"
             logger.error(error_msg)
             raise WorkflowManagerError(error_msg)
-        logger.info(f"Checking for existing workflow named '{job.settings.name}' in workspace '{self.workspace_name}'")
+        logger.info(
+            "Checking for existing workflow named '{}' in workspace '{}'", job.settings.name, self.workspace_name
+        )
 
         existing_jobs = self.job_manager.list_jobs_with_given_name(job.settings.name)
 
@@ -211,7 +213,7 @@ class WorkflowManager:
         Updates a task object with the correct entity IDs for the current workspace.
         """
         task_type = wf_info.referenced_task_type
-        logger.info(f"Updating task '{task.task_key}' of type '{task_type}' with new workspace IDs.")
+        logger.info("Updating task '{}' of type '{}' with new workspace IDs.", task.task_key, task_type)
 
         if task_type == "pipeline":
             if not wf_info.referenced_task_name:
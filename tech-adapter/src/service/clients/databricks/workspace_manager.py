@@ -158,7 +158,7 @@ class WorkspaceManager:
                     "Git credentials successfully set on workspace '{}' with username {}", workspace_name, username
                 )
             except Exception as e:
-                logger.error(f"Error setting Git credentials in workspace '{self.get_workspace_name()}'")
+                logger.error("Error setting Git credentials in workspace '{}'", self.get_workspace_name())
                 raise DatabricksWorkspaceManagerError(
                     f"Error setting Git credentials in workspace '{self.get_workspace_name()}': {e}"
                 ) from e
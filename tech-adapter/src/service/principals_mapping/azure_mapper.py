@@ -1,4 +1,4 @@
-from typing import Dict, Mapping, Set, Union
+from typing import Awaitable, Callable, Collection, Dict, Mapping, Set, Union
 
 from loguru import logger
 
@@ -43,57 +43,64 @@ class AzureMapper(AsyncMapper):
             Azure Object ID (str) or to the Exception object detailing the failure.
         """
         results: Dict[str, Union[str, MapperError]] = {}
+        user_refs: Dict[str, str] = {}
+        group_refs: Dict[str, str] = {}
         for ref in subjects:
-            try:
-                results[ref] = await self._map_subject(ref)
-            except AzureMapperError as e:
-                logger.warning("Failed to map subject '{}': {}", ref, e)
-                results[ref] = e
-            except Exception as e:
-                logger.warning("Failed to map subject '{}': {}", ref, e)
-                results[ref] = AzureMapperError(str(e))
+            if ref.startswith(USER_PREFIX):
+                user_refs[ref] = self._user_to_mail(ref[len(USER_PREFIX) :])
+            elif ref.startswith(GROUP_PREFIX):
+                group_refs[ref] = ref[len(GROUP_PREFIX) :]
+            else:
+                error_msg = f"The subject {ref} is neither a Witboost user nor a group"
+                logger.warning("Failed to map subject '{}': {}", ref, error_msg)
+                results[ref] = AzureMapperError(error_msg)
+
+        # Users and groups are looked up in batches, instead of sending one request per subject
+        if user_refs:
+            self._collect_results(results, user_refs, await self._lookup(self.client.get_user_ids, user_refs))
+        if group_refs:
+            self._collect_results(results, group_refs, await self._lookup(self.client.get_group_ids, group_refs))
         return results
 
-    async def _map_subject(self, ref: str) -> str:
+    @staticmethod
+    async def _lookup(
+        lookup: Callable[[Collection[str]], Awaitable[Mapping[str, Union[str, Exception]]]], refs: Dict[str, str]
+    ) -> Mapping[str, Union[str, Exception]]:
         """
-        Internal helper to map a single subject string.
-
-        Args:
-            ref: The subject string to map.
-
-        Returns:
-            The mapped Azure Object ID string.
-
-        Raises:
-            InvalidSubjectFormatError: If the subject prefix is not recognized.
-            AzureGraphClientError: Propagated from the client if lookup fails.
+        Runs a batched lookup on the distinct identifiers of `refs`. If the lookup itself fails,
+        every identifier is mapped to the raised exception.
         """
-        if ref.startswith(USER_PREFIX):
-            user_part = ref[len(USER_PREFIX) :]
-            return await self._get_and_map_user(user_part)
-
-        if ref.startswith(GROUP_PREFIX):
-            group_part = ref[len(GROUP_PREFIX) :]
-            return await self._get_and_map_group(group_part)
-
-        error_msg = f"The subject {ref} is neither a Witboost user nor a group"
-        logger.error(error_msg)
-        raise AzureMapperError(error_msg)
-
-    async def _get_and_map_user(self, user: str) -> str:
+        identifiers = set(refs.values())
+        try:
+            return await lookup(identifiers)
+        except Exception as e:
+            return {identifier: e for identifier in identifiers}
+
+    @staticmethod
+    def _collect_results(
+        results: Dict[str, Union[str, MapperError]],
+        refs: Dict[str, str],
+        lookup_results: Mapping[str, Union[str, Exception]],
+    ) -> None:
         """
-        Converts a Witboost user identifier to an email and retrieves its Azure Object ID.
+        Stores the lookup result of each subject in `results`, wrapping any failure in an AzureMapperError.
         """
-        underscore_index = user.rfind("_")
-        if underscore_index == -1:
-            mail = user
-        else:
-            mail = f"{user[:underscore_index]}@{user[underscore_index + 1:]}"
-
-        return await self.client.get_user_id(mail)
-
-    async def _get_and_map_group(self, group: str) -> str:
+        for ref, identifier in refs.items():
+            result = lookup_results.get(identifier)
+            if isinstance(result, str):
+                results[ref] = result
+                continue
+            if result is None:
+                result = AzureMapperError(f"No result was returned while looking up {identifier}")
+            logger.warning("Failed to map subject '{}': {}", ref, result)
+            results[ref] = result if isinstance(result, AzureMapperError) else AzureMapperError(str(result))
+
+    @staticmethod
+    def _user_to_mail(user: str) -> str:
         """
-        Retrieves the Azure Object ID for a group by its display name.
+        Converts a Witboost user identifier to an email address.
         """
-        return await self.client.get_group_id(group)
+        underscore_index = user.rfind("_")
+        if underscore_index == -1:
+            return user
+        return f"{user[:underscore_index]}@{user[underscore_index + 1:]}"
@@ -55,7 +55,7 @@ class OutputPortReverseProvisionHandler:
             params = OutputPortReverseProvisioningParams.model_validate(reverse_provisioning_request.params)
             logger.info("Start Output Port reverse provisioning with parameters: {}", params)
 
-            workspace_name = params.environment_specific_config.specific.workspace
+            workspace_name = params.workspace
             workspace_info = self.workspace_handler.get_workspace_info_by_name(workspace_name)
             if not workspace_info:
                 error_msg = f"Validation failed. Workspace '{workspace_name}' not found."
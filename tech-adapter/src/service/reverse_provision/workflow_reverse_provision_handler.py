@@ -61,16 +61,15 @@ class WorkflowReverseProvisionHandler:
             logger.info("({}) Started reverse provisioning.", component_name)
 
             # 2. Extract key information
-            env_config = params.environment_specific_config.specific
-            workspace_name = env_config.workspace
+            workspace_name = params.workspace
 
-            if not (env_config.workflow.settings and env_config.workflow.settings.name):
+            if not (params.workflow.settings and params.workflow.settings.name):
                 error_msg = (
                     "Error, received empty specific workflow.settings.name. " "Name is required to manage the workload"
                 )
                 logger.error(error_msg)
                 raise ReverseProvisioningError([error_msg])
-            workflow_name = env_config.workflow.settings.name
+            workflow_name = params.workflow.settings.name
 
             # 3. Get workspace client and validate the request
             workspace_info = self.workspace_handler.get_workspace_info_by_name(workspace_name)
@@ -99,8 +98,8 @@ class WorkflowReverseProvisionHandler:
             run_as_name = workflow.run_as_user_name
             input_run_as: Optional[str] = None
             # Get it from env specific config, fallback to catalog info
-            if params.environment_specific_config.specific.run_as_principal_name:
-                input_run_as = params.environment_specific_config.specific.run_as_principal_name
+            if params.run_as_principal_name:
+                input_run_as = params.run_as_principal_name
             elif isinstance(catalog_info.spec.mesh.specific, DatabricksWorkloadSpecific):
                 input_run_as = catalog_info.spec.mesh.specific.runAsPrincipalName
 
@@ -1,8 +1,9 @@
-from typing import Annotated, Tuple
+from typing import Annotated, Any, Optional, Tuple, Union
 
 import pydantic
 from fastapi import Depends
 from loguru import logger
+from pydantic import Discriminator, Tag, TypeAdapter
 
 from src import settings
 from src.dependencies import UnpackedProvisioningRequestDep, UnpackedUpdateAclRequestDep, WorkspaceHandlerDep
@@ -10,6 +11,7 @@ from src.models.api_models import RequestValidationError
 from src.models.data_product_descriptor import Component, ComponentKind, DataProduct
 from src.models.databricks.databricks_models import (
     DatabricksComponent,
+    DatabricksComponentType,
     DatabricksOutputPort,
     DLTWorkload,
     JobWorkload,
@@ -20,20 +22,49 @@ from src.service.validation.output_port_validation_service import OutputPortVali
 from src.utility.use_case_template_id_utils import get_use_case_template_id
 
 
-def _parse_component(component: Component) -> DatabricksComponent:
-    use_case_template_id = get_use_case_template_id(component.useCaseTemplateId)
+def _get_component_type(use_case_template_id: str) -> Optional[DatabricksComponentType]:
     if use_case_template_id in settings.usecasetemplateid.workload.job:
-        return JobWorkload.parse_obj(component.dict(by_alias=True))
+        return DatabricksComponentType.JOB
     elif use_case_template_id in settings.usecasetemplateid.workload.workflow:
-        return WorkflowWorkload.parse_obj(component.dict(by_alias=True))
+        return DatabricksComponentType.WORKFLOW
     elif use_case_template_id in settings.usecasetemplateid.outputPort:
-        return DatabricksOutputPort.parse_obj(component.dict(by_alias=True))
+        return DatabricksComponentType.OUTPUTPORT
     elif use_case_template_id in settings.usecasetemplateid.workload.dlt:
-        return DLTWorkload.parse_obj(component.dict(by_alias=True))
-    else:
+        return DatabricksComponentType.DLT
+    return None
+
+
+def _discriminate_component(data: Any) -> Optional[str]:
+    use_case_template_id = (
+        data.get("useCaseTemplateId") if isinstance(data, dict) else getattr(data, "useCaseTemplateId", None)
+    )
+    if not use_case_template_id:
+        return None
+    return _get_component_type(get_use_case_template_id(use_case_template_id))
+
+
+# The schema of the tagged union is built once, and each component is validated only against the model
+# selected by its tag, instead of trying each member of the union in turn
+_databricks_component_adapter: TypeAdapter[DatabricksComponent] = TypeAdapter(
+    Annotated[
+        Union[
+            Annotated[JobWorkload, Tag(DatabricksComponentType.JOB)],
+            Annotated[WorkflowWorkload, Tag(DatabricksComponentType.WORKFLOW)],
+            Annotated[DLTWorkload, Tag(DatabricksComponentType.DLT)],
+            Annotated[DatabricksOutputPort, Tag(DatabricksComponentType.OUTPUTPORT)],
+        ],
+        Discriminator(_discriminate_component),
+    ]
+)
+
+
+def _parse_component(component: Component) -> DatabricksComponent:
+    use_case_template_id = get_use_case_template_id(component.useCaseTemplateId)
+    if _get_component_type(use_case_template_id) is None:
         error_msg = f"Received component with unsupported use case template id '{component.useCaseTemplateId}'"
         logger.error(error_msg)
         raise ProvisioningError([error_msg])
+    return _databricks_component_adapter.validate_python(component.model_dump(by_alias=True))
 
 
 def validate(
@@ -191,6 +191,10 @@ class MiscSettings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="misc_", extra="ignore")
 
     development_environment_name: str = Field(alias="developmentEnvironmentName")
+    log_request_response_bodies: bool = Field(default=True, alias="logRequestResponseBodies")
+    # Size of the worker thread pool running the blocking endpoints. The shared Databricks clients size their
+    # connection pools after it, so that threads don't wait for a free connection
+    thread_pool_size: int = Field(default=200, gt=0, alias="threadPoolSize")
 
 
 # --- Main Application Settings ---
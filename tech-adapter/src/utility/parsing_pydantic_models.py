@@ -1,12 +1,12 @@
 from typing import Type, TypeVar
 
 import pydantic
-import yaml
 from loguru import logger
 from pydantic import BaseModel
 
 from src.models.api_models import RequestValidationError
 from src.utility.error_builder import build_request_validation_error
+from src.utility.yaml_loader import fast_yaml_load
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -56,7 +56,7 @@ def parse_yaml_with_model(yaml_data: dict | str, model: Type[T]) -> T | RequestV
     """  # noqa: E501
     try:
         if isinstance(yaml_data, str):
-            yaml_dict = yaml.safe_load(yaml_data)
+            yaml_dict = fast_yaml_load(yaml_data)
         else:
             yaml_dict = yaml_data
 
@@ -0,0 +1,66 @@
+from typing import Any, Collection
+
+import yaml
+from yaml.nodes import MappingNode, ScalarNode
+
+# libyaml-backed loader when PyYAML has been compiled against it, pure-Python SafeLoader otherwise
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def fast_yaml_load(text: str) -> Any:
+    """
+    Loads a single YAML document with the fastest safe loader available.
+
+    Equivalent to `yaml.safe_load`, but the loader is driven directly instead of going through the generic
+    `yaml.load` entrypoint, and its parsing state is released as soon as the document has been built.
+
+    Args:
+        text: YAML document to load.
+
+    Returns:
+        The Python object represented by the document.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+    """
+    loader = YamlLoader(text)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
+def load_top_level_keys(text: str, keys: Collection[str]) -> dict:
+    """
+    Loads a YAML mapping document, building Python objects only for the given top-level keys.
+
+    The document is still fully parsed, but the subtrees under any other top-level key are dropped before
+    being converted into Python objects, saving the related allocations. JSON documents are loaded as YAML
+    too, so that a descriptor is read the same way whatever its syntax.
+
+    Args:
+        text: YAML document whose root is a mapping.
+        keys: Top-level keys to load. Any other top-level key is discarded.
+
+    Returns:
+        A dictionary with the subset of `keys` defined by the document. Empty if the document is empty.
+
+    Raises:
+        yaml.YAMLError: If the text is not valid YAML.
+        TypeError: If the root of the document is not a mapping.
+    """
+    loader = YamlLoader(text)
+    try:
+        node = loader.get_single_node()
+        if node is None:
+            return {}
+        if not isinstance(node, MappingNode):
+            raise TypeError("The document root must be a mapping")
+        node.value = [
+            (key_node, value_node)
+            for key_node, value_node in node.value
+            if isinstance(key_node, ScalarNode) and key_node.value in keys
+        ]
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
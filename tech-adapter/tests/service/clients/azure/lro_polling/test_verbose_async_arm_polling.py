@@ -0,0 +1,43 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.service.clients.azure.lro_polling.verbose_async_arm_polling import VerboseAsyncARMPolling
+
+
+@patch("src.service.clients.azure.lro_polling.verbose_async_arm_polling.time.monotonic")
+@patch("src.service.clients.azure.lro_polling.verbose_async_arm_polling.get_retry_after")
+class TestVerboseAsyncARMPolling(unittest.TestCase):
+    """Unit tests for the polling delays of VerboseAsyncARMPolling."""
+
+    def _polling(self, mock_monotonic: MagicMock) -> VerboseAsyncARMPolling:
+        mock_monotonic.return_value = 100.0
+        polling = VerboseAsyncARMPolling("Test operation", timeout=30, initial_interval=1.0, aggressive_window=60.0)
+        polling._pipeline_response = MagicMock()
+        return polling
+
+    def test_polls_more_often_than_retry_after_at_first(self, mock_get_retry_after, mock_monotonic):
+        """Test that the delay starts short and doubles, capped by the server's Retry-After."""
+        mock_get_retry_after.return_value = 10
+        polling = self._polling(mock_monotonic)
+
+        delays = [polling._extract_delay() for _ in range(5)]
+
+        self.assertEqual(delays, [1.0, 2.0, 4.0, 8.0, 10])
+
+    def test_honors_retry_after_once_the_window_is_over(self, mock_get_retry_after, mock_monotonic):
+        """Test that the server's Retry-After is used after the aggressive polling window."""
+        mock_get_retry_after.return_value = 20
+        polling = self._polling(mock_monotonic)
+
+        mock_monotonic.return_value = 160.0
+
+        self.assertEqual(polling._extract_delay(), 20)
+
+    def test_uses_timeout_without_retry_after(self, mock_get_retry_after, mock_monotonic):
+        """Test that the configured timeout caps the delay if the server doesn't send a Retry-After."""
+        mock_get_retry_after.return_value = None
+        polling = self._polling(mock_monotonic)
+
+        self.assertEqual(polling._extract_delay(), 1.0)
+        mock_monotonic.return_value = 160.0
+        self.assertEqual(polling._extract_delay(), 30)
@@ -1,8 +1,12 @@
 import unittest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.models.databricks.exceptions import AzureGraphClientError
-from src.service.clients.azure.azure_graph_client import AzureGraphClient
+from src.service.clients.azure.azure_graph_client import (
+    GRAPH_BATCH_MAX_REQUESTS,
+    GRAPH_FILTER_MAX_VALUES,
+    AzureGraphClient,
+)
 
 
 class TestAzureGraphClient(unittest.IsolatedAsyncioTestCase):
@@ -15,6 +19,7 @@ class TestAzureGraphClient(unittest.IsolatedAsyncioTestCase):
         # The methods we call on its builders are async, so they need AsyncMocks
         self.mock_graph_service_client.users.get = AsyncMock()
         self.mock_graph_service_client.groups.get = AsyncMock()
+        self.mock_graph_service_client.batch.post = AsyncMock()
 
         # Instantiate the class under test
         self.client = AzureGraphClient(self.mock_graph_service_client)
@@ -121,3 +126,94 @@ class TestAzureGraphClient(unittest.IsolatedAsyncioTestCase):
         # Act & Assert
         with self.assertRaisesRegex(AzureGraphClientError, "An unexpected error occurred"):
             await self.client.get_group_id(self.group_name)
+
+    def _mock_batch_response(self, principals_by_request_id: dict, statuses: dict | None = None):
+        """Builds a batch response returning, for each request id, the given principals."""
+        statuses = statuses or {}
+        batch_response = MagicMock()
+        batch_response.responses = {
+            request_id: MagicMock(status=statuses.get(request_id, 200)) for request_id in principals_by_request_id
+        }
+
+        def get_response_by_id(request_id, response_type):
+            response = MagicMock()
+            response.value = principals_by_request_id[request_id]
+            return response
+
+        batch_response.get_response_by_id.side_effect = get_response_by_id
+        return batch_response
+
+    @patch("msgraph_core.requests.batch_request_content.BatchRequestContent")
+    @patch("msgraph_core.requests.batch_request_item.BatchRequestItem")
+    async def test_get_user_ids_success_and_not_found(self, mock_batch_item, mock_batch_content):
+        """Test that users are looked up with a single filter and not found users are mapped to an error."""
+        # Arrange
+        mails = ["a@example.com", "o'neil@example.com"]
+        self.mock_graph_service_client.users.to_get_request_information.side_effect = lambda request_configuration: (
+            request_configuration.query_parameters.filter
+        )
+        mock_batch_item.side_effect = lambda request_information: MagicMock(id=request_information)
+        expected_filter = "mail in ('a@example.com','o''neil@example.com')"
+        self.mock_graph_service_client.batch.post.return_value = self._mock_batch_response(
+            {expected_filter: [MagicMock(id="id-a", mail="A@example.com")]}
+        )
+
+        # Act
+        results = await self.client.get_user_ids(mails)
+
+        # Assert
+        self.assertEqual(results["a@example.com"], "id-a")
+        self.assertIsInstance(results["o'neil@example.com"], AzureGraphClientError)
+        self.assertIn("User o'neil@example.com not found", str(results["o'neil@example.com"]))
+        self.mock_graph_service_client.batch.post.assert_awaited_once()
+        self.mock_graph_service_client.users.get.assert_not_awaited()
+
+    @patch("msgraph_core.requests.batch_request_content.BatchRequestContent")
+    @patch("msgraph_core.requests.batch_request_item.BatchRequestItem")
+    async def test_get_group_ids_splits_batches_and_handles_failures(self, mock_batch_item, mock_batch_content):
+        """Test that lookups are split in filters and batches of the maximum size and failures map to errors."""
+        # Arrange
+        group_names = [f"group-{i}" for i in range(GRAPH_BATCH_MAX_REQUESTS * GRAPH_FILTER_MAX_VALUES + 1)]
+        self.mock_graph_service_client.groups.to_get_request_information.side_effect = lambda request_configuration: (
+            request_configuration.query_parameters.filter
+        )
+        mock_batch_item.side_effect = lambda request_information: MagicMock(id=request_information)
+        chunks = [
+            group_names[start : start + GRAPH_FILTER_MAX_VALUES]
+            for start in range(0, GRAPH_BATCH_MAX_REQUESTS * GRAPH_FILTER_MAX_VALUES, GRAPH_FILTER_MAX_VALUES)
+        ]
+        filters = ["displayName in (" + ",".join(f"'{name}'" for name in chunk) + ")" for chunk in chunks]
+        principals = {}
+        for chunk, chunk_filter in zip(chunks, filters):
+            principals[chunk_filter] = []
+            for name in chunk:
+                group = MagicMock(id=f"id-{name}")
+                group.display_name = name
+                principals[chunk_filter].append(group)
+        first_batch = self._mock_batch_response(principals, statuses={filters[0]: 500})
+        self.mock_graph_service_client.batch.post.side_effect = [first_batch, Exception("Graph API is down")]
+
+        # Act
+        results = await self.client.get_group_ids(group_names)
+
+        # Assert
+        self.assertEqual(self.mock_graph_service_client.batch.post.await_count, 2)
+        self.assertEqual(results[chunks[1][0]], f"id-{chunks[1][0]}")
+        self.assertIsInstance(results[chunks[0][0]], AzureGraphClientError)
+        last_group = group_names[-1]
+        self.assertIsInstance(results[last_group], AzureGraphClientError)
+        self.assertIn("An unexpected error occurred", str(results[last_group]))
+
+    async def test_get_user_id_escapes_quotes(self):
+        """Test that single quotes in the mail are escaped in the filter."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.value = [MagicMock(id=self.user_id)]
+        self.mock_graph_service_client.users.get.return_value = mock_response
+
+        # Act
+        await self.client.get_user_id("o'neil@example.com")
+
+        # Assert
+        _, kwargs = self.mock_graph_service_client.users.get.await_args
+        self.assertEqual(kwargs["request_configuration"].query_parameters.filter, "mail eq 'o''neil@example.com'")
@@ -1,11 +1,16 @@
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 from azure.core.exceptions import ResourceExistsError
 from azure.mgmt.authorization.models import PrincipalType, RoleAssignment, RoleAssignmentCreateParameters
 
 from src.models.databricks.exceptions import AzurePermissionsError
-from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager
+from src.service.clients.azure.azure_permissions_manager import AzurePermissionsManager, RoleAssignmentRequest
+
+
+def _principal_id(index: int) -> str:
+    """Builds the object ID of a test principal."""
+    return f"00000000-0000-0000-0000-{index:012d}"
 
 
 class TestAzurePermissionsManager(unittest.TestCase):
@@ -15,6 +20,8 @@ class TestAzurePermissionsManager(unittest.TestCase):
         """Set up the test environment before each test."""
         # The main external dependency to mock
         self.mock_auth_client = MagicMock()
+        # No role assignments exist by default
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = []
         # Instantiate the class under test
         self.manager = AzurePermissionsManager(self.mock_auth_client)
 
@@ -24,7 +31,7 @@ class TestAzurePermissionsManager(unittest.TestCase):
         )
         self.permission_id = "a-unique-guid-for-the-assignment"
         self.role_definition_id = "/subscriptions/sub-id/providers/Microsoft.Authorization/roleDefinitions/role-def-id"
-        self.principal_id = "principal-object-id"
+        self.principal_id = "1b2f5c4e-8d3a-4f6b-9c7d-0e1f2a3b4c5d"
         self.principal_type = PrincipalType.SERVICE_PRINCIPAL
         self.workspace_name = "ws-name"
         self.role_assignment_id = (
@@ -70,6 +77,75 @@ class TestAzurePermissionsManager(unittest.TestCase):
         # Assert
         self.mock_auth_client.role_assignments.create.assert_called_once()
 
+    def test_assign_permissions_skips_existing_role_assignment(self):
+        """Test that no role assignment is created if the principal already has the role on the resource."""
+        # Arrange
+        existing = MagicMock(
+            principal_id=self.principal_id,
+            role_definition_id=self.role_definition_id,
+            scope=self.resource_id.upper(),
+        )
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = [existing]
+
+        # Act
+        self.manager.assign_permissions(
+            self.resource_id, self.permission_id, self.role_definition_id, self.principal_id, self.principal_type
+        )
+
+        # Assert
+        _, kwargs = self.mock_auth_client.role_assignments.list_for_resource.call_args
+        self.assertEqual(kwargs["resource_group_name"], "rg-name")
+        self.assertEqual(kwargs["resource_name"], "ws-name")
+        self.mock_auth_client.role_assignments.create.assert_not_called()
+
+    def test_assign_permissions_ignores_inherited_role_assignment(self):
+        """Test that a role assigned on a parent scope doesn't prevent assigning it on the resource."""
+        # Arrange
+        inherited = MagicMock(
+            principal_id=self.principal_id,
+            role_definition_id=self.role_definition_id,
+            scope="/subscriptions/sub-id/resourceGroups/rg-name",
+        )
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = [inherited]
+
+        # Act
+        self.manager.assign_permissions(
+            self.resource_id, self.permission_id, self.role_definition_id, self.principal_id, self.principal_type
+        )
+
+        # Assert
+        self.mock_auth_client.role_assignments.create.assert_called_once()
+
+    def test_assign_permissions_without_check_first(self):
+        """Test that the existing role assignments aren't retrieved when check_first is disabled."""
+        # Act
+        self.manager.assign_permissions(
+            self.resource_id,
+            self.permission_id,
+            self.role_definition_id,
+            self.principal_id,
+            self.principal_type,
+            check_first=False,
+        )
+
+        # Assert
+        self.mock_auth_client.role_assignments.list_for_resource.assert_not_called()
+        self.mock_auth_client.role_assignments.create.assert_called_once()
+
+    def test_assign_permissions_rejects_non_object_id_principal(self):
+        """Test that a principal that isn't identified by its object ID is rejected without calling ARM."""
+        # Act & Assert
+        with self.assertRaisesRegex(AzurePermissionsError, "not a valid object ID"):
+            self.manager.assign_permissions(
+                self.resource_id,
+                self.permission_id,
+                self.role_definition_id,
+                "john.doe@company.com",
+                PrincipalType.USER,
+            )
+        self.mock_auth_client.role_assignments.list_for_resource.assert_not_called()
+        self.mock_auth_client.role_assignments.create.assert_not_called()
+
     def test_assign_permissions_fails_on_api_error(self):
         """Test that a generic API error is wrapped in AzurePermissionsError."""
         # Arrange
@@ -81,6 +157,57 @@ class TestAzurePermissionsManager(unittest.TestCase):
                 self.resource_id, self.permission_id, self.role_definition_id, self.principal_id, self.principal_type
             )
 
+    def _assignment(self, principal_id: str) -> RoleAssignmentRequest:
+        return RoleAssignmentRequest(
+            resource_id=self.resource_id,
+            permission_id=f"{principal_id}-guid",
+            role_definition_id=self.role_definition_id,
+            principal_id=principal_id,
+            principal_type=self.principal_type,
+        )
+
+    def test_assign_permissions_bulk_success(self):
+        """Test that every role assignment of a bulk assignment is created."""
+        # Arrange
+        assignments = [self._assignment(_principal_id(i)) for i in range(5)]
+
+        # Act
+        self.manager.assign_permissions_bulk(assignments)
+
+        # Assert
+        self.assertEqual(self.mock_auth_client.role_assignments.create.call_count, 5)
+        created = {
+            call.kwargs["parameters"].principal_id
+            for call in self.mock_auth_client.role_assignments.create.call_args_list
+        }
+        self.assertEqual(created, {_principal_id(i) for i in range(5)})
+
+    def test_assign_permissions_bulk_empty(self):
+        """Test that a bulk assignment without role assignments does nothing."""
+        # Act
+        self.manager.assign_permissions_bulk([])
+
+        # Assert
+        self.mock_auth_client.role_assignments.create.assert_not_called()
+
+    def test_assign_permissions_bulk_aggregates_errors(self):
+        """Test that failed role assignments are reported together, without stopping the other ones."""
+
+        # Arrange
+        def create(scope, role_assignment_name, parameters):
+            if parameters.principal_id in (_principal_id(1), _principal_id(3)):
+                raise Exception("Generic API failure")
+
+        self.mock_auth_client.role_assignments.create.side_effect = create
+        assignments = [self._assignment(_principal_id(i)) for i in range(4)]
+
+        # Act & Assert
+        with self.assertRaisesRegex(AzurePermissionsError, "2 of 4 role assignments failed") as context:
+            self.manager.assign_permissions_bulk(assignments)
+        self.assertIn(_principal_id(1), str(context.exception))
+        self.assertIn(_principal_id(3), str(context.exception))
+        self.assertEqual(self.mock_auth_client.role_assignments.create.call_count, 4)
+
     def test_get_principal_role_assignments_on_resource_success(self):
         """Test successful retrieval and filtering of role assignments."""
         # Arrange
@@ -105,6 +232,7 @@ class TestAzurePermissionsManager(unittest.TestCase):
             parent_resource_path="",
             resource_type="workspaces",
             resource_name="ws-name",
+            filter=f"principalId eq '{self.principal_id}'",
         )
         # Verify the in-memory filtering worked correctly
         self.assertEqual(len(result), 2)
@@ -123,6 +251,101 @@ class TestAzurePermissionsManager(unittest.TestCase):
                 "rg-name", "Microsoft.Databricks", "workspaces", "ws-name", self.principal_id
             )
 
+    def test_get_principal_role_assignments_on_resource_is_cached(self):
+        """Test that repeated retrievals reuse the cached role assignments until one is deleted."""
+        # Arrange
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = [
+            RoleAssignment(principal_id=self.principal_id)
+        ]
+        args = ("rg-name", "Microsoft.Databricks", "workspaces", "ws-name")
+
+        # Act
+        first = self.manager.get_principal_role_assignments_on_resource(*args, self.principal_id)
+        second = self.manager.get_principal_role_assignments_on_resource(*args, self.principal_id.upper())
+        self.manager.delete_role_assignment(self.workspace_name, self.role_assignment_id)
+        third = self.manager.get_principal_role_assignments_on_resource(*args, self.principal_id)
+
+        # Assert
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        self.assertEqual(self.mock_auth_client.role_assignments.list_for_resource.call_count, 2)
+
+    def test_get_principal_role_assignments_on_resource_cache_disabled(self):
+        """Test that role assignments are always retrieved when the cache TTL is 0."""
+        # Arrange
+        manager = AzurePermissionsManager(self.mock_auth_client, role_assignments_cache_ttl=0)
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = []
+        args = ("rg-name", "Microsoft.Databricks", "workspaces", "ws-name", self.principal_id)
+
+        # Act
+        manager.get_principal_role_assignments_on_resource(*args)
+        manager.get_principal_role_assignments_on_resource(*args)
+
+        # Assert
+        self.assertEqual(self.mock_auth_client.role_assignments.list_for_resource.call_count, 2)
+
+    def test_get_role_assignments_on_resource_by_principals_single_call(self):
+        """Test that the role assignments of several principals are retrieved with a single call."""
+        # Arrange
+        first_assignment = RoleAssignment(principal_id="principal-1")
+        second_assignment = RoleAssignment(principal_id="PRINCIPAL-2")
+        other_assignment = RoleAssignment(principal_id="another-principal")
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = [
+            first_assignment,
+            other_assignment,
+            second_assignment,
+        ]
+        args = ("rg-name", "Microsoft.Databricks", "workspaces", "ws-name")
+
+        # Act
+        result = self.manager.get_role_assignments_on_resource_by_principals(
+            *args, ["principal-1", "principal-2", "principal-3"]
+        )
+
+        # Assert
+        self.mock_auth_client.role_assignments.list_for_resource.assert_called_once_with(
+            resource_group_name="rg-name",
+            resource_provider_namespace="Microsoft.Databricks",
+            parent_resource_path="",
+            resource_type="workspaces",
+            resource_name="ws-name",
+        )
+        self.assertEqual(
+            result, {"principal-1": [first_assignment], "principal-2": [second_assignment], "principal-3": []}
+        )
+        # The results are cached for each principal
+        self.assertEqual(
+            self.manager.get_principal_role_assignments_on_resource(*args, "principal-2"), [second_assignment]
+        )
+        self.mock_auth_client.role_assignments.list_for_resource.assert_called_once()
+
+    def test_get_role_assignments_on_resource_by_principals_single_principal(self):
+        """Test that a single principal is looked up with the ARM side filter."""
+        # Arrange
+        assignment = RoleAssignment(principal_id=self.principal_id)
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = [assignment]
+
+        # Act
+        result = self.manager.get_role_assignments_on_resource_by_principals(
+            "rg-name", "Microsoft.Databricks", "workspaces", "ws-name", [self.principal_id]
+        )
+
+        # Assert
+        self.assertEqual(result, {self.principal_id: [assignment]})
+        _, kwargs = self.mock_auth_client.role_assignments.list_for_resource.call_args
+        self.assertEqual(kwargs["filter"], f"principalId eq '{self.principal_id}'")
+
+    def test_get_role_assignments_on_resource_by_principals_api_error(self):
+        """Test that an API error during the retrieval is wrapped in AzurePermissionsError."""
+        # Arrange
+        self.mock_auth_client.role_assignments.list_for_resource.side_effect = Exception("API connection failed")
+
+        # Act & Assert
+        with self.assertRaisesRegex(AzurePermissionsError, "Error retrieving role assignments"):
+            self.manager.get_role_assignments_on_resource_by_principals(
+                "rg-name", "Microsoft.Databricks", "workspaces", "ws-name", ["principal-1", "principal-2"]
+            )
+
     def test_delete_role_assignment_success(self):
         """Test successful deletion of a role assignment by its ID."""
         # Act
@@ -139,3 +362,115 @@ class TestAzurePermissionsManager(unittest.TestCase):
         # Act & Assert
         with self.assertRaisesRegex(AzurePermissionsError, "Error deleting role assignment"):
             self.manager.delete_role_assignment(self.workspace_name, self.role_assignment_id)
+
+    def test_delete_role_assignment_error_message_keeps_braces(self):
+        """Test that the error message is built as is, even if the names contain format placeholders."""
+        # Arrange
+        self.mock_auth_client.role_assignments.delete_by_id.side_effect = Exception("API delete failure")
+
+        # Act & Assert
+        with self.assertRaises(AzurePermissionsError) as context:
+            self.manager.delete_role_assignment("ws-{0}", "assignment-{}")
+        self.assertEqual(
+            str(context.exception), "Error deleting role assignment [ID: assignment-{}] on resource [Name: ws-{0}]."
+        )
+
+
+class TestAzurePermissionsManagerAsync(unittest.IsolatedAsyncioTestCase):
+    """Unit tests for the async methods of the AzurePermissionsManager class."""
+
+    def setUp(self):
+        """Set up the test environment before each test."""
+        self.mock_auth_client = MagicMock()
+        self.mock_auth_client.role_assignments.list_for_resource.return_value = []
+        self.mock_async_auth_client = MagicMock()
+        self.mock_async_auth_client.role_assignments.create = AsyncMock()
+        self.mock_async_auth_client.role_assignments.delete_by_id = AsyncMock()
+        self.manager = AzurePermissionsManager(self.mock_auth_client, async_auth_client=self.mock_async_auth_client)
+
+        self.resource_id = (
+            "/subscriptions/sub-id/resourceGroups/rg-name/providers/Microsoft.Databricks/workspaces/ws-name"
+        )
+        self.role_definition_id = "/subscriptions/sub-id/providers/Microsoft.Authorization/roleDefinitions/role-def-id"
+
+    def _assignment(self, principal_id: str) -> RoleAssignmentRequest:
+        return RoleAssignmentRequest(
+            resource_id=self.resource_id,
+            permission_id=f"{principal_id}-guid",
+            role_definition_id=self.role_definition_id,
+            principal_id=principal_id,
+            principal_type=PrincipalType.USER,
+        )
+
+    async def test_assign_permissions_bulk_async_uses_async_client(self):
+        """Test that every role assignment is created with the async client."""
+        # Arrange
+        assignments = [self._assignment(_principal_id(i)) for i in range(3)]
+
+        # Act
+        await self.manager.assign_permissions_bulk_async(assignments)
+
+        # Assert
+        self.assertEqual(self.mock_async_auth_client.role_assignments.create.await_count, 3)
+        created = {
+            call.kwargs["role_assignment_name"]
+            for call in self.mock_async_auth_client.role_assignments.create.await_args_list
+        }
+        self.assertEqual(created, {f"{_principal_id(i)}-guid" for i in range(3)})
+        self.mock_auth_client.role_assignments.create.assert_not_called()
+
+    async def test_assign_permissions_bulk_async_aggregates_errors(self):
+        """Test that failed role assignments are reported together, without stopping the other ones."""
+
+        # Arrange
+        async def create(scope, role_assignment_name, parameters):
+            if role_assignment_name == f"{_principal_id(1)}-guid":
+                raise Exception("Generic API failure")
+
+        self.mock_async_auth_client.role_assignments.create.side_effect = create
+        assignments = [self._assignment(_principal_id(i)) for i in range(3)]
+
+        # Act & Assert
+        with self.assertRaisesRegex(AzurePermissionsError, "1 of 3 role assignments failed"):
+            await self.manager.assign_permissions_bulk_async(assignments)
+        self.assertEqual(self.mock_async_auth_client.role_assignments.create.await_count, 3)
+
+    async def test_assign_permissions_bulk_async_without_async_client(self):
+        """Test that the sync client is used on a worker thread if there's no async client."""
+        # Arrange
+        manager = AzurePermissionsManager(self.mock_auth_client)
+
+        # Act
+        await manager.assign_permissions_bulk_async([self._assignment(_principal_id(0))])
+
+        # Assert
+        self.mock_auth_client.role_assignments.create.assert_called_once()
+
+    async def test_delete_role_assignment_async_uses_async_client(self):
+        """Test that the role assignment is deleted with the async client."""
+        # Act
+        await self.manager.delete_role_assignment_async("ws-name", "role-assignment-id")
+
+        # Assert
+        self.mock_async_auth_client.role_assignments.delete_by_id.assert_awaited_once_with("role-assignment-id")
+        self.mock_auth_client.role_assignments.delete_by_id.assert_not_called()
+
+    async def test_delete_role_assignment_async_without_async_client(self):
+        """Test that the sync client is used on a worker thread if there's no async client."""
+        # Arrange
+        manager = AzurePermissionsManager(self.mock_auth_client)
+
+        # Act
+        await manager.delete_role_assignment_async("ws-name", "role-assignment-id")
+
+        # Assert
+        self.mock_auth_client.role_assignments.delete_by_id.assert_called_once_with("role-assignment-id")
+
+    async def test_delete_role_assignment_async_fails_on_api_error(self):
+        """Test that an API error during deletion is wrapped in AzurePermissionsError."""
+        # Arrange
+        self.mock_async_auth_client.role_assignments.delete_by_id.side_effect = Exception("API delete failure")
+
+        # Act & Assert
+        with self.assertRaisesRegex(AzurePermissionsError, "Error deleting role assignment"):
+            await self.manager.delete_role_assignment_async("ws-name", "role-assignment-id")
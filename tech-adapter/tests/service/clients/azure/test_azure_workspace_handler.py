@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from azure.mgmt.authorization.models import PrincipalType
 from azure.mgmt.databricks.models import ProvisioningState
 
+from src import settings
 from src.models.data_product_descriptor import DataProduct
 from src.models.databricks.databricks_models import JobWorkload
 from src.models.databricks.databricks_workspace_info import DatabricksWorkspaceInfo
@@ -14,18 +15,23 @@ from src.models.databricks.workload.databricks_workload_specific import (
 )
 from src.models.exceptions import WorkspaceHandlerError
 from src.service.clients.azure.azure_workspace_handler import (
+    AuthType,
     AzureAuthWorkspaceClientConfigParams,
     AzureWorkspaceHandler,
     OAuthWorkspaceClientConfigParams,
+    WorkspaceClientCache,
+    WorkspaceClientConfigParams,
+    WorkspaceInfoCache,
     create_workspace_client,
 )
 from src.settings.databricks_tech_adapter_settings import AzureAuthSettings, DatabricksAuthSettings
 
 
 # Test the factory function separately, as it has no dependencies on the class.
+@patch("src.service.clients.azure.azure_workspace_handler.Config")
 @patch("src.service.clients.azure.azure_workspace_handler.WorkspaceClient")
 class TestCreateWorkspaceClient(unittest.TestCase):
-    def test_creates_with_azure_auth(self, MockWorkspaceClient):
+    def test_creates_with_azure_auth(self, MockWorkspaceClient, MockConfig):
         """Test client creation with Azure Service Principal authentication."""
         # Arrange
         params = AzureAuthWorkspaceClientConfigParams(
@@ -44,14 +50,16 @@ class TestCreateWorkspaceClient(unittest.TestCase):
         create_workspace_client(params)
 
         # Assert
-        MockWorkspaceClient.assert_called_once_with(
+        MockConfig.assert_called_once_with(
             host="https://host",
+            max_connections_per_pool=settings.misc.thread_pool_size,
             azure_client_id="azure-cid",
             azure_client_secret="azure-csec",
             azure_tenant_id="azure-tid",
         )
+        MockWorkspaceClient.assert_called_once_with(config=MockConfig.return_value)
 
-    def test_creates_with_oauth(self, MockWorkspaceClient):
+    def test_creates_with_oauth(self, MockWorkspaceClient, MockConfig):
         """Test client creation with Databricks OAuth M2M authentication."""
         # Arrange
         params = OAuthWorkspaceClientConfigParams(
@@ -65,7 +73,134 @@ class TestCreateWorkspaceClient(unittest.TestCase):
         create_workspace_client(params)
 
         # Assert
-        MockWorkspaceClient.assert_called_once_with(host="https://host", client_id="db-cid", client_secret="db-csec")
+        MockConfig.assert_called_once_with(
+            host="https://host",
+            max_connections_per_pool=settings.misc.thread_pool_size,
+            client_id="db-cid",
+            client_secret="db-csec",
+        )
+        MockWorkspaceClient.assert_called_once_with(config=MockConfig.return_value)
+
+    def test_wraps_client_initialization_errors(self, MockWorkspaceClient, MockConfig):
+        """Test that a failure of the Databricks SDK is raised as a WorkspaceHandlerError."""
+        # Arrange
+        MockWorkspaceClient.side_effect = ValueError("cannot configure default credentials")
+        params = OAuthWorkspaceClientConfigParams(
+            workspace_host="https://host",
+            workspace_name="ws-name",
+            databricks_client_id="db-cid",
+            databricks_client_secret="db-csec",
+        )
+
+        # Act & Assert
+        with self.assertRaisesRegex(WorkspaceHandlerError, "cannot configure default credentials"):
+            create_workspace_client(params)
+
+    def test_rejects_unsupported_params(self, MockWorkspaceClient, MockConfig):
+        """Test that config params without a supported auth type are rejected without creating a client."""
+        # Arrange
+        params = WorkspaceClientConfigParams(
+            auth_type=AuthType.AZURE, workspace_host="https://host", workspace_name="ws-name"
+        )
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            create_workspace_client(params)
+        MockWorkspaceClient.assert_not_called()
+
+
+@patch("src.service.clients.azure.azure_workspace_handler.Config")
+@patch("src.service.clients.azure.azure_workspace_handler.WorkspaceClient")
+class TestWorkspaceClientCache(unittest.TestCase):
+    def _params(self, host: str, client_id: str = "db-cid") -> OAuthWorkspaceClientConfigParams:
+        return OAuthWorkspaceClientConfigParams(
+            workspace_host=host,
+            workspace_name="ws-name",
+            databricks_client_id=client_id,
+            databricks_client_secret="db-csec",
+        )
+
+    def test_reuses_client_for_same_workspace_and_principal(self, MockWorkspaceClient, MockConfig):
+        """Test that a client is created once per workspace and principal."""
+        MockWorkspaceClient.side_effect = lambda **kwargs: MagicMock()
+        cache = WorkspaceClientCache()
+
+        first = cache.get_or_create(self._params("https://host"))
+        second = cache.get_or_create(self._params("https://host"))
+        other_host = cache.get_or_create(self._params("https://other-host"))
+        other_principal = cache.get_or_create(self._params("https://host", client_id="other-cid"))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_host)
+        self.assertIsNot(first, other_principal)
+        self.assertEqual(MockWorkspaceClient.call_count, 3)
+
+    def test_failed_client_is_not_cached(self, MockWorkspaceClient, MockConfig):
+        """Test that a failure creating the client is raised and retried on the next call."""
+        client = MagicMock()
+        MockWorkspaceClient.side_effect = [Exception("Auth failed"), client]
+        cache = WorkspaceClientCache()
+
+        with self.assertRaises(WorkspaceHandlerError):
+            cache.get_or_create(self._params("https://host"))
+
+        self.assertIs(cache.get_or_create(self._params("https://host")), client)
+
+    def test_clear_drops_cached_clients(self, MockWorkspaceClient, MockConfig):
+        """Test that clearing the cache creates new clients on the following calls."""
+        MockWorkspaceClient.side_effect = lambda **kwargs: MagicMock()
+        cache = WorkspaceClientCache()
+        first = cache.get_or_create(self._params("https://host"))
+
+        cache.clear()
+
+        self.assertIsNot(cache.get_or_create(self._params("https://host")), first)
+
+
+class TestWorkspaceInfoCache(unittest.TestCase):
+    def _workspace_info(self, provisioning_state: ProvisioningState) -> DatabricksWorkspaceInfo:
+        return DatabricksWorkspaceInfo.build_managed(
+            name="ws-name",
+            id="12345",
+            databricks_host="https://test.azuredatabricks.net",
+            azure_resource_id="res-id",
+            azure_resource_url="https://portal.azure.com",
+            provisioning_state=provisioning_state,
+        )
+
+    @patch("src.service.clients.azure.azure_workspace_handler.time.monotonic")
+    def test_entries_expire_after_their_ttl(self, mock_monotonic):
+        """Test that provisioned workspaces are kept longer than missing ones."""
+        mock_monotonic.return_value = 100.0
+        cache = WorkspaceInfoCache()
+        workspace_info = self._workspace_info(ProvisioningState.SUCCEEDED)
+        cache.put(("ws-name", "sub-id"), workspace_info)
+        cache.put(("missing-ws", "sub-id"), None)
+
+        mock_monotonic.return_value = 100.0 + WorkspaceInfoCache.NEGATIVE_TTL_SECONDS
+        self.assertEqual(cache.get(("ws-name", "sub-id")), (True, workspace_info))
+        self.assertEqual(cache.get(("missing-ws", "sub-id")), (False, None))
+
+        mock_monotonic.return_value = 100.0 + WorkspaceInfoCache.TTL_SECONDS
+        self.assertEqual(cache.get(("ws-name", "sub-id")), (False, None))
+
+    def test_invalidate_removes_entry(self):
+        """Test that an invalidated entry is looked up again."""
+        cache = WorkspaceInfoCache()
+        cache.put(("ws-name", "sub-id"), None)
+
+        cache.invalidate(("ws-name", "sub-id"))
+
+        self.assertEqual(cache.get(("ws-name", "sub-id")), (False, None))
+
+    def test_evicts_entries_when_full(self):
+        """Test that the cache doesn't grow beyond its maximum size."""
+        cache = WorkspaceInfoCache()
+        for index in range(WorkspaceInfoCache.MAX_SIZE + 1):
+            cache.put((f"ws-{index}", "sub-id"), None)
+
+        self.assertEqual(len(cache._entries), WorkspaceInfoCache.MAX_SIZE)
+        self.assertEqual(cache.get(("ws-0", "sub-id")), (False, None))
 
 
 # Test the main handler class
@@ -73,12 +208,16 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         """Set up mocks for all dependencies."""
         self.mock_azure_workspace_manager = MagicMock(
-            get_workspace=MagicMock(), create_if_not_exists_workspace=AsyncMock()
+            get_workspace=MagicMock(),
+            get_workspace_async=AsyncMock(),
+            create_if_not_exists_workspace=AsyncMock(),
         )
         self.mock_azure_permissions_manager = MagicMock(
             assign_permissions=MagicMock(),
+            assign_permissions_bulk_async=AsyncMock(),
             get_principal_role_assignments_on_resource=MagicMock(),
-            delete_role_assignment=MagicMock(),
+            get_role_assignments_on_resource_by_principals=MagicMock(),
+            delete_role_assignment_async=AsyncMock(),
         )
         self.mock_azure_mapper = MagicMock(map=AsyncMock())
 
@@ -163,14 +302,14 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
         # Assert
         self.assertFalse(result_info.is_managed)
         self.assertEqual(result_info.databricks_host, unmanaged_url)
-        self.mock_azure_workspace_manager.get_workspace.assert_not_called()
+        self.mock_azure_workspace_manager.get_workspace_async.assert_not_awaited()
         self.mock_azure_workspace_manager.create_if_not_exists_workspace.assert_not_called()
 
     async def test_provision_workspace_for_new_managed_workspace(self):
         """Test full provisioning flow for a new managed workspace."""
         # Arrange
         # 1. Workspace does not exist initially
-        self.mock_azure_workspace_manager.get_workspace.return_value = None
+        self.mock_azure_workspace_manager.get_workspace_async.return_value = None
         # 2. Creation returns a new workspace info object
         self.mock_azure_workspace_manager.create_if_not_exists_workspace.return_value = self.workspace_info
         # 3. Mapper successfully maps owner and group
@@ -184,15 +323,54 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
 
         # Assert
         self.assertEqual(result_info, self.workspace_info)
-        # Check creation call
+        # The lookup doesn't block the event loop
+        expected_rg_id = f"/subscriptions/sub-id/resourceGroups/{self.workspace_name}-rg"
+        self.mock_azure_workspace_manager.get_workspace_async.assert_awaited_once_with(
+            self.workspace_name, expected_rg_id
+        )
+        self.mock_azure_workspace_manager.get_workspace.assert_not_called()
+        # Check creation call, which doesn't look up the workspace again
         self.mock_azure_workspace_manager.create_if_not_exists_workspace.assert_awaited_once()
+        create_kwargs = self.mock_azure_workspace_manager.create_if_not_exists_workspace.await_args.kwargs
+        self.assertFalse(create_kwargs["check_first"])
         # Check permission calls
-        self.assertEqual(self.mock_azure_permissions_manager.assign_permissions.call_count, 2)
-        assign_calls = self.mock_azure_permissions_manager.assign_permissions.call_args_list
-        self.assertEqual(assign_calls[0].kwargs["principal_id"], "owner-obj-id")
-        self.assertEqual(assign_calls[0].kwargs["principal_type"], PrincipalType.USER)
-        self.assertEqual(assign_calls[1].kwargs["principal_id"], "group-obj-id")
-        self.assertEqual(assign_calls[1].kwargs["principal_type"], PrincipalType.GROUP)
+        # Both principals are mapped at once, and their roles are assigned in bulk
+        self.mock_azure_mapper.map.assert_awaited_once_with({"owner@test.com", "group:dev-group"})
+        self.mock_azure_permissions_manager.assign_permissions_bulk_async.assert_awaited_once()
+        (assignments,) = self.mock_azure_permissions_manager.assign_permissions_bulk_async.call_args.args
+        self.assertEqual(len(assignments), 2)
+        self.assertEqual(assignments[0].principal_id, "owner-obj-id")
+        self.assertEqual(assignments[0].principal_type, PrincipalType.USER)
+        self.assertEqual(assignments[1].principal_id, "group-obj-id")
+        self.assertEqual(assignments[1].principal_type, PrincipalType.GROUP)
+        self.assertEqual(assignments[0].resource_id, self.workspace_info.azure_resource_id)
+        self.assertEqual(assignments[1].resource_id, self.workspace_info.azure_resource_id)
+        # Role assignment names are derived from the assignment, so that retries reuse them
+        self.assertEqual(
+            assignments[0].permission_id,
+            AzureWorkspaceHandler._role_assignment_name(
+                self.workspace_info.azure_resource_id, "owner-role-id", "owner-obj-id"
+            ),
+        )
+        self.assertNotEqual(assignments[0].permission_id, assignments[1].permission_id)
+
+    async def test_provision_workspace_for_existing_managed_workspace(self):
+        """Test that an existing managed workspace is not created again, but its permissions are assigned."""
+        # Arrange
+        self.mock_azure_workspace_manager.get_workspace_async.return_value = self.workspace_info
+        self.mock_azure_mapper.map.return_value = {
+            "owner@test.com": "owner-obj-id",
+            "group:dev-group": "group-obj-id",
+        }
+
+        # Act
+        result_info = await self.handler.provision_workspace(self.data_product, self.component)
+
+        # Assert
+        self.assertEqual(result_info, self.workspace_info)
+        self.mock_azure_workspace_manager.get_workspace_async.assert_awaited_once()
+        self.mock_azure_workspace_manager.create_if_not_exists_workspace.assert_not_awaited()
+        self.mock_azure_permissions_manager.assign_permissions_bulk_async.assert_awaited_once()
 
     def test_get_workspace_info_by_name_for_managed_workspace(self):
         """Test retrieving info for a managed workspace by name."""
@@ -207,14 +385,50 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
         expected_rg_id = f"/subscriptions/sub-id/resourceGroups/{self.workspace_name}-rg"
         self.mock_azure_workspace_manager.get_workspace.assert_called_once_with(self.workspace_name, expected_rg_id)
 
+    def test_get_workspace_info_by_name_uses_cache(self):
+        """Test that repeated lookups of a managed workspace query Azure only once."""
+        # Arrange
+        self.handler.workspace_info_cache = WorkspaceInfoCache()
+        self.mock_azure_workspace_manager.get_workspace.return_value = self.workspace_info
+
+        # Act
+        first = self.handler.get_workspace_info_by_name(self.workspace_name)
+        second = self.handler.get_workspace_info_by_name(self.workspace_name)
+
+        # Assert
+        self.assertEqual(first, self.workspace_info)
+        self.assertEqual(second, self.workspace_info)
+        self.mock_azure_workspace_manager.get_workspace.assert_called_once()
+
+    async def test_provision_workspace_invalidates_cached_lookup(self):
+        """Test that creating a workspace drops the cached lookup that didn't find it."""
+        # Arrange
+        self.handler.workspace_info_cache = WorkspaceInfoCache()
+        self.mock_azure_workspace_manager.get_workspace_async.return_value = None
+        self.mock_azure_workspace_manager.create_if_not_exists_workspace.return_value = self.workspace_info
+        self.mock_azure_mapper.map.return_value = {
+            "owner@test.com": "owner-obj-id",
+            "group:dev-group": "group-obj-id",
+        }
+
+        # Act
+        await self.handler.provision_workspace(self.data_product, self.component)
+        self.mock_azure_workspace_manager.get_workspace.return_value = self.workspace_info
+        result_info = self.handler.get_workspace_info_by_name(self.workspace_name)
+
+        # Assert
+        self.assertEqual(result_info, self.workspace_info)
+        self.mock_azure_workspace_manager.get_workspace_async.assert_awaited_once()
+        self.mock_azure_workspace_manager.get_workspace.assert_called_once()
+
     async def test_manage_azure_permissions_for_no_permissions(self):
         """Test that 'no_permissions' logic correctly removes existing roles."""
         # Arrange, we're mocking RoleAssignment since is a readonly class
         role_assignment_to_delete = MagicMock()
         role_assignment_to_delete.id = "test-workspace/role-assignment-id"
-        self.mock_azure_permissions_manager.get_principal_role_assignments_on_resource.return_value = [
-            role_assignment_to_delete
-        ]
+        self.mock_azure_permissions_manager.get_role_assignments_on_resource_by_principals.return_value = {
+            "principal-obj-id": [role_assignment_to_delete]
+        }
         self.mock_azure_mapper.map.return_value = {"principal-to-clean": "principal-obj-id"}
 
         # Act
@@ -227,16 +441,65 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
         )
 
         # Assert
-        self.mock_azure_permissions_manager.get_principal_role_assignments_on_resource.assert_called_once()
-        self.mock_azure_permissions_manager.delete_role_assignment.assert_called_once_with(
+        self.mock_azure_permissions_manager.get_role_assignments_on_resource_by_principals.assert_called_once()
+        self.mock_azure_permissions_manager.delete_role_assignment_async.assert_awaited_once_with(
             workspace_name=self.workspace_info.name, role_assignment_id="test-workspace/role-assignment-id"
         )
         self.mock_azure_permissions_manager.assign_permissions.assert_not_called()
 
+    async def test_provision_workspace_with_no_permissions_retrieves_role_assignments_once(self):
+        """Test that the role assignments of all the principals with 'no_permissions' are retrieved together."""
+        # Arrange
+        self.mock_settings.azure.permissions.dp_owner_role_definition_id = "no_permissions"
+        self.mock_settings.azure.permissions.dev_group_role_definition_id = "no_permissions"
+        self.mock_azure_workspace_manager.get_workspace_async.return_value = None
+        self.mock_azure_workspace_manager.create_if_not_exists_workspace.return_value = self.workspace_info
+        self.mock_azure_mapper.map.return_value = {
+            "owner@test.com": "owner-obj-id",
+            "group:dev-group": "group-obj-id",
+        }
+        owner_assignment = MagicMock(id="test-workspace/owner-assignment-id")
+        group_assignment = MagicMock(id="test-workspace/group-assignment-id")
+        self.mock_azure_permissions_manager.get_role_assignments_on_resource_by_principals.return_value = {
+            "owner-obj-id": [owner_assignment],
+            "group-obj-id": [group_assignment],
+        }
+
+        # Act
+        await self.handler.provision_workspace(self.data_product, self.component)
+
+        # Assert
+        lookup = self.mock_azure_permissions_manager.get_role_assignments_on_resource_by_principals
+        lookup.assert_called_once()
+        self.assertEqual(set(lookup.call_args.kwargs["principal_ids"]), {"owner-obj-id", "group-obj-id"})
+        self.assertEqual(self.mock_azure_permissions_manager.delete_role_assignment_async.await_count, 2)
+        self.mock_azure_permissions_manager.assign_permissions_bulk_async.assert_awaited_once_with([])
+
+    async def test_handle_no_permissions_deletes_every_role_assignment(self):
+        """Test that a failed deletion doesn't stop the others, and that every failure is reported."""
+        # Arrange
+        assignments = [MagicMock(id=f"test-workspace/assignment-{index}") for index in range(3)]
+        self.mock_azure_permissions_manager.get_role_assignments_on_resource_by_principals.return_value = {
+            "principal-obj-id": assignments
+        }
+        self.mock_azure_permissions_manager.delete_role_assignment_async.side_effect = [
+            None,
+            MapperError("Deletion failed"),
+            None,
+        ]
+
+        # Act & Assert
+        with self.assertRaises(WorkspaceHandlerError) as context:
+            await self.handler._handle_no_permissions(
+                self.workspace_info, ["principal-obj-id"], self.mock_settings.azure.permissions
+            )
+        self.assertEqual(self.mock_azure_permissions_manager.delete_role_assignment_async.await_count, 3)
+        self.assertIn("Deletion failed", str(context.exception))
+
     async def test_provision_workspace_fails_if_mapper_fails(self):
         """Test that provisioning fails if the AzureMapper returns an error."""
         # Arrange
-        self.mock_azure_workspace_manager.get_workspace.return_value = None
+        self.mock_azure_workspace_manager.get_workspace_async.return_value = None
         self.mock_azure_workspace_manager.create_if_not_exists_workspace.return_value = self.workspace_info
         # Simulate a mapping failure for the owner
         self.mock_azure_mapper.map.return_value = {"owner@test.com": MapperError("User not found")}
@@ -245,6 +508,22 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(WorkspaceHandlerError):
             await self.handler.provision_workspace(self.data_product, self.component)
 
+    def test_get_workspace_info_by_name_requires_permissions_settings_for_managed_workspaces(self):
+        """Test that managed workspaces can't be looked up without azure.permissions, unlike unmanaged ones."""
+        # Arrange
+        self.mock_settings.azure.permissions = None
+        handler = AzureWorkspaceHandler(
+            azure_workspace_manager=self.mock_azure_workspace_manager,
+            azure_permissions_manager=self.mock_azure_permissions_manager,
+            azure_mapper=self.mock_azure_mapper,
+        )
+
+        # Act & Assert
+        with self.assertRaisesRegex(WorkspaceHandlerError, "azure.permissions is not configured"):
+            handler.get_workspace_info_by_name(self.workspace_name)
+        self.assertIsNotNone(handler.get_workspace_info_by_name("https://adb-12345.6.azuredatabricks.net"))
+        self.mock_azure_workspace_manager.get_workspace.assert_not_called()
+
     def test_get_workspace_info_by_name_for_unmanaged_workspace(self):
         """Test retrieving info for an unmanaged workspace via its URL."""
         # Arrange
@@ -261,6 +540,19 @@ class TestAzureWorkspaceHandler(unittest.IsolatedAsyncioTestCase):
         # Crucially, no call should be made to the Azure API for a URL
         self.mock_azure_workspace_manager.get_workspace.assert_not_called()
 
+    def test_get_workspace_info_by_name_only_accepts_ascii_workspace_ids(self):
+        """Test that a URL-like identifier with non ASCII digits is looked up as a managed workspace name."""
+        # Arrange
+        identifier = "adb-\u0665\u0665\u0665.7.azuredatabricks.net"
+        self.mock_azure_workspace_manager.get_workspace.return_value = None
+
+        # Act
+        result_info = self.handler.get_workspace_info_by_name(identifier)
+
+        # Assert
+        self.assertIsNone(result_info)
+        self.mock_azure_workspace_manager.get_workspace.assert_called_once()
+
     def test_get_workspace_info_from_component(self):
         """
         Test getting workspace info from a component
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from azure.core.exceptions import ResourceExistsError
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
 from azure.mgmt.databricks.models import ProvisioningState, Workspace
 
 from src.models.databricks.exceptions import AzureWorkspaceManagerError
@@ -40,41 +40,49 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
     def test_get_workspace_success(self):
         """Test successful retrieval of an existing workspace."""
         # Arrange
-        # Create mock Workspace objects to be returned by the SDK
+        # Use a different case to test the case-insensitive comparison of the managed resource group
         matching_workspace = Workspace(
-            managed_resource_group_id=self.managed_rg_id,
+            managed_resource_group_id=self.managed_rg_id.upper(),
             location=self.region,
         )
-        # Use a different case to test the case-insensitive comparison
-        matching_workspace.name = self.workspace_name.upper()
+        matching_workspace.name = self.workspace_name
         matching_workspace.workspace_id = "ws-id-123"
         matching_workspace.workspace_url = "https://host.com"
         matching_workspace.id = "azure-res-id"
         matching_workspace.provisioning_state = ProvisioningState.SUCCEEDED
-
-        non_matching_workspace = Workspace(managed_resource_group_id="other-rg-id", location=self.region)
-        non_matching_workspace.name = "other-workspace"
-
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = [
-            non_matching_workspace,
-            matching_workspace,
-        ]
+        self.mock_sync_client.workspaces.get.return_value = matching_workspace
 
         # Act
         result = self.manager.get_workspace(self.workspace_name, self.managed_rg_id)
 
         # Assert
         self.assertIsNotNone(result)
-        self.assertEqual(result.name.lower(), self.workspace_name.lower())
+        self.assertEqual(result.name, self.workspace_name)
         self.assertEqual(result.id, "ws-id-123")
-        self.mock_sync_client.workspaces.list_by_subscription.assert_called_once()
+        self.assertEqual(result.azure_resource_id, "azure-res-id")
+        self.assertEqual(result.azure_resource_url, "https://portal.azure.com/#@test-tenant-id/resource/azure-res-id")
+        self.mock_sync_client.workspaces.get.assert_called_once_with(
+            resource_group_name="test-rg-main", workspace_name=self.workspace_name
+        )
+        self.mock_sync_client.workspaces.list_by_subscription.assert_not_called()
 
     def test_get_workspace_not_found(self):
-        """Test that None is returned when no matching workspace is found."""
+        """Test that None is returned when the workspace doesn't exist."""
+        # Arrange
+        self.mock_sync_client.workspaces.get.side_effect = ResourceNotFoundError("Workspace not found")
+
+        # Act
+        result = self.manager.get_workspace(self.workspace_name, self.managed_rg_id)
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_get_workspace_with_different_managed_resource_group(self):
+        """Test that None is returned when the workspace has a different managed resource group."""
         # Arrange
         workspace = Workspace(managed_resource_group_id="other-rg", location=self.region)
-        workspace.name = "other-ws"
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = [workspace]
+        workspace.name = self.workspace_name
+        self.mock_sync_client.workspaces.get.return_value = workspace
 
         # Act
         result = self.manager.get_workspace(self.workspace_name, self.managed_rg_id)
@@ -85,12 +93,55 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
     def test_get_workspace_api_error(self):
         """Test that an API error during retrieval is wrapped in the correct exception."""
         # Arrange
-        self.mock_sync_client.workspaces.list_by_subscription.side_effect = Exception("API is down")
+        self.mock_sync_client.workspaces.get.side_effect = Exception("API is down")
 
         # Act & Assert
         with self.assertRaisesRegex(AzureWorkspaceManagerError, "An error occurred while getting info for workspace"):
             self.manager.get_workspace(self.workspace_name, self.managed_rg_id)
 
+    async def test_get_workspace_async_success(self):
+        """Test that the async lookup reads the workspace with the async client."""
+        # Arrange
+        workspace = Workspace(managed_resource_group_id=self.managed_rg_id, location=self.region)
+        workspace.name = self.workspace_name
+        workspace.workspace_id = "ws-id-123"
+        workspace.workspace_url = "https://host.com"
+        workspace.id = "azure-res-id"
+        workspace.provisioning_state = ProvisioningState.SUCCEEDED
+        self.mock_async_client.workspaces.get.return_value = workspace
+
+        # Act
+        result = await self.manager.get_workspace_async(self.workspace_name, self.managed_rg_id)
+
+        # Assert
+        self.assertEqual(result.id, "ws-id-123")
+        self.mock_async_client.workspaces.get.assert_awaited_once_with(
+            resource_group_name="test-rg-main", workspace_name=self.workspace_name
+        )
+        self.mock_sync_client.workspaces.get.assert_not_called()
+
+    async def test_get_workspace_async_not_found(self):
+        """Test that the async lookup returns None when the workspace doesn't exist."""
+        # Arrange
+        self.mock_async_client.workspaces.get.side_effect = ResourceNotFoundError("Workspace not found")
+
+        # Act
+        result = await self.manager.get_workspace_async(self.workspace_name, self.managed_rg_id)
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_get_workspace_requires_permissions_settings(self):
+        """Test that workspaces can't be looked up if azure.permissions isn't configured."""
+        # Arrange
+        self.mock_settings.azure.permissions = None
+        manager = AzureWorkspaceManager(self.mock_sync_client, self.mock_async_client)
+
+        # Act & Assert
+        with self.assertRaisesRegex(AzureWorkspaceManagerError, "azure.permissions is not configured"):
+            manager.get_workspace(self.workspace_name, self.managed_rg_id)
+        self.mock_sync_client.workspaces.get.assert_not_called()
+
     # --- Tests for create_if_not_exists_workspace ---
 
     async def test_create_if_not_exists_skips_if_workspace_exists(self):
@@ -102,7 +153,7 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
         workspace.id = "new-azure-res-id"
         workspace.workspace_id = "new-ws-id"
         workspace.workspace_url = "https://new-host.com"
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = [workspace]
+        self.mock_async_client.workspaces.get.return_value = workspace
 
         # Act
         result = await self.manager.create_if_not_exists_workspace(
@@ -118,7 +169,7 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
         """Test the successful creation of a new workspace."""
         # Arrange
         # 1. No existing workspace is found
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = []
+        self.mock_async_client.workspaces.get.side_effect = ResourceNotFoundError("Workspace not found")
 
         # 2. Mock the async poller and its result
         mock_poller = AsyncMock()
@@ -152,10 +203,32 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(params.location, self.region)
         self.assertEqual(params.sku.name, self.sku_type.value)
 
+    async def test_create_if_not_exists_without_checking_first(self):
+        """Test that the workspace is created without looking it up if check_first is False."""
+        # Arrange
+        mock_poller = AsyncMock()
+        mock_workspace_result = Workspace(location=self.region, managed_resource_group_id=self.managed_rg_id)
+        mock_workspace_result.provisioning_state = ProvisioningState.SUCCEEDED
+        mock_workspace_result.name = self.workspace_name
+        mock_workspace_result.workspace_id = "new-ws-id"
+        mock_workspace_result.workspace_url = "https://new-host.com"
+        mock_poller.result.return_value = mock_workspace_result
+        self.mock_async_client.workspaces.begin_create_or_update.return_value = mock_poller
+
+        # Act
+        result = await self.manager.create_if_not_exists_workspace(
+            self.workspace_name, self.region, "test-rg-main", self.managed_rg_id, self.sku_type, check_first=False
+        )
+
+        # Assert
+        self.assertEqual(result.id, "new-ws-id")
+        self.mock_async_client.workspaces.get.assert_not_awaited()
+        self.mock_async_client.workspaces.begin_create_or_update.assert_awaited_once()
+
     async def test_create_if_not_exists_fails_if_provisioning_state_not_succeeded(self):
         """Test that an error is raised if the created workspace is not in a Succeeded state."""
         # Arrange
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = []
+        self.mock_async_client.workspaces.get.side_effect = ResourceNotFoundError("Workspace not found")
         mock_poller = AsyncMock()
         mock_poller.result.return_value = Workspace(
             provisioning_state=ProvisioningState.FAILED,
@@ -173,7 +246,7 @@ class TestAzureWorkspaceManager(unittest.IsolatedAsyncioTestCase):
     async def test_create_if_not_exists_handles_resource_exists_error(self):
         """Test that a ResourceExistsError from the SDK is handled and wrapped."""
         # Arrange
-        self.mock_sync_client.workspaces.list_by_subscription.return_value = []
+        self.mock_async_client.workspaces.get.side_effect = ResourceNotFoundError("Workspace not found")
         self.mock_async_client.workspaces.begin_create_or_update.side_effect = ResourceExistsError(
             "Simulating a race condition where creation has just started."
         )
@@ -161,6 +161,17 @@ class TestDLTManager(unittest.TestCase):
         # Act & Assert
         with self.assertRaisesRegex(DLTManagerError, "requires at least one notebook or file"):
             self.dlt_manager.create_or_update_dlt_pipeline(**pipeline_args)
+        self.mock_workspace_client.pipelines.list_pipelines.assert_not_called()
+
+    def test_create_or_update_fails_building_settings(self):
+        """Test that an unexpected error while building the pipeline settings is wrapped in a DLTManagerError."""
+        # Arrange
+        self.dlt_manager._build_clusters = MagicMock(side_effect=ValueError("Invalid cluster"))
+
+        # Act & Assert
+        with self.assertRaisesRegex(DLTManagerError, "error occurred while building the settings"):
+            self.dlt_manager.create_or_update_dlt_pipeline(**self.base_pipeline_args)
+        self.mock_workspace_client.pipelines.list_pipelines.assert_not_called()
 
     def test_update_fails_with_no_libraries(self):
         """Test that pipeline update fails if no notebooks or files are provided."""
@@ -217,6 +228,37 @@ class TestDLTManager(unittest.TestCase):
         self.assertEqual(result_id, self.pipeline_id)
         self.mock_workspace_client.pipelines.list_pipelines.assert_called_once()
 
+    def test_retrieve_pipeline_id_from_name_reuses_found_id(self):
+        """Test that a pipeline found by name isn't looked up again by the same manager."""
+        # Arrange
+        existing_pipeline = PipelineStateInfo(pipeline_id=self.pipeline_id, name=self.pipeline_name)
+        self.mock_workspace_client.pipelines.list_pipelines.return_value = [existing_pipeline]
+
+        # Act
+        first_id = self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
+        second_id = self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
+
+        # Assert
+        self.assertEqual(first_id, self.pipeline_id)
+        self.assertEqual(second_id, self.pipeline_id)
+        self.mock_workspace_client.pipelines.list_pipelines.assert_called_once()
+
+    def test_retrieve_pipeline_id_from_name_after_delete(self):
+        """Test that deleting a pipeline forgets its ID, so the name is looked up again."""
+        # Arrange
+        existing_pipeline = PipelineStateInfo(pipeline_id=self.pipeline_id, name=self.pipeline_name)
+        self.mock_workspace_client.pipelines.list_pipelines.return_value = [existing_pipeline]
+        self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
+
+        # Act
+        self.dlt_manager.delete_pipeline(self.pipeline_id)
+        self.mock_workspace_client.pipelines.list_pipelines.return_value = []
+
+        # Assert
+        with self.assertRaisesRegex(DLTManagerError, "no DLT found with that name"):
+            self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
+        self.assertEqual(self.mock_workspace_client.pipelines.list_pipelines.call_count, 2)
+
     def test_retrieve_pipeline_id_fails_if_not_found(self):
         """Test failure to retrieve ID when no pipeline is found."""
         # Arrange
@@ -236,6 +278,23 @@ class TestDLTManager(unittest.TestCase):
         with self.assertRaisesRegex(DLTManagerError, "more than 1 DLT found with that name"):
             self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
 
+    def test_retrieve_pipeline_id_stops_listing_after_two_pipelines(self):
+        """Test that the remaining pipelines aren't consumed once a name clash is found."""
+        # Arrange
+        consumed = []
+
+        def pipelines():
+            for pipeline_id in ["id1", "id2", "id3"]:
+                consumed.append(pipeline_id)
+                yield PipelineStateInfo(pipeline_id=pipeline_id)
+
+        self.mock_workspace_client.pipelines.list_pipelines.return_value = pipelines()
+
+        # Act & Assert
+        with self.assertRaisesRegex(DLTManagerError, "more than 1 DLT found with that name"):
+            self.dlt_manager.retrieve_pipeline_id_from_name(self.pipeline_name)
+        self.assertEqual(consumed, ["id1", "id2"])
+
     def test_retrieve_pipeline_id_fails_if_id_is_empty(self):
         """Test failure when the found pipeline has an empty ID."""
         # Arrange
@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 
-from src.models.databricks.exceptions import AzureMapperError
+from src.models.databricks.exceptions import AzureGraphClientError, AzureMapperError
 from src.service.principals_mapping.azure_mapper import GROUP_PREFIX, USER_PREFIX, AzureMapper
 
 
@@ -12,8 +12,8 @@ class TestAzureMapper(unittest.IsolatedAsyncioTestCase):
         """Set up the test environment with a mocked AzureGraphClient."""
         self.mock_azure_client = MagicMock()
         # The methods we call are async, so they need to be mocked with AsyncMock
-        self.mock_azure_client.get_user_id = AsyncMock()
-        self.mock_azure_client.get_group_id = AsyncMock()
+        self.mock_azure_client.get_user_ids = AsyncMock()
+        self.mock_azure_client.get_group_ids = AsyncMock()
 
         # Instantiate the class under test with the mocked client
         self.mapper = AzureMapper(self.mock_azure_client)
@@ -29,8 +29,8 @@ class TestAzureMapper(unittest.IsolatedAsyncioTestCase):
     async def test_map_all_subjects_successfully(self):
         """Test mapping a set of subjects where all lookups succeed."""
         # Arrange
-        self.mock_azure_client.get_user_id.return_value = self.user_id
-        self.mock_azure_client.get_group_id.return_value = self.group_id
+        self.mock_azure_client.get_user_ids.return_value = {"john.doe@company.com": self.user_id}
+        self.mock_azure_client.get_group_ids.return_value = {"Test Developers": self.group_id}
         subjects_to_map = {self.user_subject_witboost_format, self.group_subject}
 
         # Act
@@ -43,17 +43,17 @@ class TestAzureMapper(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(results[self.group_subject], self.group_id)
 
         # Verify the client methods were called with correctly formatted arguments
-        self.mock_azure_client.get_user_id.assert_awaited_once_with("john.doe@company.com")
-        self.mock_azure_client.get_group_id.assert_awaited_once_with("Test Developers")
+        self.mock_azure_client.get_user_ids.assert_awaited_once_with({"john.doe@company.com"})
+        self.mock_azure_client.get_group_ids.assert_awaited_once_with({"Test Developers"})
 
     async def test_map_with_partial_failure(self):
         """Test mapping where one subject succeeds and another fails."""
         # Arrange
         # User lookup succeeds
-        self.mock_azure_client.get_user_id.return_value = self.user_id
+        self.mock_azure_client.get_user_ids.return_value = {"jane.doe@company.com": self.user_id}
         # Group lookup fails with a specific error from the client
         client_error = AzureMapperError("Group not found in Azure AD")
-        self.mock_azure_client.get_group_id.side_effect = client_error
+        self.mock_azure_client.get_group_ids.return_value = {"Test Developers": client_error}
         subjects_to_map = {self.user_subject_email_format, self.group_subject}
 
         # Act
@@ -80,22 +80,49 @@ class TestAzureMapper(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(results[invalid_subject], AzureMapperError)
         self.assertIn("neither a Witboost user nor a group", str(results[invalid_subject]))
         # The client should not have been called
-        self.mock_azure_client.get_user_id.assert_not_awaited()
-        self.mock_azure_client.get_group_id.assert_not_awaited()
+        self.mock_azure_client.get_user_ids.assert_not_awaited()
+        self.mock_azure_client.get_group_ids.assert_not_awaited()
 
-    async def test_get_and_map_user_with_witboost_format(self):
-        """Test the internal user mapping logic for the underscore format."""
+    async def test_map_wraps_client_errors(self):
+        """Test that client errors, both per subject and for the whole batch, are wrapped in AzureMapperError."""
         # Arrange
-        witboost_user_string = "first.last_my-domain.com"
-        expected_email = "first.last@my-domain.com"
-        self.mock_azure_client.get_user_id.return_value = self.user_id
+        self.mock_azure_client.get_user_ids.return_value = {
+            "jane.doe@company.com": AzureGraphClientError("User jane.doe@company.com not found")
+        }
+        self.mock_azure_client.get_group_ids.side_effect = Exception("Batch request failed")
+        subjects_to_map = {self.user_subject_email_format, self.group_subject}
 
         # Act
-        result_id = await self.mapper._get_and_map_user(witboost_user_string)
+        results = await self.mapper.map(subjects_to_map)
 
         # Assert
-        self.assertEqual(result_id, self.user_id)
-        self.mock_azure_client.get_user_id.assert_awaited_once_with(expected_email)
+        self.assertIsInstance(results[self.user_subject_email_format], AzureMapperError)
+        self.assertIn("not found", str(results[self.user_subject_email_format]))
+        self.assertIsInstance(results[self.group_subject], AzureMapperError)
+        self.assertIn("Batch request failed", str(results[self.group_subject]))
+
+    async def test_map_looks_up_users_in_a_single_batch(self):
+        """Test that all users are resolved with a single batched call."""
+        # Arrange
+        self.mock_azure_client.get_user_ids.return_value = {
+            "john.doe@company.com": "id-1",
+            "jane.doe@company.com": "id-2",
+        }
+        subjects_to_map = {self.user_subject_witboost_format, self.user_subject_email_format}
+
+        # Act
+        results = await self.mapper.map(subjects_to_map)
+
+        # Assert
+        self.assertEqual(results[self.user_subject_witboost_format], "id-1")
+        self.assertEqual(results[self.user_subject_email_format], "id-2")
+        self.mock_azure_client.get_user_ids.assert_awaited_once_with({"john.doe@company.com", "jane.doe@company.com"})
+        self.mock_azure_client.get_group_ids.assert_not_awaited()
+
+    def test_user_to_mail_with_witboost_format(self):
+        """Test the internal user mapping logic for the underscore format."""
+        self.assertEqual(AzureMapper._user_to_mail("first.last_my-domain.com"), "first.last@my-domain.com")
+        self.assertEqual(AzureMapper._user_to_mail("first.last@my-domain.com"), "first.last@my-domain.com")
 
     async def test_map_empty_set_returns_empty_dict(self):
         """Test that mapping an empty set of subjects returns an empty dictionary."""
@@ -104,5 +131,5 @@ class TestAzureMapper(unittest.IsolatedAsyncioTestCase):
 
         # Assert
         self.assertEqual(results, {})
-        self.mock_azure_client.get_user_id.assert_not_awaited()
-        self.mock_azure_client.get_group_id.assert_not_awaited()
+        self.mock_azure_client.get_user_ids.assert_not_awaited()
+        self.mock_azure_client.get_group_ids.assert_not_awaited()
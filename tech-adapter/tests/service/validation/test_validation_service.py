@@ -7,7 +7,12 @@ from src.models.api_models import RequestValidationError
 from src.models.data_product_descriptor import DataContract, DataProduct, OutputPort, Workload
 from src.models.databricks.databricks_models import DatabricksOutputPort, DLTWorkload, JobWorkload, WorkflowWorkload
 from src.models.exceptions import ProvisioningError
-from src.service.validation.validation_service import _parse_component, validate, validate_update_acl
+from src.service.validation.validation_service import (
+    _discriminate_component,
+    _parse_component,
+    validate,
+    validate_update_acl,
+)
 
 
 class TestValidationService(unittest.TestCase):
@@ -197,6 +202,18 @@ class TestValidationService(unittest.TestCase):
         with self.assertRaisesRegex(ProvisioningError, "unsupported use case template id"):
             _parse_component(self.job_workload)
 
+    @patch("src.service.validation.validation_service.settings")
+    def test_discriminate_component(self, mock_settings):
+        """Test that the union tag is chosen from the use case template ID of the component."""
+        mock_settings.usecasetemplateid.workload.job = []
+        mock_settings.usecasetemplateid.workload.workflow = []
+        mock_settings.usecasetemplateid.outputPort = []
+        mock_settings.usecasetemplateid.workload.dlt = ["urn:dmb:utm:databricks-workload-dlt-template"]
+
+        self.assertEqual(_discriminate_component(self.dlt_workload.model_dump(by_alias=True)), "dlt")
+        self.assertIsNone(_discriminate_component(self.job_workload.model_dump(by_alias=True)))
+        self.assertIsNone(_discriminate_component({}))
+
     def test_validate_success_for_workload(self):
         """Test the main validation function for a valid JobWorkload component."""
         # Arrange
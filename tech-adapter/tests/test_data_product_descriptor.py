@@ -15,6 +15,7 @@ from src.models.data_product_descriptor import (
     OpenMetadataColumn,
     OutputPort,
     StorageArea,
+    TagSourceTagLabel,
     Workload,
 )
 from src.utility.parsing_pydantic_models import parse_yaml_with_model
@@ -355,3 +356,22 @@ class TestDataProductDescriptor(unittest.TestCase):
 
         with pytest.raises(pydantic_core.ValidationError, match="4 validation errors for OutputPort"):
             data_product.get_typed_component_by_id(invalid_component_to_provision, OutputPort)
+
+    def test_construct_trusted_data_product(self):
+        request = yaml.safe_load(Path("tests/descriptors/descriptor_output_port_valid.yaml").read_text())
+        validated = parse_yaml_with_model(request.get("dataProduct"), DataProduct)
+
+        constructed = DataProduct.construct_trusted(request.get("dataProduct"))
+
+        assert constructed == validated
+        component = constructed.get_component_by_id(request.get("componentIdToProvision"))
+        assert isinstance(component, OutputPort)
+
+    def test_case_insensitive_enum(self):
+        assert TagSourceTagLabel("Glossary") is TagSourceTagLabel.GLOSSARY
+        assert TagSourceTagLabel("gLoSsArY") is TagSourceTagLabel.GLOSSARY
+        assert ConnectionTypeWorkload("housekeeping") is ConnectionTypeWorkload.HOUSEKEEPING
+        with pytest.raises(ValueError):
+            TagSourceTagLabel("unknown")
+        with pytest.raises(ValueError):
+            TagSourceTagLabel(1)
@@ -1,6 +1,6 @@
 import unittest
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from fastapi import FastAPI
 from starlette.testclient import TestClient
@@ -8,6 +8,10 @@ from starlette.testclient import TestClient
 from src.dependencies import (
     UnpackedProvisioningRequestDep,
     UnpackedUpdateAclRequestDep,
+    _descriptor_cache,
+    clear_descriptor_cache,
+    get_shared_account_client,
+    get_workspace_handler,
     unpack_provisioning_request,
     unpack_update_acl_request,
 )
@@ -38,6 +42,18 @@ class TestUnpackUpdateAclRequest(unittest.TestCase):
         self.assertEqual(result[1], "id123")
         self.assertEqual(result[2], self.update_acl_request.refs)
 
+    def test_unpack_with_empty_refs(self):
+        update_acl_request = UpdateAclRequest(
+            refs=[],
+            provisionInfo=ProvisionInfo(request=self.descriptor_str, result="result_prov"),
+        )
+
+        result = unpack_update_acl_request(update_acl_request)
+
+        self.assertIsInstance(result, tuple)
+        self.assertIsInstance(result[0], DataProduct)
+        self.assertEqual(result[2], [])
+
     async def test_invalid_request(self):
         # Create a mock UpdateAclRequest instance with an invalid request
         update_acl_request = Mock()
@@ -90,6 +106,93 @@ class TestUnpackProvisioningRequest(unittest.TestCase):
         result = unpack_provisioning_request(provisioning_request)
         self.assertIsInstance(result, RequestValidationError)
 
+    def test_unexpected_descriptor_kind(self):
+        provisioning_request = ProvisioningRequest(
+            descriptorKind="DATAPRODUCT_DESCRIPTOR",
+            descriptor=self.descriptor_str,
+        )
+
+        result = unpack_provisioning_request(provisioning_request)
+
+        self.assertIsInstance(result, RequestValidationError)
+        self.assertEqual(
+            result.errors,
+            [
+                "Expecting a COMPONENT_DESCRIPTOR but got a DATAPRODUCT_DESCRIPTOR instead; "
+                "please check with the platform team."
+            ],
+        )
+        self.assertIs(unpack_provisioning_request(provisioning_request), result)
+
+
+class TestDescriptorCache(unittest.TestCase):
+    descriptor_str = Path("tests/descriptors/descriptor_output_port_valid.yaml").read_text()
+
+    def setUp(self):
+        clear_descriptor_cache()
+
+    def test_same_descriptor_is_parsed_once(self):
+        provisioning_request = ProvisioningRequest(
+            descriptorKind="COMPONENT_DESCRIPTOR",
+            descriptor=self.descriptor_str,
+        )
+        update_acl_request = UpdateAclRequest(
+            refs=["user:testuser"],
+            provisionInfo=ProvisionInfo(request=self.descriptor_str, result="result_prov"),
+        )
+
+        provision_result = unpack_provisioning_request(provisioning_request)
+        update_acl_result = unpack_update_acl_request(update_acl_request)
+
+        self.assertIsInstance(provision_result, tuple)
+        self.assertIsInstance(update_acl_result, tuple)
+        self.assertIs(provision_result[0], update_acl_result[0])
+
+    def test_clear_descriptor_cache(self):
+        provisioning_request = ProvisioningRequest(
+            descriptorKind="COMPONENT_DESCRIPTOR",
+            descriptor=self.descriptor_str,
+        )
+
+        first = unpack_provisioning_request(provisioning_request)
+        clear_descriptor_cache()
+        second = unpack_provisioning_request(provisioning_request)
+
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(first[0], second[0])
+
+    def test_evicted_validated_descriptor_skips_validation(self):
+        provisioning_request = ProvisioningRequest(
+            descriptorKind="COMPONENT_DESCRIPTOR",
+            descriptor=self.descriptor_str,
+        )
+        first = unpack_provisioning_request(provisioning_request)
+        _descriptor_cache.clear()
+
+        with patch("src.dependencies.parse_yaml_with_model") as parse_mock:
+            second = unpack_provisioning_request(provisioning_request)
+
+        parse_mock.assert_not_called()
+        self.assertEqual(first[0], second[0])
+
+
+class TestGetWorkspaceHandler(unittest.TestCase):
+    def test_workspace_handler_reuses_application_clients(self):
+        request = Mock()
+
+        handler = get_workspace_handler(request)
+
+        self.assertIs(handler.azure_workspace_manager, request.app.state.azure_workspace_manager)
+        self.assertIs(handler.azure_permissions_manager, request.app.state.azure_permissions_manager)
+        self.assertIs(handler.azure_mapper, request.app.state.azure_mapper)
+        self.assertIs(handler.workspace_client_cache, request.app.state.workspace_client_cache)
+        self.assertIs(handler.workspace_info_cache, request.app.state.workspace_info_cache)
+
+    def test_account_client_is_shared(self):
+        request = Mock()
+
+        self.assertIs(get_shared_account_client(request), request.app.state.account_client)
+
 
 app_test = FastAPI()
 
@@ -149,6 +252,18 @@ class TestAppDependenciesMock(unittest.TestCase):
         assert "Provisioning failed" in response.json()["message"]
         assert "errors" in response.json()
 
+    def test_provision_malformed_body(self):
+        response = client.post("/provision", content=b"not a json")
+
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    def test_provision_invalid_descriptor_kind(self):
+        response = client.post("/provision", json={"descriptorKind": "UNKNOWN", "descriptor": "descriptor"})
+
+        assert response.status_code == 422
+        assert "descriptorKind" in response.json()["detail"][0]["msg"]
+
     def test_updateacl_valid_request(self):
         descriptor_str = Path("tests/descriptors/descriptor_output_port_valid.yaml").read_text()
         valid_update_acl_request = UpdateAclRequest(
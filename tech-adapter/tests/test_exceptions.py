@@ -0,0 +1,67 @@
+import pickle
+import unittest
+
+from src.models.exceptions import (
+    ProvisioningError,
+    build_error_message_from_chained_exception,
+    get_error_list_from_chained_exception,
+    iter_error_strings,
+)
+
+
+def _raise_chain() -> Exception:
+    try:
+        try:
+            try:
+                raise ValueError("root cause")
+            except ValueError:
+                raise ProvisioningError(["first error", "second error"])
+        except ProvisioningError:
+            raise RuntimeError("top level")
+    except RuntimeError as e:
+        return e
+
+
+class TestChainedExceptions(unittest.TestCase):
+    def test_get_error_list_from_chained_exception(self):
+        e = _raise_chain()
+
+        self.assertEqual(
+            get_error_list_from_chained_exception(e), ["top level", "first error", "second error", "root cause"]
+        )
+
+    def test_build_error_message_from_chained_exception(self):
+        e = _raise_chain()
+
+        self.assertEqual(
+            build_error_message_from_chained_exception(e),
+            'top level\n caused by: "first error,second error"\n caused by: "root cause"',
+        )
+
+    def test_explicit_cause_is_followed(self):
+        cause = ValueError("root cause")
+        e = RuntimeError("top level")
+        e.__cause__ = cause
+
+        self.assertEqual(get_error_list_from_chained_exception(e), ["top level", "root cause"])
+        self.assertEqual(list(iter_error_strings(e)), ["top level", "root cause"])
+
+    def test_cyclic_chain_terminates(self):
+        first = ValueError("first")
+        second = ValueError("second")
+        first.__context__ = second
+        second.__context__ = first
+
+        self.assertEqual(get_error_list_from_chained_exception(first), ["first", "second"])
+        self.assertEqual(build_error_message_from_chained_exception(first), 'first\n caused by: "second"')
+
+    def test_provisioning_error_message(self):
+        e = ProvisioningError(["first error", "second error"])
+
+        self.assertEqual(str(e), "first error,second error")
+        self.assertEqual(e.errors, ["first error", "second error"])
+
+    def test_provisioning_error_pickle(self):
+        e = pickle.loads(pickle.dumps(ProvisioningError(["first error", "second error"])))
+
+        self.assertEqual(e.errors, ["first error", "second error"])
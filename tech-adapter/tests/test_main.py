@@ -10,12 +10,13 @@ from src.dependencies import (
     create_update_acl_service,
     get_workspace_handler,
 )
-from src.main import app
+from src.main import REQUEST_ID_PREFIX, app, next_request_id
 from src.models.api_models import (
     DescriptorKind,
     ProvisionInfo,
     ProvisioningRequest,
     ProvisioningStatus,
+    ReverseProvisioningRequest,
     ReverseProvisioningStatus,
     Status1,
     UpdateAclRequest,
@@ -157,3 +158,29 @@ def test_updateacl_valid_descriptor():
     print(resp)
 
     assert resp.status_code == 200
+
+
+def test_request_ids_are_unique():
+    first, second = next_request_id(), next_request_id()
+
+    assert first != second
+    assert first.startswith(f"{REQUEST_ID_PREFIX}-")
+    assert second.startswith(f"{REQUEST_ID_PREFIX}-")
+
+
+def test_openapi_documents_decoded_request_bodies():
+    paths = app.openapi()["paths"]
+
+    for path, model in [
+        ("/v1/provision", ProvisioningRequest),
+        ("/v1/unprovision", ProvisioningRequest),
+        ("/v1/validate", ProvisioningRequest),
+        ("/v1/updateacl", UpdateAclRequest),
+        ("/v1/reverse-provisioning", ReverseProvisioningRequest),
+    ]:
+        request_body = paths[path]["post"]["requestBody"]
+        schema = request_body["content"]["application/json"]["schema"]
+        assert request_body["required"] is True
+        assert schema["title"] == model.__name__
+        assert set(schema["required"]) == {name for name, field in model.model_fields.items() if field.is_required()}
+        assert "$ref" not in str(schema)
@@ -0,0 +1,57 @@
+import unittest
+from pathlib import Path
+
+import yaml
+
+from src.utility.yaml_loader import fast_yaml_load, load_top_level_keys
+
+
+class TestFastYamlLoad(unittest.TestCase):
+    def test_load_matches_safe_load(self):
+        descriptor_str = Path("tests/descriptors/descriptor_output_port_valid.yaml").read_text()
+
+        self.assertEqual(fast_yaml_load(descriptor_str), yaml.safe_load(descriptor_str))
+
+    def test_load_rejects_unsafe_tags(self):
+        with self.assertRaises(yaml.YAMLError):
+            fast_yaml_load("!!python/object/apply:os.system ['echo unsafe']")
+
+    def test_load_invalid_yaml(self):
+        with self.assertRaises(yaml.YAMLError):
+            fast_yaml_load("key: [unclosed")
+
+
+class TestLoadTopLevelKeys(unittest.TestCase):
+    def test_load_only_requested_keys(self):
+        text = "dataProduct:\n  id: dp\nother:\n  - a\n  - b\ncomponentIdToProvision: cmp\n"
+
+        self.assertEqual(
+            load_top_level_keys(text, ("dataProduct", "componentIdToProvision")),
+            {"dataProduct": {"id": "dp"}, "componentIdToProvision": "cmp"},
+        )
+
+    def test_load_json_document(self):
+        text = '{"dataProduct": {"id": "dp"}, "other": [1, 2], "componentIdToProvision": "cmp"}'
+
+        self.assertEqual(load_top_level_keys(text, ("componentIdToProvision",)), {"componentIdToProvision": "cmp"})
+
+    def test_load_json_document_as_yaml(self):
+        text = '{"dataProduct": {"id": "dp", "version": 1e5, "tags": [1, "a"]}, "other": null}'
+        yaml_text = "dataProduct:\n  id: dp\n  version: 1e5\n  tags:\n    - 1\n    - a\nother: null\n"
+
+        document = load_top_level_keys(text, ("dataProduct",))
+
+        self.assertEqual(document, {"dataProduct": yaml.safe_load(text)["dataProduct"]})
+        self.assertEqual(document, load_top_level_keys(yaml_text, ("dataProduct",)))
+        # YAML 1.1 reads an exponent without a dot as a string
+        self.assertEqual(document["dataProduct"]["version"], "1e5")
+
+    def test_load_flow_mapping_that_is_not_json(self):
+        self.assertEqual(load_top_level_keys("{dataProduct: dp, other: x}", ("dataProduct",)), {"dataProduct": "dp"})
+
+    def test_load_empty_document(self):
+        self.assertEqual(load_top_level_keys("", ("dataProduct",)), {})
+
+    def test_load_document_that_is_not_a_mapping(self):
+        with self.assertRaises(TypeError):
+            load_top_level_keys("descriptor", ("dataProduct",))